@@ -2,36 +2,102 @@
 Docstring for PinScrapper
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 #from selenium.webdriver.firefox.options import Options as FirefoxOptions
 #from selenium.webdriver.edge.options import Options as EdgeOptions
 #from selenium.webdriver.safari.options import Options as SafariOptions
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from crawler import CrawlerPinterest,Crawler
+from crawler import CrawlerPinterest,CrawlerAPIPinterest,CrawlerPlaywrightPinterest,CrawlerMultiProcesso,Crawler,CrawlerAssincrono
+from crawler import MOTIVOS_LIMITE, SIMULTANEOS_API
 from parser import ParserHTMLPinterest, ParserHTML
 from downloader import Downloader
+from runtime import RuntimeHTTP
+from journal import JournalExecucao
+from cache import CacheCrawl
+from relatorio import RelatorioExecucao, ETAPA_CRAWL, ETAPA_PARSE, ETAPA_DOWNLOAD
+from rastreamento import Rastreador, span
+from navegador import cria_driver, PoolDrivers, VigiaNavegador
+from servico import ServicoPinScrapper
 from utils import configurando_logger
 from traceback import format_exc
 from utils import configurando_argparse
 from utils import lista_prompts
+from utils import id_pin
 import argparse
 import logging
 import asyncio
+from functools import partial
+from collections.abc import Callable
+from contextlib import contextmanager
 
 
 # Classes
 class PinScrapper:
 
-    def __init__(self, logger:logging.Logger, lista_prompt:list[str], driver:WebDriver, max_img:int):
+    def __init__(self, logger:logging.Logger, lista_prompt:list[str], driver:WebDriver|None, max_img:int, tamanho_fila:int=50, runtime:RuntimeHTTP|None=None,
+                 journal:JournalExecucao|None=None, encerra_driver:bool=True, relatorio:RelatorioExecucao|None=None,
+                 rastreador:Rastreador|None=None, incremental:bool=False, cache:CacheCrawl|None=None,
+                 cria_navegador:Callable[[],WebDriver]|None=None):
 
         self.logger = logger
         self.lista_prompt = lista_prompt
         self.driver = driver
         self.max_img = max_img
 
-    def principal(self, crawler:Crawler, parser:ParserHTML, downloader:Downloader):
+        #Capacidade máxima das pipelines entre as etapas no modo 'streaming'
+        self.tamanho_fila = tamanho_fila
+
+        #Runtime com o loop de eventos e a sessão HTTP compartilhados pelo parser e pelo downloader.
+        #Caso nenhum seja fornecido, o PinScrapper cria o seu e o encerra ao fim da execução.
+        self._runtime_proprio = runtime is None
+        self.runtime = runtime if runtime is not None else RuntimeHTTP(logger)
+
+        #Journal onde o progresso da execução é registrado. Opcional.
+        self.journal = journal
+
+        #Se o navegador deve ser encerrado ao fim do 'crawling'. 'False' mantém ele aberto para outras execuções.
+        self.encerra_driver = encerra_driver
+
+        #Relatório com as métricas da execução. Caso nenhum seja fornecido, o PinScrapper cria o seu.
+        self.relatorio = relatorio if relatorio is not None else RelatorioExecucao(logger)
+
+        #Rastreador que registra os 'spans' de cada operação. Opcional.
+        self.rastreador = rastreador
+
+        #Links de imagem conhecidos antes do 'parsing', tendo o id do pin como chave. O crawler guarda nele os links coletados
+        #pela rede, e o parser não requisita a página dos pins presentes nele
+        self.imgs_conhecidas = {}
+
+        #Motivo do fim do 'crawling' de cada prompt, registrado pelo crawler. Os prompts encerrados por um limite ficam com resultados parciais
+        self.motivos_crawl = {}
+
+        #Cache em disco dos resultados do crawler. Os prompts encontrados nele não passam pelo crawler. Opcional.
+        self.cache = cache
+
+        #Função que cria o navegador quando nenhum é fornecido. Ela só é chamada se algum prompt precisar do crawler, então
+        #uma execução atendida inteiramente pelo cache não abre o navegador. Opcional.
+        self.cria_navegador = cria_navegador
+
+        #Modo incremental. O crawler ignora os pins que ja foram baixados em execuções anteriores, segundo o histórico do 'journal'.
+        self.incremental = incremental
+        if self.incremental and self.journal is None:
+            raise ValueError("O modo incremental precisa de um 'journal' para consultar o histórico de pins!")
+
+    def principal(self, crawler:Crawler, parser:ParserHTML, downloader:Downloader) -> dict[str,list[str]]:
+
+        """
+        Método que executa o PinScrapper, realizando o 'crawling', o 'parsing' e o download das imagens, uma etapa após a outra.
+
+        Args:
+            crawler (Crawler): Sub-Classe da classe abstrata 'Crawler'.
+
+            parser (ParserHTML): Sub-Classe da classe abstrata 'ParserHTML'.
+
+            downloader (Downloader): Classe 'Downloader'.
+
+        Returns:
+            dict[str,list[str]]: Dicionário com os links das imagens baixadas, tendo como chave o prompt que as gerou.
+        """
         
         ### Variáveis ###
 
@@ -54,26 +120,332 @@ class PinScrapper:
 
         self.logger.debug("[PRINCIPAL] Método principal iniciado!")
 
+        #Separando os prompts que ja foram pesquisados em uma execução anterior
+        dict_lista_links_pin,lista_pendentes = self._separa_prompts()
+
         #Iniciando instancia do crawler e chamando método para conseguir os links de cada pin
-        c = crawler(self.driver,self.logger,self.lista_prompt)
         self.logger.info("\n\nPesquisando as imagens...")
         print("\n")
-        dict_lista_links_pin = c.bot_crawler(max_img=self.max_img)
+        if lista_pendentes:
+            c = self._cria_crawler(crawler,lista_pendentes)
+            with self._etapa(ETAPA_CRAWL):
+                dict_lista_links_pin.update(c.bot_crawler(max_img=self.max_img,callback_prompt=self._registra_crawl))
+        else:
+            self.logger.info("Todos os prompts ja foram pesquisados em uma execução anterior!")
+            if self.encerra_driver and self.driver is not None:
+                self.driver.quit()
+
+        #Mantendo a ordem original dos prompts
+        dict_lista_links_pin = {prompt:dict_lista_links_pin[prompt] for prompt in self.lista_prompt if prompt in dict_lista_links_pin}
+
+        try:
+            #Iniciando instancia do parser e chamando métodos assíncrono para conseguir os links de cada imagem
+            p = parser(dict_lista_links_pin,self.logger,session=self.runtime.session,journal=self.journal,relatorio=self.relatorio,rastreador=self.rastreador,
+                       imgs_conhecidas=self.imgs_conhecidas)
+            self.logger.info("\n\nIniciando coleta do link de cada imagem!")
+            print("\n")
+            with self._etapa(ETAPA_PARSE):
+                dict_lista_links_img = self.runtime.executa(p.parsing())
+
+            #Iniciando instancio do downloades e chamando método assincrono para baixar todas as imagens e salva-las no SO
+            d = downloader(self.logger, dict_lista_links_img, session=self.runtime.session, journal=self.journal, relatorio=self.relatorio, rastreador=self.rastreador)
+            self.logger.info("\n\nFazendo o downloads das imagem...")
+            print("\n")
+            with self._etapa(ETAPA_DOWNLOAD):
+                self.runtime.executa(d.downloading())
+        
+        finally:
+            if self._runtime_proprio:
+                self.runtime.encerra()
 
-        #Iniciando instancia do parser e chamando métodos assíncrono para conseguir os links de cada imagem
-        p = parser(dict_lista_links_pin,self.logger)
-        self.logger.info("\n\nIniciando coleta do link de cada imagem!")
-        print("\n")
-        dict_lista_links_img = asyncio.run(p.parsing())
+        #Finalizando programa
+        self.logger.info("\nDownload de todas as imagens finalizado! Encerrando PinScrapper...")
+        return dict_lista_links_img
+
+    def principal_streaming(self, crawler:Crawler, parser:ParserHTML, downloader:Downloader) -> dict[str,list[str]]:
+
+        """
+        Método que executa o PinScrapper no modo 'streaming'.
+
+        Diferente do método 'principal', onde cada etapa (crawling, parsing e download) só começa quando a anterior
+        termina, aqui as três etapas trabalham ao mesmo tempo. Cada link de pin sai do crawler assim que é coletado
+        e vai direto para o parser, e cada link de imagem vai direto para o downloader.
+
+        As etapas são ligadas por pipelines ('asyncio.Queue') com capacidade limitada pelo atributo 'tamanho_fila'.
+        Se uma etapa seguinte estiver mais lenta, a anterior espera, evitando acumular valores na memória.
+
+        Args:
+            crawler (Crawler): Sub-Classe da classe abstrata 'Crawler'.
+
+            parser (ParserHTML): Sub-Classe da classe abstrata 'ParserHTML' que implementa o método 'parsing_streaming'.
+
+            downloader (Downloader): Classe 'Downloader'.
+
+        Returns:
+            dict[str,list[str]]: Dicionário com os links das imagens baixadas, tendo como chave o prompt que as gerou.
+        """
+
+        ### Variáveis ###
 
-        #Iniciando instancio do downloades e chamando método assincrono para baixar todas as imagens e salva-las no SO
-        d = downloader(self.logger, dict_lista_links_img)
-        self.logger.info("\n\nFazendo o downloads das imagem...")
+        #Dicionario contendo listas de links de imagem coletados
+        dict_lista_links_img = {}
+
+        ### Código ###
+
+        self.logger.debug("[PRINCIPAL_STREAMING] Método principal no modo 'streaming' iniciado!")
+        self.logger.info("\n\nPesquisando, coletando e baixando as imagens ao mesmo tempo...")
         print("\n")
-        asyncio.run(d.downloading())
+
+        try:
+            dict_lista_links_img = self.runtime.executa(self._pipeline_streaming(crawler,parser,downloader))
+        
+        finally:
+            if self._runtime_proprio:
+                self.runtime.encerra()
 
         #Finalizando programa
         self.logger.info("\nDownload de todas as imagens finalizado! Encerrando PinScrapper...")
+        return dict_lista_links_img
+
+    async def _pipeline_streaming(self, crawler:Crawler, parser:ParserHTML, downloader:Downloader) -> dict[str,list[str]]:
+
+        """
+        Método assíncrono que monta a pipeline 'crawler -> parser -> downloader' do modo 'streaming'.
+
+        O crawler, por ser síncrono (Selenium), é executado em uma 'thread' separada atravez do 'asyncio.to_thread'.
+        Os links coletados por ele são inseridos na pipeline do parser pela função 'envia_link', que bloqueia a
+        'thread' do crawler enquanto a pipeline estiver cheia. Os crawlers assíncronos ('CrawlerAssincrono') são
+        executados no próprio loop, e esperam pela pipeline sem bloquear as outras etapas.
+
+        Args:
+            crawler (Crawler): Sub-Classe da classe abstrata 'Crawler'.
+
+            parser (ParserHTML): Sub-Classe da classe abstrata 'ParserHTML'.
+
+            downloader (Downloader): Classe 'Downloader'.
+
+        Returns:
+            dict[str,list[str]]: Dicionário com os links de imagem retirados pelo parser, tendo como chave o prompt.
+        """
+
+        ### Variáveis ###
+
+        #Loop de eventos atual, utilizado pela thread do crawler para inserir valores na pipeline
+        loop = asyncio.get_running_loop()
+
+        #Pipeline entre crawler e parser, com tuplas '(prompt, link_pin)'
+        fila_pins = asyncio.Queue(maxsize=self.tamanho_fila)
+
+        #Pipeline entre parser e downloader, com tuplas '(prompt, link_img)'
+        fila_imgs = asyncio.Queue(maxsize=self.tamanho_fila)
+
+        #Instancias das etapas
+        c = None
+        p = None
+        d = None
+
+        #Tasks do parser e do downloader
+        task_parser = None
+        task_downloader = None
+
+        #Links de pin dos prompts ja pesquisados em uma execução anterior, e prompts que ainda precisam ser pesquisados
+        dict_lista_links_pin = {}
+        lista_pendentes = []
+
+        ### Código ###
+
+        #Função chamada pela thread do crawler para cada link novo coletado
+        def envia_link(prompt:str, link:str) -> None:
+            if self.journal is not None:
+                self.journal.registra_pin(prompt,link)
+            asyncio.run_coroutine_threadsafe(fila_pins.put((prompt,link)),loop).result()
+
+        #Versão de 'envia_link' para os crawlers assíncronos, executados no próprio loop
+        async def envia_link_async(prompt:str, link:str) -> None:
+            if self.journal is not None:
+                self.journal.registra_pin(prompt,link)
+            await fila_pins.put((prompt,link))
+
+        #Iniciando instancias. Parser e downloader recebem apenas os prompts, os links chegam pelas pipelines
+        p = parser({prompt:[] for prompt in self.lista_prompt},self.logger,session=self.runtime.session,journal=self.journal,relatorio=self.relatorio,rastreador=self.rastreador,
+                       imgs_conhecidas=self.imgs_conhecidas)
+        d = downloader(self.logger,{prompt:[] for prompt in self.lista_prompt},session=self.runtime.session,journal=self.journal,relatorio=self.relatorio,rastreador=self.rastreador)
+
+        task_parser = asyncio.create_task(self._mede_etapa(ETAPA_PARSE,p.parsing_streaming(fila_pins,fila_imgs)))
+        task_downloader = asyncio.create_task(self._mede_etapa(ETAPA_DOWNLOAD,d.downloading_streaming(fila_imgs)))
+
+        try:
+            #Os links dos prompts ja pesquisados entram direto na pipeline, sem passar pelo crawler
+            dict_lista_links_pin,lista_pendentes = self._separa_prompts()
+            for prompt,lista_links in dict_lista_links_pin.items():
+                for link in lista_links:
+                    await fila_pins.put((prompt,link))
+
+            if lista_pendentes:
+                c = self._cria_crawler(crawler,lista_pendentes)
+                if isinstance(c,CrawlerAssincrono):
+                    await self._mede_etapa(ETAPA_CRAWL,c.bot_crawler_async(self.max_img,envia_link_async,self._registra_crawl))
+                else:
+                    await self._mede_etapa(ETAPA_CRAWL,asyncio.to_thread(c.bot_crawler,self.max_img,envia_link,self._registra_crawl))
+            else:
+                self.logger.info("Todos os prompts ja foram pesquisados em uma execução anterior!")
+                if self.encerra_driver and self.driver is not None:
+                    self.driver.quit()
+        
+        finally:
+            #Sinalizando o fim da produção do crawler, mesmo que ele tenha falhado, para as outras etapas encerrarem
+            self.logger.debug("[PRINCIPAL_STREAMING] Crawler finalizado! Sinalizando o fim da produção na pipeline.")
+            await fila_pins.put(None)
+            await asyncio.gather(task_parser,task_downloader)
+
+        return task_parser.result()
+
+    async def _mede_etapa(self, nome:str, corrotina):
+
+        """
+        Método auxiliar assíncrono que executa uma corrotina como uma etapa do relatório e do rastreamento.
+
+        No modo 'streaming' as etapas trabalham ao mesmo tempo, então o tempo de cada uma vai do seu início até o seu fim.
+
+        Args:
+            nome (str): Nome da etapa.
+
+            corrotina (Coroutine): Corrotina da etapa.
+
+        Returns:
+            Any: Valor retornado pela corrotina.
+        """
+
+        with self._etapa(nome):
+            return await corrotina
+
+    @contextmanager
+    def _etapa(self, nome:str):
+
+        """
+        Gerenciador de contexto auxiliar que mede uma etapa no relatório e abre o 'span' dela no rastreador.
+        Os 'spans' das operações feitas dentro da etapa ficam aninhados nele.
+
+        Args:
+            nome (str): Nome da etapa.
+        """
+
+        with self.relatorio.etapa(nome), span(self.rastreador, f"pinscrapper.{nome}"):
+            yield
+
+    def _cria_crawler(self, crawler:Crawler, lista_pendentes:list[str]) -> Crawler:
+
+        """
+        Método auxiliar que cria a instancia do crawler para os prompts que ainda precisam ser pesquisados.
+
+        No modo incremental, o crawler também recebe os ids dos pins de cada prompt que ja existem no disco, e o crawler
+        da API recebe o 'runtime' da execução. Caso nenhum navegador tenha sido fornecido, ele é criado aqui com 'cria_navegador'.
+
+        Args:
+            crawler (Crawler): Sub-Classe da classe abstrata 'Crawler'.
+
+            lista_pendentes (list[str]): Prompts que serão pesquisados.
+
+        Returns:
+            Crawler: Instancia do crawler.
+        """
+
+        ### Variáveis ###
+
+        #Argumentos opcionais do crawler
+        kwargs = {}
+
+        ### Código ###
+
+        #O crawler da API requisita as páginas pela sessão HTTP compartilhada, dentro dos limites de conexão do 'runtime'
+        if issubclass(getattr(crawler,"func",crawler),CrawlerAPIPinterest):
+            kwargs["runtime"] = self.runtime
+
+        #Criando o navegador apenas agora, quando ja se sabe que algum prompt será pesquisado
+        if self.driver is None and self.cria_navegador is not None:
+            self.driver = self.cria_navegador()
+
+        if self.incremental:
+            kwargs["pins_ignorados"] = {prompt:self.journal.pins_historico(prompt) for prompt in lista_pendentes}
+            self.logger.info(f"\nModo incremental: {sum(len(pins) for pins in kwargs['pins_ignorados'].values())} pins ja baixados serão ignorados.")
+
+        return crawler(self.driver,self.logger,lista_pendentes,encerra_driver=self.encerra_driver,relatorio=self.relatorio,rastreador=self.rastreador,
+                       imagens=self.imgs_conhecidas,motivos=self.motivos_crawl,**kwargs)
+
+    def _separa_prompts(self) -> tuple[dict[str,list[str]],list[str]]:
+
+        """
+        Método auxiliar que separa os prompts que ja foram pesquisados em uma execução anterior, segundo o 'journal'
+        ou o 'cache', dos prompts que ainda precisam passar pelo crawler.
+
+        Returns:
+            tuple[dict[str,list[str]],list[str]]: Dicionário com os links de pin dos prompts ja pesquisados, e a lista
+                                                  dos prompts que ainda precisam ser pesquisados.
+        """
+
+        ### Variáveis ###
+
+        #Links de pin dos prompts ja pesquisados
+        dict_lista_links_pin = {}
+
+        #Prompts que ainda precisam ser pesquisados
+        lista_pendentes = []
+
+        #Links de pin registrados no journal
+        lista_links = None
+
+        #Links de pin e links de imagem guardados no cache
+        resultado = None
+        dict_imagens = {}
+
+        ### Código ###
+
+        for prompt in self.lista_prompt:
+            lista_links = self.journal.links_crawled(prompt,self.max_img) if self.journal is not None else None
+            if lista_links is not None:
+                self.logger.debug(f"[PRINCIPAL] O prompt => {prompt} ja foi pesquisado em uma execução anterior! Utilizando os {len(lista_links)} links do journal.")
+                dict_lista_links_pin[prompt] = lista_links
+                continue
+
+            #No modo incremental os resultados dependem do histórico de cada execução, então o cache não é usado
+            resultado = self.cache.consulta(prompt,self.max_img) if self.cache is not None and not self.incremental else None
+            if resultado is not None:
+                lista_links,dict_imagens = resultado
+                self.logger.info(f"\nO prompt => {prompt} foi pesquisado recentemente! Utilizando os {len(lista_links)} links do cache.")
+                self.imgs_conhecidas.update(dict_imagens)
+                dict_lista_links_pin[prompt] = lista_links
+                if self.journal is not None:
+                    self.journal.registra_crawl(prompt,lista_links,self.max_img)
+            else:
+                lista_pendentes.append(prompt)
+
+        return dict_lista_links_pin,lista_pendentes
+
+    def _registra_crawl(self, prompt:str, lista_links:list[str]) -> None:
+
+        """
+        Método auxiliar chamado pelo crawler ao fim do 'crawling' de cada prompt, registrando os links no 'journal' e no 'cache'.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            lista_links (list[str]): Links de pin coletados.
+        """
+
+        ### Variáveis ###
+
+        #Quantidade de imagens atendida pelo resultado. Um resultado parcial (prompt encerrado por um limite) não pode atender
+        #pesquisas com mais imagens do que ele tem, então o prompt é pesquisado de novo na retomada ('--resume') ou no 'cache'
+        max_img = len(lista_links) if self.motivos_crawl.get(prompt) in MOTIVOS_LIMITE else self.max_img
+
+        ### Código ###
+
+        if self.journal is not None:
+            self.journal.registra_crawl(prompt,lista_links,max_img)
+
+        if self.cache is not None and not self.incremental:
+            self.cache.registra(prompt,lista_links,max_img,
+                                {id_pin(link):self.imgs_conhecidas[id_pin(link)] for link in lista_links if id_pin(link) in self.imgs_conhecidas})
 
 
 #Função Main
@@ -100,17 +472,32 @@ def main():
     #Classe Downloader
     downloader = None
 
-    #Instancia da classe Options do módulo selenium.webdriver.chrome
-    options = None
-
     #Quantidade de imagens
     img_quant = 10
 
     #Lista contendo os prompts passados pelo usuário
     lista_prompt = []
 
-    #Driver utilizado pelo 'Crawler'
-    driver = None
+    #Função que cria o driver utilizado pelo 'Crawler', chamada apenas se algum prompt precisar ser pesquisado
+    cria_navegador = None
+
+    #Runtime com o loop de eventos e a sessão HTTP compartilhados
+    runtime = None
+
+    #Journal onde o progresso da execução é registrado
+    journal = None
+
+    #Instancia do serviço do PinScrapper
+    servico = None
+
+    #Pool de navegadores, caso o modo '--drivers' esteja ativado
+    pool = None
+
+    #Cache dos resultados do crawler, desativado com '--cache_ttl 0'
+    cache = None
+
+    #Limites de cada prompt passados aos crawlers
+    limites = {}
 
     ### Código ###
 
@@ -129,14 +516,84 @@ def main():
         logger = configurando_logger(debug_mode=True)
     else:
         logger = configurando_logger()
+
+    #Modos de 'crawling'. Cada um cria o próprio crawler, então apenas um deles pode ser usado por execução
+    modos = [nome for nome,ativo in (("--workers",args.workers > 1),("--drivers",args.drivers > 1),("--api",args.api),("--playwright",args.playwright))
+             if ativo]
+    if len(modos) > 1:
+        argumentparser.error(f"Os argumentos {', '.join(modos)} não podem ser usados juntos!")
+
+    #As abas são usadas apenas pelo navegador padrão e pelas páginas do Playwright
+    if args.abas > 1 and (args.workers > 1 or args.drivers > 1 or args.api):
+        argumentparser.error("O argumento '--abas' não pode ser usado junto com '--workers', '--drivers' ou '--api'!")
+
+    #O vigia acompanha apenas o navegador do Selenium pesquisando um prompt de cada vez (o pool ja troca os navegadores que param de responder)
+    if args.vigia and (args.abas > 1 or args.drivers > 1 or args.api or args.playwright):
+        argumentparser.error("O argumento '--vigia' não pode ser usado junto com '--abas', '--drivers', '--api' ou '--playwright'!")
+
+    #Limites de cada prompt, usados por todos os crawlers. O valor 0 desativa o limite
+    limites = {"prazo_prompt":args.prazo_prompt or None, "max_rolamentos":args.max_rolamentos or None, "max_estagnacao":args.estagnacao or None}
+
+    #Um Chrome ja aberto tem apenas uma aba usada pelo crawler, então ele não pode ser dividido entre vários navegadores,
+    #e o Playwright sempre inicia o próprio navegador
+    if args.chrome_remoto and (args.workers > 1 or args.drivers > 1 or args.playwright):
+        argumentparser.error("O argumento '--chrome_remoto' não pode ser usado junto com '--workers', '--drivers' ou '--playwright'!")
+
+    #Vigia da saúde do navegador, trocando um navegador degradado por um novo no meio do prompt. Com '--chrome_remoto' o navegador
+    #é reconectado ao mesmo Chrome, e apenas a resposta dele é verificada, ja que a memória de um Chrome ja aberto não é medida
+    vigia = VigiaNavegador(logger,args.monitor,log_rede=args.rede,limite_rss=args.limite_rss or None,endereco_depuracao=args.chrome_remoto) if args.vigia else None
+
+    #Tempo máximo de espera por pins novos depois de cada rolamento, e quantidade de abas pesquisando ao mesmo tempo
+    crawler = partial(CrawlerPinterest,prazo_rolamento=args.prazo_rolamento,abas=args.abas,coleta_rede=args.rede,imagens_grade=args.grade,poda=args.podar,
+                      vigia=vigia,**limites)
+
+    #Modo com vários navegadores, dividindo os prompts entre processos
+    if args.workers > 1:
+        crawler = partial(CrawlerMultiProcesso,n_workers=args.workers,debug=args.debug,monitor=args.monitor,prazo_rolamento=args.prazo_rolamento,
+                          coleta_rede=args.rede,imagens_grade=args.grade,poda=args.podar,vigia=vigia,**limites)
+
+    #Modo API. Os prompts são pesquisados pela API JSON do Pinterest, sem o navegador, que fica apenas como reserva.
+    #Sem limite de conexões por site ('--conexoes_host 0'), a quantidade de prompts paginados ao mesmo tempo fica no padrão
+    if args.api:
+        crawler = partial(CrawlerAPIPinterest,simultaneos=args.conexoes_host or SIMULTANEOS_API,monitor=args.monitor,coleta_rede=args.rede,
+                          endereco_depuracao=args.chrome_remoto,**limites)
+
+    #Modo Playwright. O crawler assíncrono inicia o próprio navegador, e pesquisa 'abas' prompts ao mesmo tempo no loop de eventos
+    if args.playwright:
+        crawler = partial(CrawlerPlaywrightPinterest,prazo_rolamento=args.prazo_rolamento,paginas=args.abas,monitor=args.monitor,imagens_grade=args.grade,poda=args.podar,**limites)
     
-    #Modo monitor
-    if not args.monitor:
-        options = ChromeOptions()
-        options.add_argument("--headless")
-        driver = webdriver.Chrome(options=options)
-    else:
-        driver = webdriver.Chrome()
+    #Cache dos resultados do crawler. Com '--refresh' os prompts são pesquisados de novo, e o cache é atualizado
+    if args.cache_ttl > 0:
+        cache = CacheCrawl(logger,args.cache,ttl=args.cache_ttl,max_entradas=args.cache_max,atualizar=args.refresh)
+
+    #Modo serviço. O navegador e as conexões ficam abertos, aguardando 'jobs' pela API. Nos modos API e Playwright o navegador
+    #do Selenium não é criado, como fora do modo serviço
+    if args.servico:
+        servico = ServicoPinScrapper(logger,PinScrapper,crawler,parserhtml,downloader,monitor=args.monitor,streaming=args.stream,
+                                     limite_conexoes=args.conexoes,limite_por_host=args.conexoes_host,log_rede=args.rede,cache=cache,
+                                     endereco_depuracao=args.chrome_remoto,usa_driver=not args.api and not args.playwright)
+        try:
+            servico.executa(host=args.host,porta=args.porta,socket=args.socket)
+        finally:
+            if cache is not None:
+                cache.fecha()
+        return
+
+    #Sem o modo serviço, o arquivo de prompts é obrigatório
+    if not args.prompts:
+        argumentparser.error("O argumento 'prompts' é obrigatório fora do modo '--servico'!")
+
+    #Modo monitor, e log de rede para o modo '--rede'. No modo API, o navegador só é criado se a API falhar
+    #Com '--chrome_remoto' o crawler se conecta a um Chrome ja aberto, que continua aberto depois da execução
+    #O navegador só é criado pelo PinScrapper quando algum prompt não foi encontrado no cache
+    cria_navegador = partial(cria_driver,args.monitor,log_rede=args.rede,endereco_depuracao=args.chrome_remoto) if not args.api and not args.playwright else None
+
+    #Pool de navegadores no mesmo processo, pesquisando vários prompts ao mesmo tempo. Os navegadores são criados pelo próprio pool,
+    #conforme os prompts são pesquisados
+    if args.drivers > 1:
+        cria_navegador = None
+        pool = PoolDrivers(logger,args.drivers,monitor=args.monitor,log_rede=args.rede,endereco_depuracao=args.chrome_remoto)
+        crawler = partial(CrawlerPinterest,prazo_rolamento=args.prazo_rolamento,pool=pool,coleta_rede=args.rede,imagens_grade=args.grade,poda=args.podar,**limites)
 
     #Quantidade de imagens
     if not args.img_q:
@@ -152,16 +609,39 @@ def main():
     #return
 
     
+    runtime = RuntimeHTTP(logger,limite_conexoes=args.conexoes,limite_por_host=args.conexoes_host)
+    journal = JournalExecucao(logger,args.journal,retomar=args.resume,incremental=args.incremental)
+    relatorio = RelatorioExecucao(logger)
+    rastreador = Rastreador(logger) if args.trace else None
+
     try:
-        pinscrapper = PinScrapper(logger,lista_prompt,driver,img_quant)
-        pinscrapper.principal(crawler,parserhtml,downloader)
+        pinscrapper = PinScrapper(logger,lista_prompt,None,img_quant,tamanho_fila=args.fila,runtime=runtime,journal=journal,relatorio=relatorio,
+                                  rastreador=rastreador,incremental=args.incremental,cache=cache,cria_navegador=cria_navegador)
+        if args.stream:
+            pinscrapper.principal_streaming(crawler,parserhtml,downloader)
+        else:
+            pinscrapper.principal(crawler,parserhtml,downloader)
     
     except KeyboardInterrupt as error:
         logger.info("\nInterrupção do teclado detectada! Encerrando o programa....")
+        logger.info("O progresso foi salvo! Execute novamente com a opção '--resume' para continuar de onde parou.")
     
     except Exception as error:
         logger.info("Uma exceção ocorreu! Verifique o log dela no arquivo 'Error.log'")
         logger.error(f"Erro!\nExceção =>{error}\nTraceback => {format_exc()}")
+    
+    finally:
+        if pool is not None:
+            pool.encerra()
+        runtime.encerra()
+        journal.fecha()
+        if cache is not None:
+            cache.fecha()
+        relatorio.salva(args.relatorio)
+        logger.info(f"\nRelatório da execução salvo em => {args.relatorio}")
+        if rastreador is not None:
+            rastreador.exporta(args.trace)
+            logger.info(f"Spans da execução salvos em => {args.trace}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,469 @@
+"""
+Script de benchmark do PinScrapper, executado contra um Pinterest falso e local.
+
+Este módulo fornece a classe `PinterestFalso`, um servidor HTTP local que imita as partes do Pinterest
+utilizadas pela aplicação:
+
+    - Páginas de pesquisa ('/search/pins/?q=...') com pins dentro de divs 'pinWrapper', que carregam
+      mais pins conforme a página é rolada, até o total configurado por prompt.
+    - A API JSON de pesquisa ('/resource/BaseSearchResource/get/'), que entrega os mesmos pins em páginas de
+      'lote' pins, com o link da imagem de cada um e o marcador ('bookmark') da próxima página.
+    - Páginas de pin ('/pin/{id}/') com o div 'pin-closeup-image' contendo o link da imagem.
+    - Um "CDN" de imagens ('/img/{id}.jpg' e '/736x/{id}.jpg', usado pelos cards da grade) com tamanho e latência configuráveis.
+
+O benchmark executa o 'CrawlerPinterest' (ou o 'CrawlerAPIPinterest', com '--api'), o 'ParserHTMLPinterest' e o 'Downloader' reais contra esse servidor,
+e mostra as taxas de pins/s, páginas/s e imagens/s, junto com o pico de memória (RSS). Dessa forma é possível
+medir se uma mudança deixou a aplicação mais rápida, sem o ruído e os limites de requisição do site real.
+
+Dependências:
+    - aiohttp
+    - selenium
+    - PinScrapper.py, crawler.py, parser.py, downloader.py, navegador.py, runtime.py, relatorio.py
+      (módulos internos desta aplicação)
+
+Exemplo:
+    python bench.py --prompts 3 --img_q 50 --latencia 0.05 --stream
+
+Notas:
+    As imagens baixadas são salvas em um diretório temporário, que é apagado no fim do benchmark.
+"""
+
+from aiohttp import web
+from functools import partial
+from string import Template
+from traceback import format_exc
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import zlib
+
+from PinScrapper import PinScrapper
+from crawler import CrawlerPinterest, CrawlerAPIPinterest, RECURSO_PESQUISA, FIM_BOOKMARK
+from parser import ParserHTMLPinterest
+from downloader import Downloader
+from navegador import cria_driver
+from runtime import RuntimeHTTP
+from relatorio import RelatorioExecucao, ETAPA_CRAWL, ETAPA_PARSE, ETAPA_DOWNLOAD
+from utils import configurando_logger
+
+#O módulo 'resource' só existe em sistemas Unix. Sem ele, o pico de memória não é medido.
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+#Página de pesquisa falsa. Os pins seguintes são adicionados pelo 'script' conforme a página é rolada.
+PAGINA_PESQUISA = Template("""<html>
+<head><style>div[data-test-id="pinWrapper"] { height: 300px; }</style></head>
+<body>
+<div id="feed">$pins</div>
+<script>
+let n = $carregados;
+let carregando = false;
+window.addEventListener("scroll", function () {
+    if (carregando || n >= $total) return;
+    if (window.innerHeight + window.pageYOffset < document.body.scrollHeight - 400) return;
+    carregando = true;
+    setTimeout(function () {
+        const feed = document.getElementById("feed");
+        for (let i = 0; i < $lote && n < $total; i++, n++) {
+            const id = $semente + n;
+            feed.insertAdjacentHTML("beforeend", '<div data-test-id="pinWrapper"><a href="$url/pin/' + id + '/"><img src="$url/236x/' + id +
+                                                 '.jpg" srcset="$url/236x/' + id + '.jpg 1x, $url/736x/' + id + '.jpg 3x"></a></div>');
+        }
+        carregando = false;
+    }, $atraso);
+});
+</script>
+</body>
+</html>""")
+
+#Pin da página de pesquisa, com a miniatura e a imagem grande no 'srcset', como nos cards do Pinterest
+PIN = Template("""<div data-test-id="pinWrapper"><a href="$url/pin/$id/"><img src="$url/236x/$id.jpg" srcset="$url/236x/$id.jpg 1x, $url/736x/$id.jpg 3x"></a></div>""")
+
+#Página de pin falsa
+PAGINA_PIN = Template("""<html><body>
+<div data-test-id="pin-closeup-image"><img src="$url/img/$id.jpg"></div>
+</body></html>""")
+
+
+# Classes
+
+class PinterestFalso:
+
+    """
+    Classe que implementa um servidor HTTP local imitando o Pinterest, executado em uma 'thread' própria.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        pins_por_prompt (int): Quantidade total de pins de cada pesquisa.
+
+        lote (int): Quantidade de pins carregados de cada vez na página de pesquisa.
+
+        atraso_rolamento (int): Tempo, em milissegundos, que a página de pesquisa leva para carregar mais pins.
+
+        tamanho_min (int): Tamanho mínimo das imagens, em bytes.
+
+        tamanho_max (int): Tamanho máximo das imagens, em bytes.
+
+        latencia (float): Tempo, em segundos, que o "CDN" leva para responder cada imagem.
+
+        contadores (dict[str,int]): Quantidade de pesquisas, páginas da API, páginas de pin, imagens e bytes servidos.
+
+        url (str | None): Endereço do servidor, disponível depois do método 'inicia'.
+    """
+
+    def __init__(self, logger:logging.Logger, pins_por_prompt:int=100, lote:int=25, atraso_rolamento:int=200,
+                 tamanho_min:int=50_000, tamanho_max:int=200_000, latencia:float=0.0):
+
+        self.logger = logger
+        self.pins_por_prompt = pins_por_prompt
+        self.lote = lote
+        self.atraso_rolamento = atraso_rolamento
+        self.tamanho_min = tamanho_min
+        self.tamanho_max = tamanho_max
+        self.latencia = latencia
+
+        self.contadores = {"pesquisas":0, "api":0, "paginas":0, "imagens":0, "bytes":0}
+        self.url = None
+
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+        #Bytes de onde todas as imagens são recortadas, começando com o cabeçalho de um JPEG
+        self._bytes_img = b"\xff\xd8\xff\xe0" + os.urandom(max(tamanho_max,4))
+
+        if tamanho_min > tamanho_max:
+            raise ValueError("O valor de 'tamanho_min' não pode ser maior que o de 'tamanho_max'!")
+
+    def inicia(self, host:str="127.0.0.1", porta:int=0) -> str:
+
+        """
+        Método que inicia o servidor em uma 'thread' separada.
+
+        Args:
+            host (str): Endereço do servidor.
+
+            porta (int): Porta do servidor. Com o valor '0', uma porta livre é escolhida.
+
+        Returns:
+            str: Endereço do servidor.
+        """
+
+        ### Variáveis ###
+
+        #Evento que sinaliza que o servidor ja esta aceitando conexões
+        pronto = threading.Event()
+
+        ### Código ###
+
+        def executa():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._inicia_site(host,porta))
+            pronto.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=executa, name="PINTEREST-FALSO", daemon=True)
+        self._thread.start()
+        pronto.wait()
+
+        self.logger.debug(f"[PINTEREST-FALSO] Servidor iniciado => {self.url}")
+        return self.url
+
+    def encerra(self) -> None:
+
+        """
+        Método que encerra o servidor e a sua 'thread'.
+        """
+
+        if self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(),self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    async def _inicia_site(self, host:str, porta:int) -> None:
+
+        """
+        Método auxiliar assíncrono que cria a aplicação 'aiohttp' e começa a aceitar conexões.
+        """
+
+        ### Variáveis ###
+
+        #Aplicação com as rotas do servidor
+        app = web.Application()
+
+        ### Código ###
+
+        app.router.add_get("/search/pins/", self._pesquisa)
+        app.router.add_get(RECURSO_PESQUISA, self._api_pesquisa)
+        app.router.add_get("/pin/{id}/", self._pin)
+        app.router.add_get("/img/{id}.jpg", self._imagem)
+        app.router.add_get("/736x/{id}.jpg", self._imagem)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, porta).start()
+
+        host,porta = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{porta}"
+
+    def _semente(self, prompt:str) -> int:
+
+        """
+        Método auxiliar que retorna o primeiro id de pin de um prompt. Cada prompt tem os seus próprios pins.
+        """
+
+        return (zlib.crc32(prompt.encode()) % 100_000) * 1_000_000
+
+    async def _pesquisa(self, request:web.Request) -> web.Response:
+
+        ### Variáveis ###
+
+        #Prompt pesquisado e primeiro id de pin dele
+        prompt = request.query.get("q","")
+        semente = self._semente(prompt)
+
+        #Quantidade de pins que ja vem na página
+        carregados = min(self.lote,self.pins_por_prompt)
+
+        ### Código ###
+
+        self.contadores["pesquisas"] += 1
+        pins = "".join(PIN.substitute(url=self.url, id=semente+n) for n in range(carregados))
+        return web.Response(text=PAGINA_PESQUISA.substitute(pins=pins, carregados=carregados, total=self.pins_por_prompt, lote=self.lote,
+                                                            url=self.url, semente=semente, atraso=self.atraso_rolamento),
+                            content_type="text/html")
+
+    async def _api_pesquisa(self, request:web.Request) -> web.Response:
+
+        ### Variáveis ###
+
+        #Opções da pesquisa enviadas pelo crawler
+        dict_opcoes = json.loads(request.query.get("data","{}")).get("options",{})
+
+        #Primeiro id de pin do prompt, e posição da página pedida, que é o próprio 'bookmark'
+        semente = self._semente(dict_opcoes.get("query",""))
+        inicio = int((dict_opcoes.get("bookmarks") or ["0"])[0])
+
+        #Posição da próxima página
+        fim = min(inicio+self.lote,self.pins_por_prompt)
+
+        ### Código ###
+
+        self.contadores["api"] += 1
+        return web.json_response({"resource_response":{
+            "data":{"results":[{"id":str(semente+n),"type":"pin","images":{"736x":{"url":f"{self.url}/img/{semente+n}.jpg"}}}
+                               for n in range(inicio,fim)]},
+            "bookmark":str(fim) if fim < self.pins_por_prompt else FIM_BOOKMARK}})
+
+    async def _pin(self, request:web.Request) -> web.Response:
+
+        self.contadores["paginas"] += 1
+        return web.Response(text=PAGINA_PIN.substitute(url=self.url, id=request.match_info["id"]), content_type="text/html")
+
+    async def _imagem(self, request:web.Request) -> web.Response:
+
+        ### Variáveis ###
+
+        #Tamanho da imagem, sempre o mesmo para um mesmo id
+        tamanho = random.Random(request.match_info["id"]).randint(self.tamanho_min,self.tamanho_max)
+
+        ### Código ###
+
+        if self.latencia:
+            await asyncio.sleep(self.latencia)
+
+        self.contadores["imagens"] += 1
+        self.contadores["bytes"] += tamanho
+        return web.Response(body=self._bytes_img[:tamanho], content_type="image/jpeg")
+
+
+# Funções
+
+def pico_memoria() -> dict[str,float|None]:
+
+    """
+    Função que retorna o pico de memória (RSS), em MB, do processo atual e dos processos filhos ja encerrados
+    (ex: o 'chromedriver' e o Chrome, depois do 'driver.quit()').
+
+    Returns:
+        dict[str,float|None]: Pico de memória do processo e dos filhos, ou 'None' caso o SO não tenha o módulo 'resource'.
+    """
+
+    ### Variáveis ###
+
+    #Divisor para converter o 'ru_maxrss' em MB. No macOS o valor vem em bytes, no Linux em KB.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+    ### Código ###
+
+    if resource is None:
+        return {"processo":None, "filhos":None}
+
+    return {"processo":round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/divisor,1),
+            "filhos":round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss/divisor,1)}
+
+
+def configurando_argparse_bench() -> argparse.ArgumentParser:
+
+    ### Variáveis ###
+
+    #Instancia do ArgumentParser
+    parser = None
+
+    ### Código ###
+
+    parser = argparse.ArgumentParser(description="Benchmark do PinScrapper contra um Pinterest falso e local.")
+    parser.add_argument("--prompts", type=int, default=3, help="Quantidade de prompts pesquisados.")
+    parser.add_argument("--img_q", type=int, default=50, help="Quantidade de imagens coletadas de cada prompt.")
+    parser.add_argument("--pins", type=int, default=200, help="Quantidade total de pins de cada pesquisa no servidor falso.")
+    parser.add_argument("--lote", type=int, default=25, help="Quantidade de pins carregados de cada vez na página de pesquisa.")
+    parser.add_argument("--atraso_rolamento", type=int, default=200, help="Tempo, em milissegundos, para a página de pesquisa carregar mais pins.")
+    parser.add_argument("--prazo_rolamento", type=float, default=4.0, help="Tempo máximo, em segundos, que o crawler espera por pins novos depois de cada rolamento.")
+    parser.add_argument("--tamanho_min", type=int, default=50, help="Tamanho mínimo das imagens, em KB.")
+    parser.add_argument("--tamanho_max", type=int, default=200, help="Tamanho máximo das imagens, em KB.")
+    parser.add_argument("--latencia", type=float, default=0.0, help="Latência, em segundos, de cada imagem do servidor falso.")
+    parser.add_argument("--stream", action="store_true", help="Executa o PinScrapper no modo 'streaming'.")
+    parser.add_argument("--grade", action="store_true", help="Tira o link das imagens da própria grade de pesquisa, sem a página de cada pin.")
+    parser.add_argument("--podar", action="store_true", help="Esvazia os cards ja coletados da página de pesquisa durante o 'crawling'.")
+    parser.add_argument("--api", action="store_true", help="Usa o 'CrawlerAPIPinterest', que pesquisa pela API JSON, sem o navegador.")
+    parser.add_argument("--monitor", action="store_true", help="Deixa o navegador visível durante o benchmark.")
+    parser.add_argument("--debug", action="store_true", help="Ativa os logs de depuração.")
+    parser.add_argument("--saida", type=str, default=None, help="Arquivo JSON onde o resultado do benchmark é salvo.")
+
+    return parser
+
+
+def executa_bench(args:argparse.Namespace, logger:logging.Logger) -> dict:
+
+    """
+    Função que executa o benchmark e retorna as taxas medidas.
+
+    Args:
+        args (argparse.Namespace): Argumentos do benchmark.
+
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+    Returns:
+        dict: Resultado do benchmark, com as taxas, o pico de memória e o relatório completo da execução.
+    """
+
+    ### Variáveis ###
+
+    #Servidor falso
+    servidor = PinterestFalso(logger, pins_por_prompt=args.pins, lote=args.lote, atraso_rolamento=args.atraso_rolamento,
+                              tamanho_min=args.tamanho_min*1000, tamanho_max=args.tamanho_max*1000, latencia=args.latencia)
+
+    #Relatório da execução
+    relatorio = RelatorioExecucao(logger)
+
+    #Diretório de trabalho original
+    diretorio = os.getcwd()
+
+    #Prompts do benchmark
+    lista_prompt = [f"bench {n}" for n in range(1,args.prompts+1)]
+
+    #Tempo total e relatório final
+    inicio = 0.0
+    duracao = 0.0
+    dados = {}
+
+    ### Código ###
+
+    servidor.inicia()
+    try:
+        with tempfile.TemporaryDirectory(prefix="pinscrapper_bench_") as tmp, RuntimeHTTP(logger) as runtime:
+            os.chdir(tmp)
+            try:
+                if args.api:
+                    pinscrapper = PinScrapper(logger, lista_prompt, None, args.img_q, runtime=runtime, relatorio=relatorio)
+                    crawler = partial(CrawlerAPIPinterest, url_base=servidor.url)
+                else:
+                    pinscrapper = PinScrapper(logger, lista_prompt, cria_driver(args.monitor), args.img_q, runtime=runtime, relatorio=relatorio)
+                    crawler = partial(CrawlerPinterest, url_base=servidor.url, prazo_rolamento=args.prazo_rolamento, imagens_grade=args.grade,
+                                      poda=args.podar)
+
+                inicio = time.perf_counter()
+                if args.stream:
+                    pinscrapper.principal_streaming(crawler, ParserHTMLPinterest, Downloader)
+                else:
+                    pinscrapper.principal(crawler, ParserHTMLPinterest, Downloader)
+                duracao = time.perf_counter() - inicio
+
+            finally:
+                os.chdir(diretorio)
+    finally:
+        servidor.encerra()
+
+    dados = relatorio.para_dict()
+
+    def taxa(quantidade:int, etapa:str) -> float:
+        tempo = dados["etapas"].get(etapa) or duracao
+        return round(quantidade/tempo,3) if tempo else 0.0
+
+    return {"modo":"streaming" if args.stream else "etapas",
+            "crawler":"api" if args.api else "navegador",
+            "duracao":round(duracao,3),
+            "pins":sum(metricas["pins"] for metricas in dados["prompts"].values()),
+            "pins_por_segundo":taxa(sum(metricas["pins"] for metricas in dados["prompts"].values()),ETAPA_CRAWL),
+            "paginas_por_segundo":taxa(servidor.contadores["paginas"],ETAPA_PARSE),
+            "imagens_por_segundo":taxa(dados["download"]["imagens"],ETAPA_DOWNLOAD),
+            "mb_por_segundo":dados["download"]["mb_por_segundo"],
+            "rss_pico_mb":pico_memoria(),
+            "servidor":dict(servidor.contadores),
+            "relatorio":dados}
+
+
+def main():
+
+    ### Variáveis ###
+
+    #Argumentos da linha de comando
+    args = None
+
+    #Instancia do 'Logger'
+    logger = None
+
+    #Resultado do benchmark
+    resultado = {}
+
+    ### Código ###
+
+    args = configurando_argparse_bench().parse_args()
+    logger = configurando_logger(debug_mode=args.debug)
+
+    try:
+        resultado = executa_bench(args, logger)
+
+    except KeyboardInterrupt as error:
+        logger.info("\nInterrupção do teclado detectada! Encerrando o benchmark....")
+        return
+
+    except Exception as error:
+        logger.info("Uma exceção ocorreu! Verifique o log dela no arquivo 'Error.log'")
+        logger.error(f"Erro!\nExceção =>{error}\nTraceback => {format_exc()}")
+        return
+
+    print(json.dumps({chave:valor for chave,valor in resultado.items() if chave != "relatorio"}, ensure_ascii=False, indent=4))
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, ensure_ascii=False, indent=4)
+
+
+if __name__ == "__main__":
+    main()
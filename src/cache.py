@@ -0,0 +1,203 @@
+"""
+Módulo responsável por disponibilizar o 'cache' em disco dos resultados do crawler.
+
+Este módulo fornece a classe `CacheCrawl`, que guarda em um banco SQLite (no modo WAL) os links de pin coletados
+de cada prompt, junto com os links de imagem ja conhecidos desses pins. Uma nova pesquisa do mesmo prompt, dentro
+do prazo de validade ('ttl'), usa os links guardados no lugar de abrir o navegador de novo.
+
+Os prompts são normalizados antes de serem usados como chave ('Gato ', 'gato' e 'GATO' são o mesmo prompt), e uma
+entrada também atende pesquisas com uma quantidade menor de imagens. A quantidade de entradas é limitada, e as menos
+usadas recentemente são descartadas primeiro.
+
+Dependências:
+    - sqlite3 (biblioteca padrão)
+
+Exemplo:
+    from cache import CacheCrawl
+
+    cache = CacheCrawl(logger, "pinscrapper_cache.db", ttl=3600)
+    cache.registra("Gato", lista_links, max_img=20)
+    lista_links, dict_imagens = cache.consulta("gato", max_img=10)
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+
+#Prazo de validade padrão, em segundos, de cada entrada do 'cache'
+TTL_PADRAO = 3600
+
+#Quantidade máxima padrão de entradas do 'cache'
+MAX_ENTRADAS = 1000
+
+
+def normaliza_prompt(prompt:str) -> str:
+
+    """
+    Função que normaliza um prompt para ser usado como chave do 'cache', ignorando maiúsculas e espaços repetidos.
+
+    Args:
+        prompt (str): Prompt pesquisado.
+
+    Returns:
+        str: Prompt normalizado (ex: '  Bolo  de Cenoura ' => 'bolo de cenoura').
+    """
+
+    return " ".join(prompt.split()).casefold()
+
+
+# Classes
+
+class CacheCrawl:
+
+    """
+    Classe que implementa o 'cache' em disco dos resultados do crawler.
+
+    Todas as operações são protegidas por um 'threading.Lock', ja que o crawler pode registrar os prompts a partir
+    de outras 'threads' (ex: modo 'streaming' e pool de navegadores).
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        caminho (str): Caminho do arquivo SQLite do 'cache'.
+
+        ttl (float): Prazo de validade, em segundos, de cada entrada.
+
+        max_entradas (int): Quantidade máxima de entradas. As menos usadas recentemente são descartadas primeiro.
+
+        atualizar (bool): Se 'True', as consultas sempre falham, então todos os prompts são pesquisados de novo e as
+                          entradas são substituídas pelos resultados novos.
+
+        _conexao (sqlite3.Connection): Conexão com o banco. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _lock (threading.Lock): Lock que serializa o acesso a conexão. O atributo é encapsulado e não deve ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger, caminho:str="pinscrapper_cache.db", ttl:float=TTL_PADRAO, max_entradas:int=MAX_ENTRADAS,
+                 atualizar:bool=False):
+
+        self.logger = logger
+        self.caminho = caminho
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.atualizar = atualizar
+        self._lock = threading.Lock()
+
+        if max_entradas < 1:
+            raise ValueError("O valor do argumento 'max_entradas' deve ser maior que zero!")
+
+        self.logger.debug(f"[CACHE] Abrindo cache => {caminho} - Validade => {ttl}s - Atualizar => {atualizar}")
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conexao:
+            self._conexao.execute("""CREATE TABLE IF NOT EXISTS crawl (
+                                        prompt TEXT PRIMARY KEY,
+                                        max_img INTEGER NOT NULL,
+                                        links TEXT NOT NULL,
+                                        imagens TEXT NOT NULL,
+                                        criado REAL NOT NULL,
+                                        acessado REAL NOT NULL)""")
+            self._conexao.execute("DELETE FROM crawl WHERE criado < ?", (time.time() - self.ttl,))
+
+    def consulta(self, prompt:str, max_img:int) -> tuple[list[str],dict[str,str]] | None:
+
+        """
+        Método que consulta os links de pin guardados de um prompt.
+
+        Uma entrada atende a consulta caso ainda esteja no prazo de validade e tenha sido pesquisada com pelo menos
+        'max_img' imagens, ou caso a pesquisa dela tenha chegado ao fim da página antes disso.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Quantidade de imagens pedida.
+
+        Returns:
+            tuple[list[str],dict[str,str]] | None: Os primeiros 'max_img' links de pin, e os links de imagem conhecidos desses pins,
+                                                   tendo o id do pin como chave. 'None' caso o prompt precise ser pesquisado.
+        """
+
+        ### Variáveis ###
+
+        #Linha do prompt no banco
+        linha = None
+
+        #Links de pin e links de imagem guardados
+        lista_links = []
+        dict_imagens = {}
+
+        ### Código ###
+
+        if self.atualizar:
+            return None
+
+        with self._lock, self._conexao:
+            linha = self._conexao.execute("SELECT max_img, links, imagens FROM crawl WHERE prompt = ? AND criado >= ?",
+                                          (normaliza_prompt(prompt), time.time() - self.ttl)).fetchone()
+            if linha is None:
+                return None
+
+            lista_links = json.loads(linha[1])
+            if linha[0] < max_img and len(lista_links) >= linha[0]:
+                return None
+
+            self._conexao.execute("UPDATE crawl SET acessado = ? WHERE prompt = ?", (time.time(), normaliza_prompt(prompt)))
+
+        lista_links = lista_links[0:max_img]
+        dict_imagens = json.loads(linha[2])
+        self.logger.debug(f"[CACHE] {len(lista_links)} links do prompt => {prompt} encontrados no cache.")
+        return lista_links, dict_imagens
+
+    def registra(self, prompt:str, lista_links:list[str], max_img:int, dict_imagens:dict[str,str]|None=None) -> None:
+
+        """
+        Método que guarda os links de pin coletados de um prompt, descartando as entradas menos usadas caso o 'cache' esteja cheio.
+
+        Uma entrada ainda válida só é substituída por uma pesquisa com a mesma quantidade de imagens ou mais, a não ser no
+        modo 'atualizar'. Resultados vazios não são guardados, ja que podem ser uma falha temporária do site.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            lista_links (list[str]): Links de pin coletados.
+
+            max_img (int): Quantidade de imagens pedida na pesquisa.
+
+            dict_imagens (dict[str,str] | None): Links de imagem ja conhecidos dos pins, tendo o id do pin como chave.
+        """
+
+        ### Variáveis ###
+
+        #Momento do registro
+        agora = time.time()
+
+        ### Código ###
+
+        if not lista_links:
+            return
+
+        with self._lock, self._conexao:
+            self._conexao.execute("""INSERT INTO crawl (prompt, max_img, links, imagens, criado, acessado) VALUES (?, ?, ?, ?, ?, ?)
+                                     ON CONFLICT (prompt) DO UPDATE SET max_img = excluded.max_img, links = excluded.links,
+                                         imagens = excluded.imagens, criado = excluded.criado, acessado = excluded.acessado
+                                     WHERE ? OR excluded.max_img >= crawl.max_img OR crawl.criado < ?""",
+                                  (normaliza_prompt(prompt), max_img, json.dumps(lista_links), json.dumps(dict_imagens or {}), agora, agora,
+                                   self.atualizar, agora - self.ttl))
+            self._conexao.execute("""DELETE FROM crawl WHERE prompt IN (
+                                         SELECT prompt FROM crawl ORDER BY acessado DESC LIMIT -1 OFFSET ?)""", (self.max_entradas,))
+
+    def fecha(self) -> None:
+
+        """
+        Método que fecha a conexão com o banco do 'cache'.
+        """
+
+        with self._lock:
+            self._conexao.close()
@@ -5,8 +5,15 @@ Atualmente, este módulo fornece a classe `CrawlerPinterest`, que implementa
 as funcionalidades necessárias para realizar o crawling no site do Pinterest,
 coletando links de pins a partir de uma lista de prompts fornecida pelo usuário.
 
+Também fornece a classe `CrawlerAPIPinterest`, que coleta os mesmos links pela API JSON
+de pesquisa do site, sem o navegador, a classe `CrawlerPlaywrightPinterest`, um crawler
+assíncrono que usa o navegador do Playwright, e a classe `CrawlerMultiProcesso`, que divide
+os prompts entre vários navegadores.
+
 Dependências:
     - selenium
+    - aiohttp
+    - playwright (opcional)
     - utils.py (módulo interno desta aplicação)
 
 Exemplo:
@@ -37,7 +44,6 @@ from selenium.webdriver.common.action_chains import ActionChains as AC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import InvalidSelectorException
 from selenium.common.exceptions import NoSuchElementException
@@ -46,9 +52,324 @@ from selenium.common.exceptions import WebDriverException
 import logging
 from utils import configurando_logger
 from utils import salva_links
+from utils import id_pin
+from rastreamento import span
+from runtime import RuntimeHTTP
+from navegador import cria_driver, driver_ativo, bloqueio_ativo, bloqueia_recursos
+from navegador import VigiaNavegador, NavegadorDegradado
+import aiohttp
+import asyncio
+import base64
+import contextvars
+import inspect
+import json
+import math
 import time
+import urllib3
 from traceback import format_exc
 from abc import ABC,abstractmethod
+import multiprocessing
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from urllib.parse import urlencode
+
+
+#O Playwright é uma dependência opcional, usada apenas pelo 'CrawlerPlaywrightPinterest'
+try:
+    from playwright.async_api import async_playwright
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    async_playwright = None
+    PlaywrightError = PlaywrightTimeoutError = asyncio.TimeoutError
+
+
+#Endereço padrão do site do Pinterest
+URL_PINTEREST = "https://br.pinterest.com"
+
+#Tempo máximo padrão, em segundos, que o crawler espera por pins novos depois de cada rolamento
+PRAZO_ROLAMENTO = 4.0
+
+#Quantidade padrão de rolamentos seguidos sem pins novos para considerar que a página chegou ao fim
+OBSERVACOES_FIM = 3
+
+#Limites padrão do 'crawling' de cada prompt: tempo total, em segundos, e quantidade de rolamentos seguidos sem nenhum
+#pin novo aceito. Ao chegar em um limite, o crawler fica com os pins ja coletados e segue para o próximo prompt
+PRAZO_PROMPT = 300.0
+ESTAGNACAO_PROMPT = 8
+
+#Motivos de encerramento do 'crawling' de um prompt, registrados no relatório
+MOTIVO_COMPLETO = "completo"
+MOTIVO_FIM_PAGINA = "fim_pagina"
+MOTIVO_SEM_IMAGENS = "sem_imagens"
+MOTIVO_PRAZO = "prazo"
+MOTIVO_ROLAMENTOS = "rolamentos"
+MOTIVO_ESTAGNADO = "estagnado"
+
+#Motivos em que o prompt foi encerrado por um limite, com resultados parciais
+MOTIVOS_LIMITE = frozenset({MOTIVO_PRAZO, MOTIVO_ROLAMENTOS, MOTIVO_ESTAGNADO})
+
+#Quantidade máxima de trocas do navegador, pelo 'VigiaNavegador', durante um mesmo prompt
+MAX_REINICIOS = 3
+
+#Quantidade máxima de telas ('viewports') roladas de uma vez
+MAX_VIEWPORTS = 4
+
+#Intervalo, em segundos, entre as verificações de pins novos durante a espera
+INTERVALO_VERIFICACAO = 0.1
+
+#Tempo máximo, em segundos, de espera pelos primeiros cards de pin da página
+PRAZO_PINS = 10
+
+#Script que rola a página para baixo pela quantidade de telas ('viewports') recebida, ou até o último card de pin
+#renderizado ficar no fim da tela, o que for maior. Assim os cards que ja foram coletados não são percorridos de novo
+SCRIPT_ROLAMENTO = """
+const cards = document.querySelectorAll(arguments[1]);
+const ultimo = cards.length ? cards[cards.length - 1].getBoundingClientRect().bottom : 0;
+window.scrollBy(0, Math.max(ultimo - window.innerHeight, window.innerHeight * arguments[0]));
+"""
+
+#Seletor CSS dos cards de pin, e das tags <a> deles
+SELETOR_CARDS = "div[data-test-id='pinWrapper']"
+SELETOR_PINS = f"{SELETOR_CARDS} a"
+
+#Quantidade de telas acima da tela atual em que os cards ja coletados são mantidos intactos, no modo 'poda'
+TELAS_PODA = 3
+
+#Script do coletor de pins injetado na página. Na primeira chamada (ou depois de uma nova navegação) ele registra
+#os cards ja presentes e instala um 'MutationObserver' que registra o link de cada card adicionado (ou reciclado)
+#na grade. Cada chamada retorna, e retira do coletor, apenas os links novos desde a chamada anterior. Com o segundo
+#argumento 'true', o coletor também registra o 'src' e o 'srcset' da imagem de cada card, e retorna os dois juntos.
+#Com o terceiro argumento maior que zero (modo 'poda'), os cards ja coletados que ficaram mais do que essa quantidade de
+#telas acima da tela atual são esvaziados: as imagens e vídeos são liberados e o conteúdo do card (seletor do quarto
+#argumento) deixa de ser renderizado ('content-visibility'), com o card mantendo a mesma altura, para a grade e o rolamento
+#continuarem iguais. Os nós do card continuam na página, ja que eles pertencem ao React, que quebra se eles forem removidos
+SCRIPT_COLETOR = """
+const seletor = arguments[0];
+const com_imagens = arguments[1];
+const poda = arguments[2];
+let coletor = window.__pinscrapper;
+if (!coletor || coletor.url !== location.href) {
+    if (coletor) coletor.observador.disconnect();
+    coletor = window.__pinscrapper = {url: location.href, vistos: new Set(), novos: [], imagens: [], colhidos: [], observador: null};
+    const registra = raiz => {
+        const lista = raiz.matches && raiz.matches(seletor) ? [raiz] : [];
+        if (raiz.querySelectorAll) lista.push(...raiz.querySelectorAll(seletor));
+        for (const a of lista) {
+            if (a.href && !coletor.vistos.has(a.href)) {
+                coletor.vistos.add(a.href);
+                coletor.novos.push(a.href);
+                if (poda) coletor.colhidos.push(a);
+                const img = com_imagens && a.querySelector("img");
+                if (img) coletor.imagens.push([a.href, img.getAttribute("src") || "", img.getAttribute("srcset") || ""]);
+            }
+        }
+    };
+    coletor.observador = new MutationObserver(mutacoes => {
+        for (const mutacao of mutacoes) {
+            if (mutacao.type === "attributes") registra(mutacao.target);
+            for (const no of mutacao.addedNodes) if (no.nodeType === 1) registra(no);
+        }
+    });
+    coletor.observador.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ["href"]});
+    registra(document);
+}
+const novos = coletor.novos.splice(0);
+if (poda) {
+    const limite = -poda * window.innerHeight;
+    coletor.colhidos = coletor.colhidos.filter(a => {
+        if (!a.isConnected) return false;
+        const card = a.closest(arguments[3]) || a;
+        const caixa = card.getBoundingClientRect();
+        if (caixa.bottom >= limite) return true;
+        for (const midia of card.querySelectorAll("img, video, source")) {
+            if (midia.pause) midia.pause();
+            midia.removeAttribute("srcset");
+            midia.removeAttribute("src");
+            if (midia.load) midia.load();
+        }
+        card.style.height = caixa.height + "px";
+        for (const filho of card.children) filho.style.contentVisibility = "hidden";
+        return false;
+    });
+}
+return com_imagens ? {links: novos, imagens: coletor.imagens.splice(0)} : novos;
+"""
+
+#Trecho do endereço das respostas JSON com as páginas da grade de pesquisa. Cada resposta traz o id e os links de imagem dos pins
+RECURSO_PESQUISA = "/resource/BaseSearchResource/get/"
+
+#Cabeçalhos das requisições a API de pesquisa, os mesmos enviados pelo Javascript da página
+CABECALHOS_API = {"Accept":"application/json, text/javascript, */*; q=0.01", "X-Requested-With":"XMLHttpRequest",
+                  "X-Pinterest-PWS-Handler":"www/search/[scope].js"}
+
+#Quantidade de pins pedida em cada página da API de pesquisa
+TAMANHO_PAGINA_API = 25
+
+#Marcador ('bookmark') retornado pela API na última página da pesquisa
+FIM_BOOKMARK = "-end-"
+
+#Quantidade padrão de prompts paginados ao mesmo tempo pela API
+SIMULTANEOS_API = 10
+
+#Quantidade de tentativas de requisição de cada página da API, e espera base, em segundos, entre elas
+TENTATIVAS_API = 3
+ESPERA_API = 0.5
+
+#Tamanhos de imagem aceitos nos cards da grade de pesquisa, em ordem de preferência, como aparecem nos links do CDN.
+#Cards que só trazem miniaturas menores continuam passando pela página do pin
+TAMANHOS_GRADE = ("/736x/", "/originals/")
+
+#Tamanhos de imagem procurados nas respostas JSON, em ordem de preferência. O primeiro é o mesmo da página do pin
+TAMANHOS_IMAGEM = ("736x", "orig", "474x", "236x")
+
+
+def pins_da_resposta(corpo:str) -> dict[str,list[str]]:
+
+    """
+    Função que retira os pins de uma resposta JSON da pesquisa do Pinterest ('RECURSO_PESQUISA').
+
+    Args:
+        corpo (str): Corpo da resposta.
+
+    Returns:
+        dict[str,list[str]]: Links de imagem de cada pin, na ordem de 'TAMANHOS_IMAGEM', tendo o id do pin como chave.
+                             Resultados que não são pins (ex: anúncios e sugestões de pesquisa) ou que não trazem nenhuma
+                             imagem são ignorados.
+    """
+
+    try:
+        return _pins_dos_resultados(json.loads(corpo)["resource_response"]["data"]["results"])
+    except (ValueError, KeyError, TypeError):
+        return {}
+
+
+def _pins_dos_resultados(lista_resultados:list[dict]) -> dict[str,list[str]]:
+
+    """
+    Função auxiliar que retira os links de imagem de cada pin da lista 'results' de uma resposta da pesquisa.
+
+    Args:
+        lista_resultados (list[dict]): Resultados da página de pesquisa.
+
+    Returns:
+        dict[str,list[str]]: Links de imagem de cada pin, na ordem de 'TAMANHOS_IMAGEM', tendo o id do pin como chave.
+    """
+
+    ### Variáveis ###
+
+    #Imagens de cada resultado
+    dict_imagens = {}
+
+    #Pins retirados dos resultados
+    dict_pins = {}
+
+    ### Código ###
+
+    for resultado in lista_resultados or []:
+        if not isinstance(resultado,dict) or resultado.get("type","pin") != "pin" or not resultado.get("id"):
+            continue
+
+        dict_imagens = resultado.get("images") or {}
+        lista_links = [dict_imagens[tamanho]["url"] for tamanho in TAMANHOS_IMAGEM
+                       if isinstance(dict_imagens.get(tamanho),dict) and dict_imagens[tamanho].get("url")]
+        if lista_links:
+            dict_pins[str(resultado["id"])] = lista_links
+
+    return dict_pins
+
+
+def link_imagem_grade(src:str, srcset:str) -> str | None:
+
+    """
+    Função que escolhe o link da imagem de um card da grade de pesquisa, a partir dos atributos 'src' e 'srcset' da tag <img>.
+
+    Args:
+        src (str): Atributo 'src' da imagem.
+
+        srcset (str): Atributo 'srcset' da imagem (ex: 'https://i.pinimg.com/236x/a.jpg 1x, https://i.pinimg.com/736x/a.jpg 2x').
+
+    Returns:
+        str | None: Link da imagem no maior tamanho de 'TAMANHOS_GRADE' disponível, ou 'None' caso o card só tenha miniaturas menores.
+    """
+
+    ### Variáveis ###
+
+    #Links candidatos, do 'srcset' e do 'src'
+    lista_candidatos = []
+
+    ### Código ###
+
+    lista_candidatos = [parte.split()[0] for parte in (srcset or "").split(",") if parte.strip()]
+    if src:
+        lista_candidatos.append(src)
+
+    for tamanho in TAMANHOS_GRADE:
+        for link in lista_candidatos:
+            if tamanho in link:
+                return link
+    return None
+
+
+def motivo_limite(decorrido:float, rolamentos:int, estagnados:int, prazo_prompt:float|None=PRAZO_PROMPT, max_rolamentos:int|None=None,
+                  max_estagnacao:int|None=ESTAGNACAO_PROMPT) -> str | None:
+
+    """
+    Função que verifica se o 'crawling' de um prompt chegou em algum dos seus limites.
+
+    Args:
+        decorrido (float): Tempo, em segundos, desde o início do 'crawling' do prompt.
+
+        rolamentos (int): Quantidade de rolamentos ja feitos.
+
+        estagnados (int): Quantidade de rolamentos seguidos sem nenhum pin novo aceito.
+
+        prazo_prompt (float | None): Tempo máximo do prompt. 'None' desativa o limite.
+
+        max_rolamentos (int | None): Quantidade máxima de rolamentos. 'None' desativa o limite.
+
+        max_estagnacao (int | None): Quantidade máxima de rolamentos seguidos sem pins novos. 'None' desativa o limite.
+
+    Returns:
+        str | None: Motivo do limite alcançado ('MOTIVO_PRAZO', 'MOTIVO_ROLAMENTOS' ou 'MOTIVO_ESTAGNADO'), ou 'None'.
+    """
+
+    if prazo_prompt is not None and decorrido >= prazo_prompt:
+        return MOTIVO_PRAZO
+    if max_rolamentos is not None and rolamentos >= max_rolamentos:
+        return MOTIVO_ROLAMENTOS
+    if max_estagnacao is not None and estagnados >= max_estagnacao:
+        return MOTIVO_ESTAGNADO
+    return None
+
+
+def _separa_coleta(resultado:list[str]|dict|None, imagens:dict[str,str]) -> list[str]:
+
+    """
+    Função auxiliar que trata o valor retornado pelo coletor da página ('SCRIPT_COLETOR').
+
+    Quando o coletor também retorna as imagens dos cards, o link de imagem de cada card é guardado em 'imagens' antes
+    dos links de pin serem retornados, para o parser ja encontrar eles.
+
+    Args:
+        resultado (list[str] | dict | None): Valor retornado pelo coletor.
+
+        imagens (dict[str,str]): Links de imagem conhecidos, tendo o id do pin como chave.
+
+    Returns:
+        list[str]: Links dos pins novos.
+    """
+
+    if isinstance(resultado, dict):
+        for link,src,srcset in resultado.get("imagens") or []:
+            link_img = link_imagem_grade(src,srcset)
+            if link_img and id_pin(link) not in imagens:
+                imagens[id_pin(link)] = link_img
+        resultado = resultado.get("links")
+
+    return resultado or []
 
 
 #Classe Abstrata
@@ -81,6 +402,67 @@ class Crawler(ABC):
         pass
 
 
+class CrawlerAssincrono(Crawler):
+
+    """
+    Classe base abstrata para crawlers assíncronos, executados no mesmo loop de eventos das outras etapas.
+
+    Além do 'bot_crawler', estes crawlers fornecem o 'bot_crawler_async', com os mesmos argumentos, e o 'links_pin',
+    um iterador assíncrono que entrega os links de pin conforme eles aparecem. O 'callback_link' do 'bot_crawler_async'
+    pode ser uma função comum ou uma corrotina.
+    """
+
+    @abstractmethod
+    async def bot_crawler_async(self):
+        pass
+
+    async def links_pin(self, max_img:int=10, callback_prompt=None):
+
+        """
+        Iterador assíncrono que entrega cada link de pin assim que ele é coletado, como uma tupla '(prompt, link)'.
+
+        Exemplo:
+            async for prompt,link in crawler.links_pin(max_img=20):
+                ...
+
+        Args:
+            max_img (int): Número máximo de imagens coletadas de cada prompt.
+
+            callback_prompt(Callable[[str,list[str]],None] | None): Função chamada ao fim do 'crawling' de cada prompt. Opcional.
+
+        Yields:
+            tuple[str,str]: Prompt e link de pin coletado.
+        """
+
+        ### Variáveis ###
+
+        #Pipeline entre o 'crawling' e o iterador. O valor 'None' sinaliza o fim
+        fila = asyncio.Queue()
+
+        #Task do 'crawling'
+        tarefa = None
+
+        ### Código ###
+
+        tarefa = asyncio.create_task(self.bot_crawler_async(max_img,lambda prompt,link: fila.put_nowait((prompt,link)),callback_prompt))
+        tarefa.add_done_callback(lambda _: fila.put_nowait(None))
+        try:
+            while True:
+                item = await fila.get()
+                if item is None:
+                    break
+                yield item
+
+            #Levantando a exceção do 'crawling', caso ele tenha falhado
+            await tarefa
+
+        finally:
+            if not tarefa.done():
+                tarefa.cancel()
+                with suppress(asyncio.CancelledError):
+                    await tarefa
+
+
 #Sub-Classes
 
 class CrawlerPinterest(Crawler):
@@ -95,13 +477,76 @@ class CrawlerPinterest(Crawler):
         driver (WebDriver): Navegador controlado pelo Selenium.
         logger (Logger): Logger usado para registrar mensagens e exceções.
         lista_prompt (list[str]): Lista de termos de busca que vão ser uutilizados no Pinterest.
+        encerra_driver (bool): Se o navegador deve ser encerrado ao fim do 'bot_crawler'. Utilize 'False' para
+                               manter o navegador aberto e reutiliza-lo em outras pesquisas.
+        relatorio (RelatorioExecucao | None): Relatório da execução. Quando fornecido, o crawler registra os pins,
+                                              rolamentos, tempo de espera e requisições de cada prompt.
+        url_base (str): Endereço do site pesquisado. Utilize outro valor apenas para apontar o crawler para um
+                        servidor de testes (ex: o do 'bench.py').
+        rastreador (Rastreador | None): Rastreador da execução. Quando fornecido, o crawler registra um 'span' para
+                                        cada navegação, espera pelos pins e rolamento.
+        pins_ignorados (dict[str,set[str]]): Ids de pin de cada prompt que não devem ser coletados (ex: pins ja baixados
+                                             no modo incremental). O crawler continua rolando a página até encontrar
+                                             'max_img' pins fora desse conjunto.
+        prazo_rolamento (float): Tempo máximo, em segundos, que o crawler espera por pins novos depois de cada rolamento.
+                                 A espera termina assim que o primeiro pin novo aparece.
+        observacoes_fim (int): Quantidade de rolamentos seguidos sem nenhum pin novo para considerar que a página chegou ao fim.
+        pool (PoolDrivers | None): Pool de navegadores. Quando fornecido, os prompts são pesquisados ao mesmo tempo, cada um em uma
+                                   'thread' que pega emprestado um navegador do pool, e o 'driver' recebido no construtor não é utilizado
+                                   diretamente. Com 'encerra_driver', todos os navegadores do pool são encerrados no fim.
+        abas (int): Quantidade de abas do navegador usadas ao mesmo tempo, cada uma pesquisando um prompt. Os passos de cada
+                    aba são alternados, então uma aba carrega enquanto outra é coletada. Ignorado quando um pool é fornecido.
+        coleta_rede (bool): Se o crawler deve ler as respostas JSON da pesquisa pelo log de rede do navegador (veja o método
+                            'coleta_respostas'). O navegador precisa ter sido criado com 'cria_driver(log_rede=True)'.
+        imagens_grade (bool): Se o crawler deve guardar o link da imagem de cada card da grade de pesquisa (veja a função
+                              'link_imagem_grade'), tirado do próprio HTML da grade.
+        imagens (dict[str,str]): Links de imagem coletados pela rede ou pela grade, tendo o id do pin como chave. Pode ser
+                                 compartilhado com o 'ParserHTMLPinterest', que não requisita a página dos pins presentes nele.
+        prazo_prompt (float | None): Tempo máximo, em segundos, do 'crawling' de cada prompt. 'None' desativa o limite.
+        max_rolamentos (int | None): Quantidade máxima de rolamentos da página de cada prompt. 'None' desativa o limite.
+        max_estagnacao (int | None): Quantidade máxima de rolamentos seguidos sem nenhum pin novo aceito (ex: a grade cresce
+                                     apenas com pins ignorados, ou para de crescer sem chegar ao fim). 'None' desativa o limite.
+        motivos (dict[str,str]): Motivo de encerramento do 'crawling' de cada prompt ('MOTIVO_COMPLETO', 'MOTIVO_FIM_PAGINA', ...).
+                                 Os prompts encerrados por um limite ('MOTIVOS_LIMITE') ficam com os pins coletados até ali.
+        poda (bool): Se os cards ja coletados devem ser esvaziados depois que ficam 'TELAS_PODA' telas acima da tela atual (veja o
+                     'SCRIPT_COLETOR'). Mantém a memória do navegador e o custo de cada passo estáveis em pesquisas muito longas.
+        vigia (VigiaNavegador | None): Vigia da saúde do navegador. Quando fornecido, um navegador que trava, cai ou passa do limite
+                                       de memória é trocado por um novo no meio do prompt, e o prompt continua de onde parou, sem
+                                       repetir os pins ja coletados. Os navegadores criados pelo vigia são sempre encerrados no fim.
+                                       Ignorado no modo com abas ou com pool (que ja troca os navegadores que param de responder).
     """
 
-    def __init__(self,driver:WebDriver,logger:logging.Logger,lista_prompt:list[str]):
+    def __init__(self,driver:WebDriver,logger:logging.Logger,lista_prompt:list[str],encerra_driver:bool=True,relatorio=None,url_base:str=URL_PINTEREST,rastreador=None,
+                 pins_ignorados:dict[str,set[str]]|None=None,prazo_rolamento:float=PRAZO_ROLAMENTO,observacoes_fim:int=OBSERVACOES_FIM,pool=None,abas:int=1,
+                 coleta_rede:bool=False,imagens:dict[str,str]|None=None,imagens_grade:bool=False,prazo_prompt:float|None=PRAZO_PROMPT,
+                 max_rolamentos:int|None=None,max_estagnacao:int|None=ESTAGNACAO_PROMPT,motivos:dict[str,str]|None=None,poda:bool=False,
+                 vigia:VigiaNavegador|None=None):
 
         self._driver = driver
         self.lista_prompt = lista_prompt
         self.logger = logger
+        self.encerra_driver = encerra_driver
+        self.relatorio = relatorio
+        self.url_base = url_base.rstrip("/")
+        self.rastreador = rastreador
+        self.pins_ignorados = pins_ignorados or {}
+        self.prazo_rolamento = prazo_rolamento
+        self.observacoes_fim = observacoes_fim
+        self.pool = pool
+        self.abas = abas
+        self.coleta_rede = coleta_rede
+        self.imagens_grade = imagens_grade
+        self.imagens = imagens if imagens is not None else {}
+        self.prazo_prompt = prazo_prompt
+        self.max_rolamentos = max_rolamentos
+        self.max_estagnacao = max_estagnacao
+        self.motivos = motivos if motivos is not None else {}
+        self.poda = poda
+        self.vigia = vigia
+        self._driver_inicial = driver
+
+        #Navegador emprestado do pool para a 'thread' atual, e as respostas de pesquisa vistas no log de rede dele
+        self._local = threading.local()
 
         #Verificando se a lista passada pelo usuário contem algum valor, se nao tiver, levanta uma exceção
         self.logger.debug(f"\n[BOT-CRAWLER] Verificando se o valor passado para o atributo 'logger' não é vazio. ")
@@ -110,15 +555,16 @@ class CrawlerPinterest(Crawler):
             self.logger.info("\nNão existe nenhum prompt na lista fornecida!")
             raise ValueError ("\nO valor do argumento 'lista_prompt' não pode ser vazio!")
         
+    #O navegador emprestado do pool tem prioridade, para cada 'thread' usar o seu
     @property
     def driver(self):
-        return self._driver
+        return getattr(self._local, "driver", self._driver)
     
     @driver.setter
     def driver(self, valor):
         raise AttributeError("\nO atributo self._driver não pode ter seu valor modificado diretamente!")
 
-    def bot_crawler(self,max_img:int=10) -> dict[str:list]:
+    def bot_crawler(self,max_img:int=10,callback_link=None,callback_prompt=None) -> dict[str:list]:
 
         """
         Método que executa o 'crawling' pelo site do Pinterest.
@@ -130,8 +576,25 @@ class CrawlerPinterest(Crawler):
         novos pins de imagens referentes ao prompt, sendo que o link de cada um é coletado e armazenado
         em uma lista que por fim sera armazenada em um dicionário, tendo como chave dela, o prompt que a gerou.
 
+        Caso o argumento 'callback_link' seja fornecido, cada link de pin novo é entregue a ele assim que
+        é coletado, junto ao prompt que o gerou. Isso permite que as etapas seguintes (parser e downloader)
+        comecem a trabalhar enquanto o crawler ainda esta "rolando" a página.
+
+        Caso o argumento 'callback_prompt' seja fornecido, ele é chamado ao fim do 'crawling' de cada prompt com a
+        lista final de links coletados (vazia, caso o prompt não tenha retornado nenhum pin).
+
+        Caso um pool de navegadores tenha sido fornecido, os prompts são pesquisados ao mesmo tempo pelo método '_crawling_pool',
+        e os 'callbacks' passam a ser chamados por várias 'threads'. Caso mais de uma aba tenha sido pedida, os prompts são
+        pesquisados ao mesmo tempo em abas do mesmo navegador pelo método '_crawling_abas'.
+
         Args:
             max_img(int): Número máximo de imagens que o usuário quer que o crawler colete.
+
+            callback_link(Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link de pin
+                                                            novo coletado. Opcional.
+
+            callback_prompt(Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do
+                                                                    'crawling' de cada prompt. Opcional.
         
         Returns:
             dict(list): Dicionário que armazena listas contendo os links de cada pin coletado de 
@@ -143,31 +606,16 @@ class CrawlerPinterest(Crawler):
             TimeoutException: Exceção levantada quando demora demais para realizar a captura de elementos contendo
                               os links de pin da página.
             
-            StaleElementReferenceException: Exceção levantada quando, ao tentar capturar os WebElements contendos os pins
-                                            o elementos fica na condição de 'Stale' ou seja, ele existia, porem na hora da captura
-                                            foi modificado, e não existe mais.
         """
         
         ### Variáveis ###
 
-        #Instancia WebDriverWait
-        wait = WebDriverWait(self.driver, 10)
-
-        #Lista que armazena os links de pins que vao ser salvos no 'dict_lista_link'
-        lista_pin_final= []
-
-        #Lista que armazena WebElements, mais especificamente tag <a> onde estão os links dos pins
-        lista_pin_req = []
-
         #Dicionario que armazena listas de links dos pins com a chave sendo seu respectivo prompt
         dict_lista_link = {}
 
-        #Variávei que mede tentativas de capturar os elementos depois de um StaleElementReference
-        stale_n = 0
+        #Links coletados de cada prompt, na ordem da 'lista_prompt'
+        lista_resultados = []
 
-        #Variável que mede tentativas de realizar a requisição ao servidor do site Pinterest
-        request_n = 0
-        
         ### Código ###
 
         #Iniciando iteração dos prompts
@@ -177,285 +625,1943 @@ class CrawlerPinterest(Crawler):
         self.logger.debug("[BOT-CRAWLER] Método 'bot_crawler' iniciado. Iniciando a iteração dos valores da lista" \
         " 'self.lista_prompt'")
 
-        for prompt in self.lista_prompt:
-
-            #Formatando a 'lista_pin_final' e 'stale_n' para uma nova requisição de links dos pins da pagina.
-            lista_pin_final = []
-            stale_n = 0
-
-            #Entrando no site e achando o input de pesquisa
-            self.logger.info(f"\nComeçando a procurar imagens do prompt => {prompt}")
-            self.logger.debug(f"[BOT-CRAWLER] Entrando no link do pinterest => https://br.pinterest.com/search/pins/?q={prompt}&rs=typed'")
-
-            #Aqui iniciamos um bloco try para tentar reconexões caso a primeira requisição falhe
-            while True:
-                try:
-                    self.logger.debug(f"\n[BOT-CRAWLER] Entrando no link do pinterest => https://br.pinterest.com/search/pins/?q={prompt}&rs=typed'")
-                    self.logger.info(f"\nRealizando a requisição para o o Pinterest com o prompt => {prompt}")
-
-                    self.driver.get(f"https://br.pinterest.com/search/pins/?q={prompt}&rs=typed")
-                    break
-                
-                except WebDriverException as error:
-                    request_n += 1
-                    if request_n != 3:
-                        self.logger.debug(f"[BOT-CRAWLER] {request_n}ª de 3 tentativas de requisição falhou! Tentando mais uma vez...")
-                        self.logger.info(f"{request_n}ª de 3 tentativas - Ocorreu um problema ao tentar conexão com o site do Pinterest.... Vamos tentar mais uma vez!")
-                        continue
-                    else:
-                        #Subindo o método para fora do 'bot_crawler' para a exceção ser tratada
-                        self.logger.debug(f"[BOT-CRAWLER] Limite de tentativas alcançado! Fazendo limpeza e encerrando o programa!")
-                        self.logger.info("Limite de tentativas alcançado! Problema com a conexão!")
-                        raise
-                    
-            #DEBUG
-            time.sleep(4)
-
-            #Inciando iteração para verificar se a quantidade de imagens no HTML Estático corresponde ao valor de 'max_img'.
-            self.logger.debug("[BOT-CRAWLER] Verificando a quantidade de elementos contendo as imagens na página " \
-            "e se correspondem com o argumento 'max_img'.")
-            while True:
-                #Tentando encontrar os elementos contendo as imagens na pagina
-                try:
-                    
-                    #Aqui tentamos pegar todos os links de PIN dos cards da tela
-                    lista_pin_req = wait.until(EC.presence_of_all_elements_located((By.XPATH,"//div[@data-test-id='pinWrapper'] //a")))
-
-                    #Vamos chamar o método 'verifica_link_pin' para adicionar apenas pins diferentes a lista de links final 'lista_pin_final'
-                    self.verifica_link_pin(lista_pin_final,lista_pin_req)
-
-                    #DEBUG
-                    self.logger.debug(f"[BOT-CRAWLER] Valores dentro da 'lista_pin_final' => {lista_pin_final}")
-
-                    #Veririfcando se a quantidade bate com a que foi requisitada
-                    if len(lista_pin_final) < max_img:
-                        self.logger.info(f"\nAchamos apenas {len(lista_pin_final)} imagens para o prompt => {prompt}")
-                        self.logger.info("Vamos procurar mais....")
-
-                        #DEBUG
-                        time.sleep(4)
-                        
-                        #Vamos realizar o rolamento, e ao mesmo tempo, verificar se a página chegou ao fim.
-                        if self.verifica_chegou_no_fim():
-                            self.logger.debug(f"\n[BOT-CRAWLER] A página chegou ao fim com o prompt {prompt}. Armazenando as imagens do dicionario, encerrando as iterações e seguindo para o próximo prompt.")
-                            self.logger.info(f"A página do prompt => {prompt} chegou ao fim! Vamos entao encerrar a captura com {len(lista_pin_final)} imagens!")
-                            
-                            #Armazenando as imagens do dicionario independente de terem chegado ao max_img definido pelo usuário, e encerrando a iteração
-                            dict_lista_link[prompt] = lista_pin_final[0:max_img]
-                            break
-                    
-                    else:
-                        #Salvando o HTML estatico no dicionario 'dict_pagina_html' tendo a chave como prompt
-                        self.logger.debug(f"\n[BOT-CRAWLER] Achamos {len(lista_pin_final)} imagens da requisição de {max_img} imagens.")
-                        self.logger.info(f"\nAchamos todas as imagens! Salvando os links das imagens do prompt => {prompt}")
-                        
-                        #Fazemos o slice da lista, limitando o numero de elementos a quantidade que o usuário pediu
-                        dict_lista_link[prompt] = lista_pin_final[0:max_img]
-                        break
-                
-                except TimeoutException as error:
-                    #Tratando o problema do bloco de login "congelando" a página
-                    self.logger.debug(f"\n[BOT-CRAWLER] Exceção 'TimeoutException' levantada com o prompt => {prompt}")
-                    self.logger.info(f"Alguma interrupção aconteceu no prompt => {prompt}")
-                    self.logger.info(f"Lidando com ela para continuar com o fluxo...")
-
-                    time.sleep(4)
-                    self.logger.debug(f"\n[BOT-CRAWLER] Chamando o método 'self.verifica_interrupcao' para lidar com a interrupção no 'crawling' do site.")
-                    
-                    #Caso a interrupção for por falta de imagens seja "NSFW" ou "prompt sem imagens" não tem porque continuar a iteração. 
-                    #Quebramos o ciclo 'while' e seguimos para o próximo prompt.
-                    if not self.verifica_interrupcao(prompt):
-                        break
-                
-                except StaleElementReferenceException as error:
-                    stale_n += 1
-                    self.logger.debug("[BOT-CRAWLER] Exceção 'StaleElementReference' foi levantada. Tentando realizar a captura novamente dos elementos.")
-                    self.logger.debug(f"[BOT-CRAWLER] {stale_n}ª Tentativa de capturar novamente os links dos pins...")
-                    if stale_n != 3:
-                        continue
-                    else:
-                        self.logger.debug("Quantidade maxima de tentativas de encontrar os elementos alcançada! Encerrando o programa!")
-                        #Saindo para fora do método 'bot_crawler' para a exceção ser registrada!
-                        raise
+        try:
+            if self.pool is not None:
+                lista_resultados = self._crawling_pool(max_img,callback_link,callback_prompt)
+            elif self.abas > 1 and len(self.lista_prompt) > 1:
+                lista_resultados = self._crawling_abas(max_img,callback_link,callback_prompt)
+            elif self.vigia is not None:
+                lista_resultados = [self._crawling_prompt_vigiado(prompt,max_img,callback_link,callback_prompt) for prompt in self.lista_prompt]
+            else:
+                lista_resultados = [self._crawling_prompt(prompt,max_img,callback_link,callback_prompt) for prompt in self.lista_prompt]
+
+        #Fazendo limpeza, mesmo quando o 'crawling' falha. Os navegadores criados pelo vigia são sempre encerrados, ja que quem
+        #chamou o crawler só conhece o navegador inicial
+        finally:
+            if self.encerra_driver or self._driver is not self._driver_inicial:
+                if self.pool is not None:
+                    self.pool.encerra()
+                else:
+                    self._driver.quit()
+
+        for prompt,lista_links in zip(self.lista_prompt,lista_resultados):
+            if lista_links is not None:
+                dict_lista_link[prompt] = lista_links
 
-        
         #Fazendo limpeza e Retornando dicionario com as paginas HTML
         self.logger.debug("\n[BOT-CRAWLER] Iteração de todos os prompts terminada, retornando o dicionario 'dict_pagina_html'.")
         self.logger.info("\nCaptura dos pins terminada!")
-        self._driver.quit()
         return dict_lista_link
-    
-    def verifica_link_pin(self, lista_pin_final:list[str], lista_pin_req:list[WebElement]) -> None:
 
-        """
-        Método utilizado para verificar quais os links de 'pins' da listad de requisição 'lista_pins_req'
-        existem dentro da lista de links de 'pins' final que é a que vai ficar atribuida ao prompt no dicionario
-        devolvido pelo método 'bot_crawler'
+    def _crawling_pool(self, max_img:int, callback_link=None, callback_prompt=None) -> list[list[str] | None]:
 
-        Esse método foi criado pois o Pinterest tem uma abordagem de, com o javascript, ir 'desativando' os cards de pin que esta fora da
-        tela e 'ativando' os cards novos a cada rolamento da tela. Ele faz isso provavelmente para nao deixar todos os cards
-        revelados, o que faria o navegador ficar muito lento.
+        """
+        Método auxiliar que pesquisa todos os prompts ao mesmo tempo, com os navegadores do pool.
 
-        Portanto a cada rolamento do "execute_script" os cards antigos "somem" e os cards posteriores que estavam escondidos pelo javascript
-        "aparecem". Dessa forma não tem como, por exemplo, revelar todos os cards com o "rolamento" e capturar a pagina inteira. O crawling
-        tem que acontecer de maneira "segmentada", capturando links dos pins que esta na tela, rolando a tela para baixo, e realizando a captura
-        de novo. 
-        
-        O problema é que muitas vezes o rolamento não é o suficiente para capturar apenas links de pins novos, ou seja, que ja não foram capturados.
-        Muitas vezes alem de links novos, links antigos tambem são capturados.
-        
-        Dessa forma esse método foi criado para resolver isso. A cada requisição, cada link da lista de links capturados dos pins é utilizado em uma
-        verificação onde é checado se ele ja existe na lista de links final 'lista_pin_final', se ja existir nada acontece, agora se não existir
-        ele é adicionado a ela.
+        Cada prompt é pesquisado em uma 'thread' de um 'ThreadPoolExecutor' com a mesma quantidade de 'threads' que o pool
+        tem de navegadores. O contexto atual é copiado para cada 'thread', então os 'spans' dos prompts continuam aninhados
+        na etapa de pesquisa.
 
         Args:
-            lista_pin_final (list[str]): Lista contendo todos os links ja salvos e filtrados. Corresponde ao mesmo local
-                                         de memória da lista em 'bot_crawler'.
+            max_img (int): Número máximo de links coletados de cada prompt.
 
-            lista_pin_req(list[WebElement]): Lista contendo os links da ultima requisição que precisam ser filtrados.
-        
+            callback_link (Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link novo.
+
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim de cada prompt.
+
+        Returns:
+            list[list[str] | None]: Resultado do método '_crawling_prompt' de cada prompt, na ordem da 'lista_prompt'.
         """
-        
+
         ### Variáveis ###
 
-        #Variável que extrai o link do WebElement da 'lista_pin_req'
-        link = ""
+        #Tarefas de cada prompt
+        lista_futuros = []
 
         ### Código ###
 
-        #Vamor iterar cada item da lista final para comparar com a nova requisição
-        for link_r in lista_pin_req:
-            #Retirando link em formato string
-            link = link_r.get_attribute('href')
-            if not link in lista_pin_final:
-                lista_pin_final.append(link)
-          
-    def verifica_interrupcao(self, prompt:str) -> bool:
-        
-        """
-        Método que verifica qual tipo de interrupção que ocorreu no fluxo do crawling dentro do 
-        'Pinterest'.
+        self.logger.debug(f"[BOT-CRAWLER] Pesquisando {len(self.lista_prompt)} prompts com um pool de {self.pool.tamanho} navegadores.")
+        with ThreadPoolExecutor(max_workers=self.pool.tamanho, thread_name_prefix="BOT-CRAWLER") as executor:
+            lista_futuros = [executor.submit(contextvars.copy_context().run,self._crawling_prompt_pool,prompt,max_img,callback_link,callback_prompt)
+                             for prompt in self.lista_prompt]
 
-        3 casos especificos são checados:
+        return [futuro.result() for futuro in lista_futuros]
 
-        1º - Se o prompt não devolveu nenhuma 'pin' de imagem.
+    def _crawling_abas(self, max_img:int, callback_link=None, callback_prompt=None) -> list[list[str] | None]:
 
-        2º - Se o prompt contém alguma palavra 'NSFW'
+        """
+        Método auxiliar que pesquisa vários prompts ao mesmo tempo, cada um em uma aba do mesmo navegador.
 
-        3º - Se o bloco de 'login' apareceu, bloqueando o SELENIUM de verificar os 'pins' das imagens.
+        Cada aba recebe um prompt, e os passos do método '_passos_prompt' de cada aba são executados de forma alternada
+        ('round-robin'): enquanto uma aba espera a página ou os pins novos carregarem, as outras são coletadas. Quando
+        uma aba termina o seu prompt, ela recebe o próximo prompt da lista. Cada aba tem o seu próprio contexto, para os
+        'spans' de um prompt não ficarem aninhados nos de outro.
 
-        Caso nenhum dos 3 casos for averiguado, algo que o PinScrapper.py não consegue lidar esta
-        bloqueando a ação do 'crawler'. Nesse caso o problema é "grave", e precisa da averiguação do
-        desenvolvedor. Nessa situação a exceção 'InvalidSelectorException' é levantada, e um relatório
-        sobre o erro é gerado.
+        Args:
+            max_img (int): Número máximo de links coletados de cada prompt.
 
-        PS: A lista é escolhida propositalmente como objeto para armazenar o WebElement representante das 
-            interrupções de falta de imagem e NSFW justamente porque, caso nenhum elemento for encontrado,
-            o "find_elements" devolve uma lista vazia, e não levanta uma Exceção como o caso do "find_element".
+            callback_link (Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link novo.
 
-        Args:
-            prompt (str): A string do prompt que esta sendo usado no momento para o 'crawling' de 'pins'.
-        
-        Raises:
-            InvalidSelectorException: Exceção 'levantada' quando nenhum dos 3 casos de interrupção é encontrado.
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim de cada prompt.
 
+        Returns:
+            list[list[str] | None]: Resultado de cada prompt, na ordem da 'lista_prompt'.
         """
 
         ### Variáveis ###
 
-        #Variavel que armazena um WebElement
-        bloco_login = None
-
-        #Botão fechar
-        botao_fechar = None
+        #Identificadores das abas
+        aba_principal = self.driver.current_window_handle
+        lista_abas = [aba_principal]
 
-        #Lista que vai verificar elemento de bloqueio relacionado a "nudez" no prompt
-        nsfw = []
+        #Abas livres, prompts que ainda não começaram e abas pesquisando, com o índice do prompt, o gerador e o contexto
+        lista_livres = []
+        lista_pendentes = list(enumerate(self.lista_prompt))
+        dict_ativas = {}
 
-        #Lista que vai verificar elemnto de bloqueio a "nenhuma imagem encontrada"
-        no_img = []
+        #Resultado de cada prompt
+        lista_resultados = [None] * len(self.lista_prompt)
 
         ### Código ###
 
-        self.logger.debug("\nIniciando método 'verifica_interrupção'")
-        
-        #Verificando se a interrupção é causada pelo prompt não retornar nenhuma imagem.
-        self.logger.debug(f"\n[BOT-CRAWLER] Verificando se o problema é não ter retornado nenhum pin do prompt => {prompt}")
-        no_img = self.driver.find_elements(By.XPATH,"//div[text()='Não foi possível encontrar Pins para esta pesquisa.']")
-        
-        #Ação caso for encontrado o texto para o problema de nenhum pin retornado pelo prompt
-        if no_img:
-            self.logger.debug(f"\n[BOT-CRAWLER] O problema da interrupção foi que nenhum pin retornou pelo prompt => {prompt}")
-            self.logger.info(f"\nAchamos o problema! Nenhuma imagem foi retornada para o prompt => {prompt}")
-            self.logger.info("Seguindo com o a pesquisa de 'pins' para próximo prompt....")
-            return False
-        
-        #Verificando se a interrupção é causada pelo prompt insinuar conteúdo NSFW
-        self.logger.debug(f"\n[BOT-CRAWLER] Verificando se o problema é possivel conteudo NSFW retornado pelo prompt => {prompt}")
-        nsfw = self.driver.find_elements(By.XPATH,"//span[text()='Pins sobre esse interesse costumam violar as ' or text()='Nudez é permitida no Pinterest, mas com ressalvas. Certifique-se de que entendeu ']")
-
-        #Ação caso encontrado mensagem sobre bloqueio da requisição por conteudo NSFW
-        if nsfw:
-            self.logger.debug(f"\n[BOT-CRAWLER] O problema da interrupção foi o prompt insinuar conteúdo NSFW => {prompt}")
-            self.logger.info(f"\nAchamos o problema! Nenhuma imagem foi retornada para o prompt por ele insinuar NSFW => {prompt}")
-            self.logger.info("Seguindo com o a pesquisa de 'pins' para próximo prompt....")
-            return False
-        
-        #Caso não for problemas com o prompt fornecido, verificamos se o bloco de 'login' de bloqueando o acesso do crawler ao site
         try:
-            bloco_login = self.driver.find_element(By.XPATH, "//div[@data-test-id='login-modal-default' and @class='ADXRXN']")
-            if bloco_login:
-                botao_fechar = bloco_login.find_element(By.XPATH,"//button[@aria-label='fechar']")
-                botao_fechar.click()
-                return True
-        
-        except (InvalidSelectorException,NoSuchElementException) as error:
+            for _ in range(min(self.abas, len(self.lista_prompt)) - 1):
+                self.driver.switch_to.new_window("tab")
+                lista_abas.append(self.driver.current_window_handle)
+                if bloqueio_ativo(self.driver):
+                    bloqueia_recursos(self.driver)
+            self.logger.debug(f"[BOT-CRAWLER] Pesquisando {len(self.lista_prompt)} prompts com {len(lista_abas)} abas.")
+
+            lista_livres = list(lista_abas)
+            while lista_pendentes or dict_ativas:
+                #Entregando os próximos prompts para as abas livres
+                while lista_livres and lista_pendentes:
+                    aba = lista_livres.pop(0)
+                    indice,prompt = lista_pendentes.pop(0)
+                    dict_ativas[aba] = (indice, self._passos_prompt(prompt,max_img,callback_link,callback_prompt,bloqueia_navegacao=False),
+                                        contextvars.copy_context())
+
+                #Avançando um passo de cada aba
+                for aba,(indice,passos,contexto) in list(dict_ativas.items()):
+                    self.driver.switch_to.window(aba)
+                    try:
+                        contexto.run(next, passos)
+                    except StopIteration as fim:
+                        lista_resultados[indice] = fim.value
+                        del dict_ativas[aba]
+                        lista_livres.append(aba)
+
+                time.sleep(INTERVALO_VERIFICACAO)
+
+        finally:
+            #Fechando as abas extras e voltando para a aba principal
+            try:
+                for aba in lista_abas[1:]:
+                    self.driver.switch_to.window(aba)
+                    self.driver.close()
+                self.driver.switch_to.window(aba_principal)
+            except WebDriverException as error:
+                self.logger.debug(f"[BOT-CRAWLER] Não foi possível fechar as abas extras - Exceção => {error}")
+
+        return lista_resultados
+
+    def _crawling_prompt_pool(self, prompt:str, max_img:int, callback_link=None, callback_prompt=None) -> list[str] | None:
 
-            #Problema grave. Algo esta interrompendo o fluxo e que o PinScrapper não consegue lidar
-            #Fazendo limpeza e levantando exceção para sair do método e a mesma ser tratada fora.
-            self.driver.quit()
+        """
+        Método auxiliar que pesquisa um prompt com um navegador emprestado do pool.
 
-            self.logger.info("\nBloco Login e textos não encontrados! Erro grave no programa! De uma olhada no log de erro 'Error.log'!")
-            self.logger.error(f"[BOT-CRAWLER] Bloco login e textos não encontrados. Outra coisa não esta deixando o CrawlerPinterest encontrar as imagens.")
-            
-            raise 
-    
-    def verifica_chegou_no_fim(self) -> bool:
+        Caso o navegador pare de responder durante a pesquisa, ele é substituído pelo pool e a pesquisa do prompt é
+        feita mais uma vez com um navegador novo, sem repetir os pins ja coletados.
 
-        """
-        Método para verificar se a página com os pins chegou no seu rodapé, indicando que não
-        existe mais pins para retirar links.
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Número máximo de links coletados.
 
-        Para realizar essa verificação, capturamos o eixo Y da DOM atual, realizamos o rolamento
-        e depois capturamos novamente o eixo Y para comparar com o primeiro. Se der diferente, o valor
-        retornado sera 'False', indicando que ainda existe imagens mais abaixo. Caso seja 'True', indica
-        que a página chegou ao fim, não tem mais nada.
+            callback_link (Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link novo.
+
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do prompt.
 
         Returns:
-            bool: Retorna um booleano indicando se a página chegou ao fim ou não.
+            list[str] | None: Resultado do método '_crawling_prompt'.
         """
 
         ### Variáveis ###
 
-        #Medida do eixo Y antes do "rolamento"
-        scroll_anterior = 0
-
-        #Medida do eixo Y depois do "rolamento"
-        scroll_atual = 0
+        #Pins coletados do prompt, mantidos entre as tentativas
+        dict_pin_final = {}
 
         ### Código ###
 
-        #Capturando eixo Y antes do rolamento
-        scroll_anterior = self.driver.execute_script("return window.pageYOffset;")
+        for tentativa in (1, 2):
+            with self.pool.empresta() as driver:
+                self._local.driver = driver
+                try:
+                    return self._crawling_prompt(prompt,max_img,callback_link,callback_prompt,dict_pin_final)
 
-        #Vamos "rolar" a tela para baixo e tentar fazer o javascript revelar mais imagens
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                except WebDriverException:
+                    if tentativa == 2 or driver_ativo(driver):
+                        raise
+                    self.logger.info(f"O navegador parou de responder durante a pesquisa do prompt => {prompt}. Tentando novamente com um navegador novo...")
 
-        #Capturando o eixo Y atual
-        scroll_atual = self.driver.execute_script("return window.pageYOffset;")
+                finally:
+                    del self._local.driver
+    
+    def _crawling_prompt_vigiado(self, prompt:str, max_img:int, callback_link=None, callback_prompt=None) -> list[str] | None:
+
+        """
+        Método auxiliar que realiza o 'crawling' de um único prompt sob o 'VigiaNavegador'.
+
+        Caso o navegador falhe ou seja considerado degradado pelo vigia durante o prompt, ele é trocado por um navegador novo
+        e o prompt é pesquisado de novo, até 'MAX_REINICIOS' vezes. Os pins coletados antes da troca são mantidos, então
+        eles não são entregues outra vez ao 'callback_link', e o prompt continua até completar 'max_img' pins novos.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Número máximo de links coletados.
+
+            callback_link (Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link novo.
+
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do prompt.
+
+        Returns:
+            list[str] | None: Resultado do método '_crawling_prompt'.
+
+        Raises:
+            WebDriverException: Exceção levantada quando o navegador continua falhando depois de 'MAX_REINICIOS' trocas, ou
+                                imediatamente quando a falha não é do navegador (ele continua respondendo).
+        """
+
+        ### Variáveis ###
+
+        #Pins coletados do prompt, mantidos entre as trocas de navegador
+        dict_pin_final = {}
+
+        ### Código ###
+
+        for reinicio in range(MAX_REINICIOS + 1):
+            try:
+                return self._crawling_prompt(prompt,max_img,callback_link,callback_prompt,dict_pin_final,self.vigia)
+
+            #Um navegador que caiu também pode falhar na conexão com o 'chromedriver', antes de qualquer 'WebDriverException'
+            except (WebDriverException, urllib3.exceptions.HTTPError) as error:
+                #Uma página desconhecida ('verifica_interrupcao') não é culpa do navegador, e as outras falhas do Selenium só
+                #contam quando o navegador parou de responder
+                if isinstance(error, (InvalidSelectorException, NoSuchElementException)):
+                    raise
+                if not isinstance(error, (NavegadorDegradado, urllib3.exceptions.HTTPError)) and driver_ativo(self._driver):
+                    raise
+                if reinicio == MAX_REINICIOS:
+                    raise
+                self.logger.debug(f"[BOT-CRAWLER] Navegador degradado no prompt {prompt} - Exceção => {type(error).__name__}: {error}")
+                self.logger.info(f"O navegador falhou durante a pesquisa do prompt => {prompt}. Continuando com um navegador novo, a partir das {len(dict_pin_final)} imagens ja encontradas...")
+                if self.relatorio is not None:
+                    self.relatorio.registra_reinicio(prompt)
+                self._driver = self.vigia.recicla(self._driver)
+
+    def _crawling_prompt(self, prompt:str, max_img:int, callback_link=None, callback_prompt=None, dict_pin_final:dict[str,None]|None=None,
+                         vigia:VigiaNavegador|None=None) -> list[str] | None:
+
+        """
+        Método auxiliar que realiza o 'crawling' de um único prompt com o navegador da 'thread' atual.
+
+        Os passos do método '_passos_prompt' são executados em sequência, com uma pausa de 'INTERVALO_VERIFICACAO'
+        segundos sempre que ele estiver esperando o navegador.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Número máximo de links coletados.
+
+            callback_link (Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link novo.
+
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do prompt.
+
+            dict_pin_final (dict[str,None] | None): Pins ja coletados do prompt em uma tentativa anterior (veja o '_passos_prompt').
+
+            vigia (VigiaNavegador | None): Vigia consultado durante cada pausa. Um navegador degradado interrompe o prompt com
+                                           a exceção 'NavegadorDegradado'.
+
+        Returns:
+            list[str] | None: Links dos pins coletados, ou 'None' caso a pesquisa tenha sido interrompida (ex: prompt sem imagens).
+        """
+
+        ### Variáveis ###
+
+        #Gerador com os passos do 'crawling' do prompt
+        passos = self._passos_prompt(prompt,max_img,callback_link,callback_prompt,dict_pin_final=dict_pin_final)
+
+        #Motivo do navegador estar degradado
+        motivo = None
+
+        ### Código ###
+
+        try:
+            while True:
+                next(passos)
+                time.sleep(INTERVALO_VERIFICACAO)
+                motivo = vigia.verifica(self.driver) if vigia is not None else None
+                if motivo is not None:
+                    passos.close()
+                    raise NavegadorDegradado(motivo)
+
+        except StopIteration as fim:
+            return fim.value
+
+    def _passos_prompt(self, prompt:str, max_img:int, callback_link=None, callback_prompt=None, bloqueia_navegacao:bool=True,
+                       dict_pin_final:dict[str,None]|None=None):
+
+        """
+        Gerador com os passos do 'crawling' de um único prompt, no navegador (ou aba) atual.
+
+        O gerador pausa ('yield') sempre que esta esperando o navegador, seja pelos primeiros cards da página ou pelos pins
+        novos depois de um rolamento. Dessa forma, quem executa os passos decide o que fazer durante a espera: o método
+        '_crawling_prompt' apenas espera, e o método '_crawling_abas' avança a pesquisa de outro prompt em outra aba.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Número máximo de links coletados.
+
+            callback_link (Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link novo.
+
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do prompt.
+
+            bloqueia_navegacao (bool): Se a navegação deve esperar a página carregar ('driver.get'). Com 'False', a navegação
+                                       é apenas iniciada, e o carregamento acontece enquanto o gerador esta pausado.
+
+            dict_pin_final (dict[str,None] | None): Conjunto ordenado onde os pins coletados são guardados. Recebendo o conjunto
+                                                    de uma tentativa anterior do mesmo prompt, os pins dele não são coletados, nem
+                                                    entregues ao 'callback_link', de novo.
+
+        Returns:
+            list[str] | None: Links dos pins coletados (valor da 'StopIteration'), ou 'None' caso a pesquisa tenha sido interrompida.
+        """
+
+        ### Variáveis ###
+
+        #Dicionário usado como conjunto ordenado dos links de pins que vao ser salvos no 'dict_lista_link'
+        dict_pin_final = dict_pin_final if dict_pin_final is not None else {}
+
+        #Lista com os links de pin da tela, coletados a cada rolamento
+        lista_pin_req = []
+
+        #Lista com os links de 'dict_pin_final', na ordem em que foram coletados
+        lista_pin_final = list(dict_pin_final)
+
+        #Links coletados do prompt. Fica 'None' caso a pesquisa seja interrompida
+        lista_links = None
+
+        #Variável que mede tentativas de realizar a requisição ao servidor do site Pinterest
+        request_n = 0
+
+        #Quantidade de links do prompt atual que ja foram entregues ao 'callback_link'
+        n_enviados = min(len(lista_pin_final),max_img)
+
+        #Quantidade de telas roladas de uma vez, ajustada a cada rolamento
+        viewports = 1
+
+        #Quantidade de rolamentos seguidos sem nenhum pin novo
+        sem_crescimento = 0
+
+        #Momento de início do prompt, quantidade de rolamentos e de rolamentos seguidos sem nenhum pin novo aceito
+        inicio = time.monotonic()
+        n_rolamentos = 0
+        estagnados = 0
+
+        #Limite do prompt alcançado
+        motivo = None
+        
+        ### Código ###
+
+        #Entrando no site e achando o input de pesquisa
+        self.logger.info(f"\nComeçando a procurar imagens do prompt => {prompt}")
+        self.logger.debug(f"[BOT-CRAWLER] Entrando no link do pinterest => {self._url_pesquisa(prompt)}'")
+
+        #Aqui iniciamos um bloco try para tentar reconexões caso a primeira requisição falhe
+        while True:
+            try:
+                self.logger.debug(f"\n[BOT-CRAWLER] Entrando no link do pinterest => {self._url_pesquisa(prompt)}'")
+                self.logger.info(f"\nRealizando a requisição para o o Pinterest com o prompt => {prompt}")
+
+                if self.relatorio is not None:
+                    self.relatorio.registra_requisicao(self._url_pesquisa(prompt),request_n+1)
+                with span(self.rastreador,"crawler.navegacao",prompt=prompt,url=self._url_pesquisa(prompt),tentativa=request_n+1):
+                    if bloqueia_navegacao:
+                        self.driver.get(self._url_pesquisa(prompt))
+                    else:
+                        #Saindo da página anterior da aba antes, para os cards dela não serem confundidos com os da nova pesquisa
+                        self.driver.get("about:blank")
+                        self.driver.execute_script("window.location.assign(arguments[0]);", self._url_pesquisa(prompt))
+                break
+            
+            except WebDriverException as error:
+                request_n += 1
+                if request_n != 3:
+                    self.logger.debug(f"[BOT-CRAWLER] {request_n}ª de 3 tentativas de requisição falhou! Tentando mais uma vez...")
+                    self.logger.info(f"{request_n}ª de 3 tentativas - Ocorreu um problema ao tentar conexão com o site do Pinterest.... Vamos tentar mais uma vez!")
+                    continue
+                else:
+                    #Subindo o método para fora do 'bot_crawler' para a exceção ser tratada
+                    self.logger.debug(f"[BOT-CRAWLER] Limite de tentativas alcançado! Fazendo limpeza e encerrando o programa!")
+                    self.logger.info("Limite de tentativas alcançado! Problema com a conexão!")
+                    if self.relatorio is not None:
+                        self.relatorio.registra_falha(self._url_pesquisa(prompt))
+                    raise
+
+        #Inciando iteração para verificar se a quantidade de imagens no HTML Estático corresponde ao valor de 'max_img'.
+        self.logger.debug("[BOT-CRAWLER] Verificando a quantidade de elementos contendo as imagens na página " \
+        "e se correspondem com o argumento 'max_img'.")
+        while True:
+            #Tentando encontrar os elementos contendo as imagens na pagina
+            try:
+                
+                #Aqui esperamos os cards aparecerem e retiramos do coletor da página apenas os links de PIN novos
+                with span(self.rastreador,"crawler.espera_pins",prompt=prompt) as atributos:
+                    yield from self._espera_pins()
+                    lista_pin_req = lista_pin_req + self.drena_coletor()
+                    atributos["pins"] = len(lista_pin_req)
+
+                    #Guardando os links de imagem antes de entregar os links de pin, para o parser ja encontrar eles
+                    if self.coleta_rede:
+                        atributos["pins_rede"] = self.coleta_respostas()
+
+                #Vamos chamar o método 'verifica_link_pin' para adicionar apenas pins diferentes ao conjunto de links final 'dict_pin_final'
+                self.verifica_link_pin(dict_pin_final,lista_pin_req,self.pins_ignorados.get(prompt,frozenset()))
+                if n_rolamentos:
+                    estagnados = 0 if len(dict_pin_final) > len(lista_pin_final) else estagnados + 1
+                lista_pin_final = list(dict_pin_final)
+                lista_pin_req = []
+
+                #Entregando os links novos para o 'callback_link', respeitando o limite de 'max_img'
+                if callback_link:
+                    for link in lista_pin_final[n_enviados:max_img]:
+                        callback_link(prompt,link)
+                    n_enviados = len(lista_pin_final[0:max_img])
+
+                #DEBUG
+                self.logger.debug(f"[BOT-CRAWLER] Quantidade de links dentro do 'dict_pin_final' => {len(lista_pin_final)}")
+
+                #Veririfcando se a quantidade bate com a que foi requisitada
+                if len(lista_pin_final) < max_img:
+                    #Antes de rolar de novo, verificando os limites do prompt. Chegando em um deles, ficamos com os pins ja coletados
+                    motivo = motivo_limite(time.monotonic() - inicio,n_rolamentos,estagnados,self.prazo_prompt,self.max_rolamentos,self.max_estagnacao)
+                    if motivo is not None:
+                        self.logger.debug(f"[BOT-CRAWLER] Limite '{motivo}' alcançado com o prompt {prompt} - Rolamentos => {n_rolamentos} - Sem pins novos => {estagnados}")
+                        self.logger.info(f"O prompt => {prompt} chegou no limite de '{motivo}'! Vamos encerrar a captura com {len(lista_pin_final)} imagens!")
+                        lista_links = self._finaliza_prompt(prompt,lista_pin_final[0:max_img],motivo,callback_prompt)
+                        break
+
+                    self.logger.info(f"\nAchamos apenas {len(lista_pin_final)} imagens para o prompt => {prompt}")
+                    self.logger.info("Vamos procurar mais....")
+
+                    #Vamos realizar o rolamento e esperar os pins novos. A página chegou ao fim quando varios rolamentos seguidos não revelam nada
+                    if self.relatorio is not None:
+                        self.relatorio.registra_rolamento(prompt)
+                    with span(self.rastreador,"crawler.rolamento",prompt=prompt,viewports=viewports) as atributos:
+                        lista_pin_req = yield from self._rola_pagina(prompt,viewports)
+                        n_rolamentos += 1
+                        sem_crescimento = 0 if lista_pin_req else sem_crescimento + 1
+                        viewports = self._ajusta_viewports(viewports,len(lista_pin_req),max_img - len(lista_pin_final))
+                        atributos["novos"] = len(lista_pin_req)
+                        atributos["fim"] = sem_crescimento >= self.observacoes_fim
+                    if atributos["fim"]:
+                        self.logger.debug(f"\n[BOT-CRAWLER] A página chegou ao fim com o prompt {prompt}. Armazenando as imagens do dicionario, encerrando as iterações e seguindo para o próximo prompt.")
+                        self.logger.info(f"A página do prompt => {prompt} chegou ao fim! Vamos entao encerrar a captura com {len(lista_pin_final)} imagens!")
+                        
+                        #Armazenando as imagens independente de terem chegado ao max_img definido pelo usuário, e encerrando a iteração
+                        lista_links = self._finaliza_prompt(prompt,lista_pin_final[0:max_img],MOTIVO_FIM_PAGINA,callback_prompt)
+                        break
+                
+                else:
+                    #Salvando o HTML estatico no dicionario 'dict_pagina_html' tendo a chave como prompt
+                    self.logger.debug(f"\n[BOT-CRAWLER] Achamos {len(lista_pin_final)} imagens da requisição de {max_img} imagens.")
+                    self.logger.info(f"\nAchamos todas as imagens! Salvando os links das imagens do prompt => {prompt}")
+                    
+                    #Fazemos o slice da lista, limitando o numero de elementos a quantidade que o usuário pediu
+                    lista_links = self._finaliza_prompt(prompt,lista_pin_final[0:max_img],MOTIVO_COMPLETO,callback_prompt)
+                    break
+            
+            except TimeoutException as error:
+                #Tratando o problema do bloco de login "congelando" a página
+                self.logger.debug(f"\n[BOT-CRAWLER] Exceção 'TimeoutException' levantada com o prompt => {prompt}")
+                self.logger.info(f"Alguma interrupção aconteceu no prompt => {prompt}")
+                self.logger.info(f"Lidando com ela para continuar com o fluxo...")
+
+                self.logger.debug(f"\n[BOT-CRAWLER] Chamando o método 'self.verifica_interrupcao' para lidar com a interrupção no 'crawling' do site.")
+                
+                #Caso a interrupção for por falta de imagens seja "NSFW" ou "prompt sem imagens" não tem porque continuar a iteração. 
+                #Quebramos o ciclo 'while' e seguimos para o próximo prompt.
+                if not self.verifica_interrupcao(prompt):
+                    self._finaliza_prompt(prompt,[],MOTIVO_SEM_IMAGENS,callback_prompt)
+                    break
+
+                #Uma interrupção que volta a cada tentativa (ex: o bloco de login reaparecendo) também conta no prazo do prompt
+                if self.prazo_prompt is not None and time.monotonic() - inicio >= self.prazo_prompt:
+                    self.logger.info(f"O prompt => {prompt} chegou no limite de '{MOTIVO_PRAZO}'! Vamos encerrar a captura com {len(lista_pin_final)} imagens!")
+                    lista_links = self._finaliza_prompt(prompt,lista_pin_final[0:max_img],MOTIVO_PRAZO,callback_prompt)
+                    break
+
+        return lista_links
+
+    def _finaliza_prompt(self, prompt:str, lista_links:list[str], motivo:str, callback_prompt=None) -> list[str]:
+
+        """
+        Método auxiliar que encerra o 'crawling' de um prompt, registrando o motivo do encerramento e entregando os links ao 'callback_prompt'.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            lista_links (list[str]): Links dos pins coletados.
+
+            motivo (str): Motivo do encerramento (ex: 'MOTIVO_COMPLETO').
+
+            callback_prompt (Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)'.
+
+        Returns:
+            list[str]: A própria 'lista_links'.
+        """
+
+        self.motivos[prompt] = motivo
+        if self.relatorio is not None:
+            self.relatorio.registra_pins(prompt,len(lista_links),motivo)
+        if callback_prompt:
+            callback_prompt(prompt,lista_links)
+        return lista_links
+
+    def _url_pesquisa(self, prompt:str) -> str:
+
+        """
+        Método auxiliar que monta o link da página de pesquisa de um prompt.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+        Returns:
+            str: Link da página de pesquisa.
+        """
+
+        return f"{self.url_base}/search/pins/?q={prompt}&rs=typed"
+
+    def drena_coletor(self) -> list[str]:
+
+        """
+        Método que retorna os links de pin novos desde a última chamada, registrados pelo coletor injetado na página.
+
+        O coletor ('SCRIPT_COLETOR') é instalado na primeira chamada feita em cada página, e a partir dai registra o link
+        de cada card assim que ele é adicionado a grade. Dessa forma, cada chamada custa uma única ida e volta ao navegador,
+        retorna apenas os pins que ainda não foram entregues, e não perde os cards que o Pinterest remove da grade antes
+        da coleta. Como nenhum WebElement é manipulado, a coleta também não sofre com 'StaleElementReferenceException'.
+
+        Com 'imagens_grade', o coletor também retorna a imagem de cada card, e o link dela é guardado em 'imagens'. Com 'poda',
+        a mesma chamada também esvazia os cards ja coletados que ficaram bem acima da tela.
+
+        Returns:
+            list[str]: Links dos pins novos, na ordem em que apareceram na página.
+        """
+
+        ### Variáveis ###
+
+        #Valor retornado pelo coletor
+        resultado = None
+
+        ### Código ###
+
+        resultado = self.driver.execute_script(SCRIPT_COLETOR, SELETOR_PINS, self.imagens_grade, TELAS_PODA if self.poda else 0, SELETOR_CARDS)
+        return _separa_coleta(resultado,self.imagens)
+
+    def coleta_respostas(self) -> int:
+
+        """
+        Método que lê o log de rede do navegador e guarda em 'imagens' os links de imagem dos pins trazidos pelas respostas
+        JSON da pesquisa ('RECURSO_PESQUISA').
+
+        A cada rolamento o Pinterest carrega a próxima página da grade por uma dessas respostas, que ja traz o id e os links
+        de imagem de cada pin. Os pins guardados aqui não precisam ter a sua página requisitada e analisada pelo parser.
+        O corpo de uma resposta só é pedido ao navegador ('Network.getResponseBody') depois que ela terminou de carregar.
+
+        Os primeiros pins da pesquisa vem no próprio HTML da página, e não por uma resposta JSON, então eles continuam
+        passando pelo parser.
+
+        Returns:
+            int: Quantidade de pins novos guardados.
+        """
+
+        ### Variáveis ###
+
+        #Eventos do log de rede desde a última leitura
+        lista_eventos = []
+
+        #Respostas de pesquisa que ainda não terminaram de carregar, ou cujo corpo ainda não foi lido, com as tentativas restantes
+        dict_respostas = None
+
+        #Quantidade de pins novos guardados
+        n_novos = 0
+
+        ### Código ###
+
+        try:
+            lista_eventos = self.driver.get_log("performance")
+        except WebDriverException:
+            self.logger.debug("[BOT-CRAWLER] O navegador não tem o log de rede ativo! Desativando a coleta pela rede.")
+            self.coleta_rede = False
+            return 0
+
+        if not hasattr(self._local, "respostas"):
+            self._local.respostas = {}
+        dict_respostas = self._local.respostas
+
+        for entrada in lista_eventos:
+            try:
+                evento = json.loads(entrada["message"])["message"]
+            except (ValueError, KeyError, TypeError):
+                continue
+
+            if evento.get("method") == "Network.responseReceived" and RECURSO_PESQUISA in evento["params"]["response"].get("url",""):
+                dict_respostas[evento["params"]["requestId"]] = None
+            elif evento.get("method") == "Network.loadingFinished" and evento["params"]["requestId"] in dict_respostas:
+                #No modo com abas, o corpo só pode ser lido na aba da resposta, então cada aba tem uma tentativa
+                dict_respostas[evento["params"]["requestId"]] = max(1,self.abas)
+
+        for id_requisicao,tentativas in list(dict_respostas.items()):
+            if tentativas is None:
+                continue
+            try:
+                resposta = self.driver.execute_cdp_cmd("Network.getResponseBody",{"requestId":id_requisicao})
+            except WebDriverException:
+                if tentativas > 1:
+                    dict_respostas[id_requisicao] = tentativas - 1
+                else:
+                    del dict_respostas[id_requisicao]
+                continue
+
+            del dict_respostas[id_requisicao]
+            corpo = resposta.get("body","")
+            if resposta.get("base64Encoded"):
+                corpo = base64.b64decode(corpo).decode("utf-8","replace")
+            for id_do_pin,lista_links in pins_da_resposta(corpo).items():
+                if id_do_pin not in self.imagens:
+                    self.imagens[id_do_pin] = lista_links[0]
+                    n_novos += 1
+
+        self.logger.debug(f"[BOT-CRAWLER] {n_novos} links de imagem coletados pelo log de rede.")
+        return n_novos
+
+    def verifica_link_pin(self, dict_pin_final:dict[str,None], lista_pin_req:list[str], ignorados:set[str]=frozenset()) -> None:
+
+        """
+        Método utilizado para verificar quais os links de 'pins' da listad de requisição 'lista_pins_req'
+        existem dentro da lista de links de 'pins' final que é a que vai ficar atribuida ao prompt no dicionario
+        devolvido pelo método 'bot_crawler'
+
+        Esse método foi criado pois o Pinterest tem uma abordagem de, com o javascript, ir 'desativando' os cards de pin que esta fora da
+        tela e 'ativando' os cards novos a cada rolamento da tela. Ele faz isso provavelmente para nao deixar todos os cards
+        revelados, o que faria o navegador ficar muito lento.
+
+        Portanto a cada rolamento do "execute_script" os cards antigos "somem" e os cards posteriores que estavam escondidos pelo javascript
+        "aparecem". Dessa forma não tem como, por exemplo, revelar todos os cards com o "rolamento" e capturar a pagina inteira. O crawling
+        tem que acontecer de maneira "segmentada", capturando links dos pins que esta na tela, rolando a tela para baixo, e realizando a captura
+        de novo. 
+        
+        O problema é que muitas vezes o rolamento não é o suficiente para capturar apenas links de pins novos, ou seja, que ja não foram capturados.
+        Muitas vezes alem de links novos, links antigos tambem são capturados.
+        
+        Dessa forma esse método foi criado para resolver isso. A cada requisição, cada link da lista de links capturados dos pins é utilizado em uma
+        verificação onde é checado se ele ja existe no conjunto de links final 'dict_pin_final', se ja existir nada acontece, agora se não existir
+        ele é adicionado a ele. O conjunto é um dicionário (com valores 'None'), então a verificação não depende da quantidade de links ja
+        coletados e a ordem de coleta é mantida.
+
+        Args:
+            dict_pin_final (dict[str,None]): Dicionário contendo todos os links ja salvos e filtrados. Corresponde ao mesmo local
+                                             de memória do dicionário em 'bot_crawler'.
+
+            lista_pin_req(list[str]): Lista contendo os links da ultima requisição que precisam ser filtrados.
+
+            ignorados(set[str]): Ids de pin que não devem ser adicionados a lista final.
+        
+        """
+        
+        ### Código ###
+
+        #Vamos iterar cada link da nova requisição e comparar com o conjunto final
+        for link in lista_pin_req:
+            if link and link not in dict_pin_final and id_pin(link) not in ignorados:
+                dict_pin_final[link] = None
+          
+    def verifica_interrupcao(self, prompt:str) -> bool:
+        
+        """
+        Método que verifica qual tipo de interrupção que ocorreu no fluxo do crawling dentro do 
+        'Pinterest'.
+
+        3 casos especificos são checados:
+
+        1º - Se o prompt não devolveu nenhuma 'pin' de imagem.
+
+        2º - Se o prompt contém alguma palavra 'NSFW'
+
+        3º - Se o bloco de 'login' apareceu, bloqueando o SELENIUM de verificar os 'pins' das imagens.
+
+        Caso nenhum dos 3 casos for averiguado, algo que o PinScrapper.py não consegue lidar esta
+        bloqueando a ação do 'crawler'. Nesse caso o problema é "grave", e precisa da averiguação do
+        desenvolvedor. Nessa situação a exceção 'InvalidSelectorException' é levantada, e um relatório
+        sobre o erro é gerado.
+
+        PS: A lista é escolhida propositalmente como objeto para armazenar o WebElement representante das 
+            interrupções de falta de imagem e NSFW justamente porque, caso nenhum elemento for encontrado,
+            o "find_elements" devolve uma lista vazia, e não levanta uma Exceção como o caso do "find_element".
+
+        Args:
+            prompt (str): A string do prompt que esta sendo usado no momento para o 'crawling' de 'pins'.
+        
+        Raises:
+            InvalidSelectorException: Exceção 'levantada' quando nenhum dos 3 casos de interrupção é encontrado.
+
+        """
+
+        ### Variáveis ###
+
+        #Variavel que armazena um WebElement
+        bloco_login = None
+
+        #Botão fechar
+        botao_fechar = None
+
+        #Lista que vai verificar elemento de bloqueio relacionado a "nudez" no prompt
+        nsfw = []
+
+        #Lista que vai verificar elemnto de bloqueio a "nenhuma imagem encontrada"
+        no_img = []
+
+        ### Código ###
+
+        self.logger.debug("\nIniciando método 'verifica_interrupção'")
+        
+        #Verificando se a interrupção é causada pelo prompt não retornar nenhuma imagem.
+        self.logger.debug(f"\n[BOT-CRAWLER] Verificando se o problema é não ter retornado nenhum pin do prompt => {prompt}")
+        no_img = self.driver.find_elements(By.XPATH,"//div[text()='Não foi possível encontrar Pins para esta pesquisa.']")
+        
+        #Ação caso for encontrado o texto para o problema de nenhum pin retornado pelo prompt
+        if no_img:
+            self.logger.debug(f"\n[BOT-CRAWLER] O problema da interrupção foi que nenhum pin retornou pelo prompt => {prompt}")
+            self.logger.info(f"\nAchamos o problema! Nenhuma imagem foi retornada para o prompt => {prompt}")
+            self.logger.info("Seguindo com o a pesquisa de 'pins' para próximo prompt....")
+            return False
+        
+        #Verificando se a interrupção é causada pelo prompt insinuar conteúdo NSFW
+        self.logger.debug(f"\n[BOT-CRAWLER] Verificando se o problema é possivel conteudo NSFW retornado pelo prompt => {prompt}")
+        nsfw = self.driver.find_elements(By.XPATH,"//span[text()='Pins sobre esse interesse costumam violar as ' or text()='Nudez é permitida no Pinterest, mas com ressalvas. Certifique-se de que entendeu ']")
+
+        #Ação caso encontrado mensagem sobre bloqueio da requisição por conteudo NSFW
+        if nsfw:
+            self.logger.debug(f"\n[BOT-CRAWLER] O problema da interrupção foi o prompt insinuar conteúdo NSFW => {prompt}")
+            self.logger.info(f"\nAchamos o problema! Nenhuma imagem foi retornada para o prompt por ele insinuar NSFW => {prompt}")
+            self.logger.info("Seguindo com o a pesquisa de 'pins' para próximo prompt....")
+            return False
+        
+        #Caso não for problemas com o prompt fornecido, verificamos se o bloco de 'login' de bloqueando o acesso do crawler ao site
+        try:
+            bloco_login = self.driver.find_element(By.XPATH, "//div[@data-test-id='login-modal-default' and @class='ADXRXN']")
+            if bloco_login:
+                botao_fechar = bloco_login.find_element(By.XPATH,"//button[@aria-label='fechar']")
+                botao_fechar.click()
+                return True
+        
+        except (InvalidSelectorException,NoSuchElementException) as error:
+
+            #Problema grave. Algo esta interrompendo o fluxo e que o PinScrapper não consegue lidar
+            #Levantando exceção para sair do método e a mesma ser tratada fora. O navegador é encerrado pelo 'bot_crawler'
+            self.logger.info("\nBloco Login e textos não encontrados! Erro grave no programa! De uma olhada no log de erro 'Error.log'!")
+            self.logger.error(f"[BOT-CRAWLER] Bloco login e textos não encontrados. Outra coisa não esta deixando o CrawlerPinterest encontrar as imagens.")
+            
+            raise 
+    
+    def _espera_pins(self):
+
+        """
+        Gerador que espera os primeiros cards de pin aparecerem na página, pausando enquanto eles não aparecem.
+
+        Raises:
+            TimeoutException: Exceção levantada caso nenhum card apareça em 'PRAZO_PINS' segundos (ex: prompt sem imagens ou
+                              bloco de login na frente da página).
+        """
+
+        ### Variáveis ###
+
+        #Momento de início da espera
+        inicio = time.monotonic()
+
+        ### Código ###
+
+        while not self.driver.find_elements(By.CSS_SELECTOR,SELETOR_PINS):
+            if time.monotonic() - inicio >= PRAZO_PINS:
+                raise TimeoutException(f"Nenhum card de pin apareceu em {PRAZO_PINS} segundos.")
+            yield
+
+    def _rola_pagina(self, prompt:str, viewports:int):
+
+        """
+        Gerador que rola a página para baixo e espera os pins novos revelados pelo rolamento.
+
+        A página é rolada pelo menos até o último card renderizado. Em vez de uma pausa fixa, o coletor da página é consultado
+        a cada passo, e a espera termina assim que o primeiro pin novo aparece, ou quando o tempo 'prazo_rolamento' acaba.
+        O tempo esperado é registrado no relatório do prompt.
+
+        Args:
+            prompt (str): Prompt sendo pesquisado.
+
+            viewports (int): Quantidade de telas roladas.
+
+        Returns:
+            list[str]: Links dos pins novos revelados pelo rolamento. Vazia caso nenhum pin novo apareça dentro do prazo.
+        """
+
+        ### Variáveis ###
+
+        #Momento de início da espera
+        inicio = time.monotonic()
+
+        #Links novos encontrados
+        lista_links = []
+
+        ### Código ###
+
+        self.driver.execute_script(SCRIPT_ROLAMENTO, viewports, SELETOR_PINS)
+        lista_links = self.drena_coletor()
+        while not lista_links and time.monotonic() - inicio < self.prazo_rolamento:
+            yield
+            lista_links = self.drena_coletor()
+
+        if not lista_links:
+            self.logger.debug(f"[BOT-CRAWLER] Nenhum pin novo apareceu em {self.prazo_rolamento} segundos depois do rolamento do prompt => {prompt}")
+
+        if self.relatorio is not None:
+            self.relatorio.registra_espera(prompt,time.monotonic() - inicio)
+        return lista_links
+
+    @staticmethod
+    def _ajusta_viewports(viewports:int, n_novos:int, faltam:int) -> int:
+
+        """
+        Método auxiliar que calcula quantas telas devem ser roladas no próximo rolamento.
+
+        Quando o rolamento revela pins novos, a quantidade de pins por tela é estimada e usada para rolar de uma vez
+        apenas o necessário para os pins que ainda faltam. Quando não revela nada, a quantidade de telas é dobrada,
+        para alcançar mais rápido o ponto onde a página carrega mais pins. O valor fica sempre entre 1 e 'MAX_VIEWPORTS'.
+
+        Args:
+            viewports (int): Quantidade de telas roladas no último rolamento.
+
+            n_novos (int): Quantidade de pins novos revelados pelo último rolamento.
+
+            faltam (int): Quantidade de pins que ainda faltam para o prompt.
+
+        Returns:
+            int: Quantidade de telas do próximo rolamento.
+        """
+
+        if not n_novos:
+            return min(viewports * 2, MAX_VIEWPORTS)
+        return max(1, min(MAX_VIEWPORTS, math.ceil(faltam * viewports / n_novos)))
+
+
+class CrawlerAPIPinterest(CrawlerAssincrono):
+
+    """
+    Implementação de um crawler para o Pinterest que não utiliza o navegador.
+
+    Em vez de rolar a página de pesquisa, este crawler pede as páginas da grade diretamente a API JSON de pesquisa do site
+    ('RECURSO_PESQUISA'), a mesma usada pelo Javascript da página, seguindo o marcador ('bookmark') de cada resposta até a
+    próxima página. As requisições são feitas com o 'aiohttp', então vários prompts são paginados ao mesmo tempo no loop
+    de eventos, e no modo 'streaming' o crawler é executado no mesmo loop do parser e do downloader. Cada resposta ja traz os links de imagem dos pins, que são guardados em 'imagens' para o parser não
+    precisar requisitar a página de cada pin.
+
+    Os prompts em que a API falha (ex: mudança no formato das respostas ou bloqueio das requisições) são pesquisados
+    depois com o crawler reserva ('fallback'), que por padrão é o 'CrawlerPinterest' com o navegador.
+
+    Atributos:
+        driver (WebDriver | None): Navegador usado apenas pelo crawler reserva. Com 'None', um navegador é criado apenas se
+                                   algum prompt precisar do crawler reserva, e encerrado no fim.
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+        lista_prompt (list[str]): Lista de termos de busca que vão ser utilizados no Pinterest.
+        encerra_driver (bool): Se o navegador recebido deve ser encerrado ao fim do 'bot_crawler'.
+        relatorio (RelatorioExecucao | None): Relatório da execução. Quando fornecido, o crawler registra os pins, as páginas
+                                              (como rolamentos) e as requisições de cada prompt.
+        url_base (str): Endereço do site pesquisado. Utilize outro valor apenas para apontar o crawler para um servidor de
+                        testes (ex: o do 'bench.py').
+        rastreador (Rastreador | None): Rastreador da execução. Quando fornecido, o crawler registra um 'span' para cada
+                                        prompt e para cada requisição de página.
+        pins_ignorados (dict[str,set[str]]): Ids de pin de cada prompt que não devem ser coletados.
+        imagens (dict[str,str]): Links de imagem de cada pin coletado, tendo o id do pin como chave. Pode ser compartilhado com
+                                 o 'ParserHTMLPinterest'.
+        simultaneos (int): Quantidade máxima de prompts paginados ao mesmo tempo.
+        fallback (type[Crawler] | None): Crawler usado nos prompts em que a API falhou. Com 'None', esses prompts ficam fora do
+                                         resultado.
+        prazo_prompt, max_rolamentos, max_estagnacao: Limites do 'crawling' de cada prompt (veja o 'CrawlerPinterest'). Cada
+                                                      página da API conta como um rolamento.
+        motivos (dict[str,str]): Motivo de encerramento do 'crawling' de cada prompt, compartilhado com o crawler reserva.
+        monitor, coleta_rede, endereco_depuracao: Opções do navegador criado para o crawler reserva (veja 'cria_driver'). O crawler
+                                                  reserva também recebe o 'coleta_rede'.
+        runtime (RuntimeHTTP | None): Runtime da execução. Quando fornecido, as páginas da API são requisitadas pela sessão HTTP
+                                      compartilhada, dentro dos limites de conexão dela. Com 'None', o crawler usa uma sessão própria.
+    """
+
+    def __init__(self,driver:WebDriver|None,logger:logging.Logger,lista_prompt:list[str],encerra_driver:bool=True,relatorio=None,url_base:str=URL_PINTEREST,
+                 rastreador=None,pins_ignorados:dict[str,set[str]]|None=None,imagens:dict[str,str]|None=None,simultaneos:int=SIMULTANEOS_API,
+                 fallback:type[Crawler]|None=CrawlerPinterest,prazo_prompt:float|None=PRAZO_PROMPT,max_rolamentos:int|None=None,
+                 max_estagnacao:int|None=ESTAGNACAO_PROMPT,motivos:dict[str,str]|None=None,monitor:bool=False,coleta_rede:bool=False,
+                 endereco_depuracao:str|None=None,runtime:RuntimeHTTP|None=None):
+
+        self._driver = driver
+        self.logger = logger
+        self.lista_prompt = lista_prompt
+        self.encerra_driver = encerra_driver
+        self.relatorio = relatorio
+        self.url_base = url_base.rstrip("/")
+        self.rastreador = rastreador
+        self.pins_ignorados = pins_ignorados or {}
+        self.imagens = imagens if imagens is not None else {}
+        self.simultaneos = simultaneos
+        self.fallback = fallback
+        self.prazo_prompt = prazo_prompt
+        self.max_rolamentos = max_rolamentos
+        self.max_estagnacao = max_estagnacao
+        self.motivos = motivos if motivos is not None else {}
+        self.monitor = monitor
+        self.coleta_rede = coleta_rede
+        self.endereco_depuracao = endereco_depuracao
+        self.runtime = runtime
+
+        #Verificando os valores passados
+        if not self.lista_prompt:
+            self.logger.info("\nNão existe nenhum prompt na lista fornecida!")
+            raise ValueError ("\nO valor do argumento 'lista_prompt' não pode ser vazio!")
+
+        if self.simultaneos < 1:
+            raise ValueError ("\nO valor do argumento 'simultaneos' precisa ser maior que zero!")
+
+    @property
+    def driver(self):
+        return self._driver
+
+    @driver.setter
+    def driver(self, valor):
+        raise AttributeError("\nO atributo self._driver não pode ter seu valor modificado diretamente!")
+
+    def bot_crawler(self,max_img:int=10,callback_link=None,callback_prompt=None) -> dict[str:list]:
+
+        """
+        Método que executa o 'crawling' fora de um código assíncrono, no loop do 'runtime' ou em um loop próprio.
+
+        Veja o método 'bot_crawler_async'.
+        """
+
+        if self.runtime is not None:
+            return self.runtime.executa(self.bot_crawler_async(max_img,callback_link,callback_prompt))
+        return asyncio.run(self.bot_crawler_async(max_img,callback_link,callback_prompt))
+
+    async def bot_crawler_async(self,max_img:int=10,callback_link=None,callback_prompt=None) -> dict[str:list]:
+
+        """
+        Método assíncrono que executa o 'crawling' de todos os prompts pela API de pesquisa, e depois pesquisa com o crawler
+        reserva os prompts em que a API falhou.
+
+        O crawler reserva (síncrono) é executado em uma 'thread' separada, para não bloquear o loop de eventos.
+
+        Args:
+            max_img(int): Número máximo de imagens que o usuário quer que o crawler colete.
+
+            callback_link(Callable[[str,str],None|Awaitable] | None): Função (ou corrotina) chamada com '(prompt, link)' para
+                                                                      cada link de pin novo coletado. Opcional.
+
+            callback_prompt(Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do
+                                                                    'crawling' de cada prompt. Opcional.
+
+        Returns:
+            dict(list): Dicionário que armazena listas contendo os links de cada pin coletado de um respectivo prompt.
+        """
+
+        ### Variáveis ###
+
+        #Links ja entregues ao 'callback_link' de cada prompt, para o crawler reserva não entregar os mesmos de novo
+        dict_enviados = {}
+
+        #Resultado de cada prompt. Fica 'None' nos prompts em que a API falhou
+        dict_resultados = {}
+
+        #Prompts que precisam do crawler reserva
+        lista_falhas = []
+
+        ### Código ###
+
+        self.logger.info(f"\nPesquisando {len(self.lista_prompt)} prompts pela API do Pinterest, {self.simultaneos} ao mesmo tempo...")
+        dict_resultados = await self._crawling(max_img,callback_link,callback_prompt,dict_enviados)
+        lista_falhas = [prompt for prompt in self.lista_prompt if dict_resultados[prompt] is None]
+
+        if lista_falhas and self.fallback is not None:
+            self.logger.info(f"\nA API falhou em {len(lista_falhas)} prompt(s)! Pesquisando eles com o navegador...")
+            dict_resultados.update(await asyncio.to_thread(self._crawling_fallback,lista_falhas,max_img,
+                                                           _callback_da_thread(callback_link,asyncio.get_running_loop()),
+                                                           callback_prompt,dict_enviados))
+
+        else:
+            if lista_falhas:
+                self.logger.info(f"\nA API falhou em {len(lista_falhas)} prompt(s)! Eles ficaram sem imagens => {lista_falhas}")
+            if self.encerra_driver and self._driver is not None:
+                self._driver.quit()
+
+        self.logger.info("\nCaptura dos pins terminada!")
+        return {prompt:dict_resultados[prompt] for prompt in self.lista_prompt if dict_resultados.get(prompt) is not None}
+
+    async def _crawling(self, max_img:int, callback_link, callback_prompt, dict_enviados:dict[str,set[str]]) -> dict[str,list[str] | None]:
+
+        """
+        Método auxiliar assíncrono que pagina todos os prompts ao mesmo tempo, limitado por 'simultaneos', com a sessão HTTP do
+        'runtime' ou com uma sessão própria.
+
+        Returns:
+            dict[str,list[str] | None]: Links coletados de cada prompt, ou 'None' nos prompts em que a API falhou.
+        """
+
+        ### Variáveis ###
+
+        #Semáforo que limita a quantidade de prompts paginados ao mesmo tempo
+        semaforo = asyncio.Semaphore(self.simultaneos)
+
+        #Resultado de cada prompt, na ordem da lista de prompts
+        lista_resultados = []
+
+        ### Código ###
+
+        if self.runtime is not None:
+            lista_resultados = await asyncio.gather(*(self._crawling_prompt(self.runtime.session,semaforo,prompt,max_img,callback_link,callback_prompt,
+                                                                            dict_enviados) for prompt in self.lista_prompt))
+        else:
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.simultaneos)) as session:
+                lista_resultados = await asyncio.gather(*(self._crawling_prompt(session,semaforo,prompt,max_img,callback_link,callback_prompt,dict_enviados)
+                                                          for prompt in self.lista_prompt))
+
+        return dict(zip(self.lista_prompt,lista_resultados))
+
+    async def _crawling_prompt(self, session:aiohttp.ClientSession, semaforo:asyncio.Semaphore, prompt:str, max_img:int, callback_link, callback_prompt,
+                               dict_enviados:dict[str,set[str]]) -> list[str] | None:
+
+        """
+        Método auxiliar assíncrono que pagina a pesquisa de um único prompt até coletar 'max_img' pins ou a pesquisa chegar ao fim.
+
+        Returns:
+            list[str] | None: Links dos pins coletados, ou 'None' caso a API tenha falhado.
+        """
+
+        ### Variáveis ###
+
+        #Dicionário usado como conjunto ordenado dos links de pin coletados
+        dict_pin_final = {}
+
+        #Ids de pin do prompt que não devem ser coletados
+        ignorados = self.pins_ignorados.get(prompt,frozenset())
+
+        #Marcador da próxima página, e quantidade de páginas requisitadas
+        bookmark = None
+        n_paginas = 0
+
+        #Resposta da página atual e os resultados dela
+        resposta = {}
+        lista_resultados = []
+
+        #Momento de início do prompt, quantidade de páginas seguidas sem nenhum pin novo aceito, e motivo do encerramento
+        inicio = None
+        estagnados = 0
+        motivo = MOTIVO_COMPLETO
+
+        ### Código ###
+
+        async with semaforo:
+            inicio = time.monotonic()
+            with span(self.rastreador,"crawler.api",prompt=prompt) as atributos:
+                while len(dict_pin_final) < max_img:
+                    #Verificando os limites do prompt antes de pedir a próxima página
+                    if n_paginas:
+                        motivo = motivo_limite(time.monotonic() - inicio,n_paginas - 1,estagnados,self.prazo_prompt,self.max_rolamentos,self.max_estagnacao)
+                        if motivo is not None:
+                            self.logger.info(f"O prompt => {prompt} chegou no limite de '{motivo}'! Vamos encerrar a captura com {len(dict_pin_final)} imagens!")
+                            break
+                        motivo = MOTIVO_COMPLETO
+
+                    dados = await self._requisita_pagina(session,prompt,bookmark)
+                    if dados is None:
+                        atributos["falha"] = True
+                        return None
+
+                    n_paginas += 1
+                    if n_paginas > 1 and self.relatorio is not None:
+                        self.relatorio.registra_rolamento(prompt)
+
+                    resposta = dados.get("resource_response") if isinstance(dados.get("resource_response"),dict) else {}
+                    lista_resultados = resposta["data"].get("results") or [] if isinstance(resposta.get("data"),dict) else []
+                    estagnados += 1
+                    for id_do_pin,lista_links in _pins_dos_resultados(lista_resultados).items():
+                        link = f"{self.url_base}/pin/{id_do_pin}/"
+                        if len(dict_pin_final) >= max_img or link in dict_pin_final or id_do_pin in ignorados:
+                            continue
+
+                        #Guardando o link de imagem antes de entregar o link de pin, para o parser ja encontrar ele
+                        if id_do_pin not in self.imagens:
+                            self.imagens[id_do_pin] = lista_links[0]
+                        dict_pin_final[link] = None
+                        estagnados = 0
+                        if callback_link:
+                            dict_enviados.setdefault(prompt,set()).add(link)
+                            resultado = callback_link(prompt,link)
+                            if inspect.isawaitable(resultado):
+                                await resultado
+
+                    #A pesquisa chega ao fim quando a API para de retornar pins ou o marcador da próxima página
+                    bookmark = resposta.get("bookmark")
+                    if not lista_resultados or not bookmark or bookmark == FIM_BOOKMARK:
+                        motivo = MOTIVO_COMPLETO if len(dict_pin_final) >= max_img else MOTIVO_FIM_PAGINA if dict_pin_final else MOTIVO_SEM_IMAGENS
+                        break
+
+                atributos["paginas"] = n_paginas
+                atributos["pins"] = len(dict_pin_final)
+                atributos["motivo"] = motivo
+
+        self.logger.debug(f"[BOT-CRAWLER-API] {len(dict_pin_final)} pins coletados em {n_paginas} páginas do prompt => {prompt} - Motivo => {motivo}")
+        lista_links = list(dict_pin_final)
+        self.motivos[prompt] = motivo
+        if self.relatorio is not None:
+            self.relatorio.registra_pins(prompt,len(lista_links),motivo)
+        if callback_prompt:
+            callback_prompt(prompt,lista_links)
+        return lista_links
+
+    async def _requisita_pagina(self, session:aiohttp.ClientSession, prompt:str, bookmark:str|None) -> dict | None:
+
+        """
+        Método auxiliar assíncrono que requisita uma página da API de pesquisa.
+
+        São feitas no máximo 'TENTATIVAS_API' tentativas, com uma espera crescente entre elas. Respostas que não são JSON
+        (ex: a página de login) também contam como tentativas que falharam.
+
+        Args:
+            session (aiohttp.ClientSession): Sessão utilizada para realizar a requisição.
+
+            prompt (str): Prompt pesquisado.
+
+            bookmark (str | None): Marcador da página. Com 'None', a primeira página é requisitada.
+
+        Returns:
+            dict | None: Resposta da API, ou 'None' caso todas as tentativas falhem.
+        """
+
+        ### Variáveis ###
+
+        #Link da página
+        url = self._url_api(prompt,bookmark)
+
+        #Resposta da API
+        dados = None
+
+        ### Código ###
+
+        for tentativa in range(1,TENTATIVAS_API+1):
+            if self.relatorio is not None:
+                self.relatorio.registra_requisicao(url,tentativa)
+            with span(self.rastreador,"crawler.api_pagina",prompt=prompt,url=url,tentativa=tentativa) as atributos:
+                try:
+                    #Os cabeçalhos vão em cada requisição, ja que a sessão do 'runtime' é compartilhada com o parser e o downloader
+                    async with session.get(url,headers=CABECALHOS_API) as resp:
+                        atributos["http.status_code"] = resp.status
+                        if resp.status == 200:
+                            dados = await resp.json(content_type=None)
+                            if isinstance(dados,dict):
+                                return dados
+
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+                    self.logger.debug(f"[BOT-CRAWLER-API] {tentativa}ª tentativa de requisição da API falhou com o prompt => {prompt} - {error}")
+
+            if tentativa < TENTATIVAS_API:
+                await asyncio.sleep(ESPERA_API * tentativa)
+
+        self.logger.debug(f"[BOT-CRAWLER-API] Limite de tentativas alcançado com o prompt => {prompt}")
+        if self.relatorio is not None:
+            self.relatorio.registra_falha(url)
+        return None
+
+    def _url_api(self, prompt:str, bookmark:str|None) -> str:
+
+        """
+        Método auxiliar que monta o link de uma página da API de pesquisa de um prompt.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            bookmark (str | None): Marcador da página. Com 'None', o link é o da primeira página.
+
+        Returns:
+            str: Link da página.
+        """
+
+        ### Variáveis ###
+
+        #Opções da pesquisa, no formato esperado pela API
+        dados = {"options":{"query":prompt,"scope":"pins","page_size":TAMANHO_PAGINA_API,"bookmarks":[bookmark] if bookmark else []},"context":{}}
+
+        ### Código ###
+
+        return f"{self.url_base}{RECURSO_PESQUISA}?" + urlencode({"source_url":f"/search/pins/?q={prompt}&rs=typed",
+                                                                  "data":json.dumps(dados,separators=(",",":"))})
+
+    def _crawling_fallback(self, lista_falhas:list[str], max_img:int, callback_link, callback_prompt, dict_enviados:dict[str,set[str]]) -> dict[str,list[str]]:
+
+        """
+        Método auxiliar que pesquisa com o crawler reserva os prompts em que a API falhou.
+
+        Os links que ja tinham sido entregues ao 'callback_link' antes da falha não são entregues de novo.
+
+        Args:
+            lista_falhas (list[str]): Prompts em que a API falhou.
+
+            max_img (int): Número máximo de links coletados de cada prompt.
+
+            callback_link, callback_prompt: Os mesmos 'callbacks' do 'bot_crawler'.
+
+            dict_enviados (dict[str,set[str]]): Links ja entregues ao 'callback_link' de cada prompt.
+
+        Returns:
+            dict[str,list[str]]: Resultado do crawler reserva.
+        """
+
+        ### Variáveis ###
+
+        #Navegador do crawler reserva, criado aqui caso nenhum tenha sido recebido
+        driver = self._driver if self._driver is not None else cria_driver(self.monitor,log_rede=self.coleta_rede,endereco_depuracao=self.endereco_depuracao)
+
+        #Instancia do crawler reserva
+        c = None
+
+        ### Código ###
+
+        def envia_link(prompt:str, link:str) -> None:
+            if link not in dict_enviados.get(prompt,()):
+                callback_link(prompt,link)
+
+        c = self.fallback(driver,self.logger,lista_falhas,encerra_driver=self.encerra_driver or self._driver is None,relatorio=self.relatorio,
+                          url_base=self.url_base,rastreador=self.rastreador,pins_ignorados=self.pins_ignorados,imagens=self.imagens,
+                          prazo_prompt=self.prazo_prompt,max_rolamentos=self.max_rolamentos,max_estagnacao=self.max_estagnacao,motivos=self.motivos,
+                          coleta_rede=self.coleta_rede)
+        return c.bot_crawler(max_img,envia_link if callback_link else None,callback_prompt)
+
+
+class CrawlerPlaywrightPinterest(CrawlerAssincrono):
+
+    """
+    Implementação assíncrona do crawler para o site Pinterest, utilizando o navegador do Playwright.
+
+    Diferente do 'CrawlerPinterest', que usa o Selenium e bloqueia a 'thread' enquanto espera o navegador, este crawler
+    é executado no loop de eventos. Cada prompt é pesquisado em uma página (aba) própria do mesmo navegador, até 'paginas'
+    ao mesmo tempo, e as esperas de uma página deixam o loop livre para as outras páginas e para o parser e o downloader.
+
+    A coleta segue os mesmos passos do 'CrawlerPinterest': o coletor injetado na página ('SCRIPT_COLETOR') entrega os
+    links novos, e cada rolamento espera apenas até os primeiros pins novos aparecerem.
+
+    O Playwright é uma dependência opcional ('pip install playwright' e 'playwright install chromium').
+
+    Atributos:
+        driver (Browser | None): Navegador do Playwright. Com 'None', o crawler inicia o seu próprio navegador a cada
+                                 execução, e o encerra no fim.
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+        lista_prompt (list[str]): Lista de termos de busca que vão ser utilizados no Pinterest.
+        encerra_driver (bool): Se o navegador recebido deve ser encerrado ao fim da execução.
+        relatorio (RelatorioExecucao | None): Relatório da execução.
+        url_base (str): Endereço do site pesquisado.
+        rastreador (Rastreador | None): Rastreador da execução.
+        pins_ignorados (dict[str,set[str]]): Ids de pin de cada prompt que não devem ser coletados.
+        prazo_rolamento (float): Tempo máximo, em segundos, que o crawler espera por pins novos depois de cada rolamento.
+        observacoes_fim (int): Quantidade de rolamentos seguidos sem nenhum pin novo para considerar que a página chegou ao fim.
+        paginas (int): Quantidade de prompts pesquisados ao mesmo tempo, cada um em uma página.
+        monitor (bool): Se o navegador iniciado pelo crawler deve ficar visível. Fora do modo 'monitor', as imagens, vídeos e
+                        fontes não são baixados pelo navegador.
+        imagens_grade (bool): Se o crawler deve guardar o link da imagem de cada card da grade de pesquisa.
+        imagens (dict[str,str]): Links de imagem coletados da grade, tendo o id do pin como chave.
+        prazo_prompt, max_rolamentos, max_estagnacao: Limites do 'crawling' de cada prompt (veja o 'CrawlerPinterest').
+        motivos (dict[str,str]): Motivo de encerramento do 'crawling' de cada prompt.
+        poda (bool): Se os cards ja coletados devem ser esvaziados (veja o 'CrawlerPinterest').
+    """
+
+    def __init__(self,driver,logger:logging.Logger,lista_prompt:list[str],encerra_driver:bool=True,relatorio=None,url_base:str=URL_PINTEREST,rastreador=None,
+                 pins_ignorados:dict[str,set[str]]|None=None,prazo_rolamento:float=PRAZO_ROLAMENTO,observacoes_fim:int=OBSERVACOES_FIM,paginas:int=1,
+                 monitor:bool=False,imagens_grade:bool=False,imagens:dict[str,str]|None=None,prazo_prompt:float|None=PRAZO_PROMPT,
+                 max_rolamentos:int|None=None,max_estagnacao:int|None=ESTAGNACAO_PROMPT,motivos:dict[str,str]|None=None,poda:bool=False):
+
+        self._driver = driver
+        self.logger = logger
+        self.lista_prompt = lista_prompt
+        self.encerra_driver = encerra_driver
+        self.relatorio = relatorio
+        self.url_base = url_base.rstrip("/")
+        self.rastreador = rastreador
+        self.pins_ignorados = pins_ignorados or {}
+        self.prazo_rolamento = prazo_rolamento
+        self.observacoes_fim = observacoes_fim
+        self.poda = poda
+        self.paginas = paginas
+        self.monitor = monitor
+        self.imagens_grade = imagens_grade
+        self.imagens = imagens if imagens is not None else {}
+        self.prazo_prompt = prazo_prompt
+        self.max_rolamentos = max_rolamentos
+        self.max_estagnacao = max_estagnacao
+        self.motivos = motivos if motivos is not None else {}
+
+        #Verificando os valores passados
+        if not self.lista_prompt:
+            self.logger.info("\nNão existe nenhum prompt na lista fornecida!")
+            raise ValueError ("\nO valor do argumento 'lista_prompt' não pode ser vazio!")
+
+        if self.paginas < 1:
+            raise ValueError ("\nO valor do argumento 'paginas' precisa ser maior que zero!")
+
+        if self._driver is None and async_playwright is None:
+            raise ImportError("O 'CrawlerPlaywrightPinterest' precisa do Playwright! Instale com 'pip install playwright' e 'playwright install chromium'.")
+
+    @property
+    def driver(self):
+        return self._driver
+
+    @driver.setter
+    def driver(self, valor):
+        raise AttributeError("\nO atributo self._driver não pode ter seu valor modificado diretamente!")
+
+    def bot_crawler(self,max_img:int=10,callback_link=None,callback_prompt=None) -> dict[str:list]:
+
+        """
+        Método que executa o 'crawling' em um loop de eventos próprio, para ser usado fora de um código assíncrono.
+
+        Veja o método 'bot_crawler_async'.
+        """
+
+        return asyncio.run(self.bot_crawler_async(max_img,callback_link,callback_prompt))
+
+    async def bot_crawler_async(self,max_img:int=10,callback_link=None,callback_prompt=None) -> dict[str:list]:
+
+        """
+        Método assíncrono que executa o 'crawling' de todos os prompts, até 'paginas' ao mesmo tempo.
+
+        Args:
+            max_img(int): Número máximo de imagens que o usuário quer que o crawler colete.
+
+            callback_link(Callable[[str,str],None|Awaitable] | None): Função (ou corrotina) chamada com '(prompt, link)' para
+                                                                      cada link de pin novo coletado. Opcional.
+
+            callback_prompt(Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do
+                                                                    'crawling' de cada prompt. Opcional.
+
+        Returns:
+            dict(list): Dicionário que armazena listas contendo os links de cada pin coletado de um respectivo prompt.
+        """
+
+        ### Variáveis ###
+
+        #Semáforo que limita a quantidade de páginas abertas ao mesmo tempo
+        semaforo = asyncio.Semaphore(self.paginas)
+
+        #Links coletados de cada prompt, na ordem da lista de prompts
+        lista_resultados = []
+
+        ### Código ###
+
+        async with self._navegador() as navegador:
+            contexto = await navegador.new_context()
+            try:
+                #Perfil enxuto, como o do 'cria_driver'. O crawler só precisa dos links, não das imagens
+                if not self.monitor:
+                    await contexto.route("**/*", _bloqueia_rota)
+                lista_resultados = await asyncio.gather(*(self._crawling_prompt(contexto,semaforo,prompt,max_img,callback_link,callback_prompt)
+                                                          for prompt in self.lista_prompt))
+            finally:
+                await contexto.close()
+
+        self.logger.info("\nCaptura dos pins terminada!")
+        return {prompt:lista_links for prompt,lista_links in zip(self.lista_prompt,lista_resultados) if lista_links is not None}
+
+    @asynccontextmanager
+    async def _navegador(self):
+
+        """
+        Gerenciador de contexto assíncrono que fornece o navegador do Playwright, iniciando um caso nenhum tenha sido recebido.
+        """
+
+        if self._driver is not None:
+            try:
+                yield self._driver
+            finally:
+                if self.encerra_driver:
+                    await self._driver.close()
+            return
+
+        async with async_playwright() as playwright:
+            navegador = await playwright.chromium.launch(headless=not self.monitor)
+            try:
+                yield navegador
+            finally:
+                await navegador.close()
+
+    async def _crawling_prompt(self, contexto, semaforo:asyncio.Semaphore, prompt:str, max_img:int, callback_link, callback_prompt) -> list[str]:
+
+        """
+        Método auxiliar assíncrono que pesquisa um prompt em uma página nova, fechada no fim.
+
+        Returns:
+            list[str]: Links dos pins coletados.
+        """
+
+        async with semaforo:
+            pagina = await contexto.new_page()
+            try:
+                return await self._passos_prompt(pagina,prompt,max_img,callback_link,callback_prompt)
+            finally:
+                await pagina.close()
+
+    async def _passos_prompt(self, pagina, prompt:str, max_img:int, callback_link, callback_prompt) -> list[str]:
+
+        """
+        Método auxiliar assíncrono com os passos do 'crawling' de um único prompt, na página recebida.
+
+        Args:
+            pagina (Page): Página do Playwright.
+
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Número máximo de links coletados.
+
+            callback_link, callback_prompt: Os mesmos 'callbacks' do 'bot_crawler_async'.
+
+        Returns:
+            list[str]: Links dos pins coletados.
+        """
+
+        ### Variáveis ###
+
+        #Dicionário usado como conjunto ordenado dos links de pin coletados
+        dict_pin_final = {}
+
+        #Ids de pin do prompt que não devem ser coletados
+        ignorados = self.pins_ignorados.get(prompt,frozenset())
+
+        #Links novos entregues pelo coletor da página
+        lista_novos = []
+
+        #Quantidade de telas roladas de uma vez, e de rolamentos seguidos sem nenhum pin novo
+        viewports = 1
+        sem_crescimento = 0
+
+        #Momento de início do prompt, quantidade de rolamentos e de rolamentos seguidos sem nenhum pin novo aceito
+        inicio = time.monotonic()
+        n_rolamentos = 0
+        estagnados = 0
+
+        #Motivo do encerramento do prompt
+        motivo = MOTIVO_SEM_IMAGENS
+
+        #Link da página de pesquisa
+        url = f"{self.url_base}/search/pins/?q={prompt}&rs=typed"
+
+        ### Código ###
+
+        self.logger.info(f"\nComeçando a procurar imagens do prompt => {prompt}")
+        for tentativa in range(1,4):
+            if self.relatorio is not None:
+                self.relatorio.registra_requisicao(url,tentativa)
+            try:
+                with span(self.rastreador,"crawler.navegacao",prompt=prompt,url=url,tentativa=tentativa):
+                    await pagina.goto(url, wait_until="domcontentloaded")
+                break
+
+            except PlaywrightError:
+                self.logger.debug(f"[BOT-CRAWLER-PW] {tentativa}ª de 3 tentativas de requisição falhou com o prompt => {prompt}")
+                if tentativa == 3:
+                    if self.relatorio is not None:
+                        self.relatorio.registra_falha(url)
+                    raise
+
+        try:
+            with span(self.rastreador,"crawler.espera_pins",prompt=prompt) as atributos:
+                await pagina.wait_for_selector(SELETOR_PINS, timeout=PRAZO_PINS*1000)
+                lista_novos = await self._drena_coletor(pagina)
+                atributos["pins"] = len(lista_novos)
+
+        except PlaywrightTimeoutError:
+            #Prompt sem imagens, ou algum bloco na frente da página
+            self.logger.info(f"Nenhuma imagem apareceu para o prompt => {prompt}")
+            lista_novos = []
+
+        while True:
+            n_antes = len(dict_pin_final)
+            for link in lista_novos:
+                if len(dict_pin_final) < max_img and link and link not in dict_pin_final and id_pin(link) not in ignorados:
+                    dict_pin_final[link] = None
+                    if callback_link:
+                        resultado = callback_link(prompt,link)
+                        if inspect.isawaitable(resultado):
+                            await resultado
+            if n_rolamentos:
+                estagnados = 0 if len(dict_pin_final) > n_antes else estagnados + 1
+
+            #Nenhum pin apareceu na página
+            if not n_rolamentos and not lista_novos:
+                break
+            if len(dict_pin_final) >= max_img:
+                motivo = MOTIVO_COMPLETO
+                break
+
+            #Verificando os limites do prompt antes de rolar de novo. Chegando em um deles, ficamos com os pins ja coletados
+            motivo = motivo_limite(time.monotonic() - inicio,n_rolamentos,estagnados,self.prazo_prompt,self.max_rolamentos,self.max_estagnacao)
+            if motivo is not None:
+                self.logger.info(f"O prompt => {prompt} chegou no limite de '{motivo}'! Vamos encerrar a captura com {len(dict_pin_final)} imagens!")
+                break
+
+            #Rolando a página e esperando os pins novos. A página chegou ao fim quando varios rolamentos seguidos não revelam nada
+            if self.relatorio is not None:
+                self.relatorio.registra_rolamento(prompt)
+            with span(self.rastreador,"crawler.rolamento",prompt=prompt,viewports=viewports) as atributos:
+                lista_novos = await self._rola_pagina(pagina,prompt,viewports)
+                n_rolamentos += 1
+                sem_crescimento = 0 if lista_novos else sem_crescimento + 1
+                viewports = CrawlerPinterest._ajusta_viewports(viewports,len(lista_novos),max_img - len(dict_pin_final))
+                atributos["novos"] = len(lista_novos)
+                atributos["fim"] = sem_crescimento >= self.observacoes_fim
+            if atributos["fim"]:
+                self.logger.info(f"A página do prompt => {prompt} chegou ao fim! Vamos entao encerrar a captura com {len(dict_pin_final)} imagens!")
+                motivo = MOTIVO_FIM_PAGINA
+                break
+
+        self.logger.debug(f"[BOT-CRAWLER-PW] {len(dict_pin_final)} pins coletados do prompt => {prompt} - Motivo => {motivo}")
+        lista_links = list(dict_pin_final)
+        self.motivos[prompt] = motivo
+        if self.relatorio is not None:
+            self.relatorio.registra_pins(prompt,len(lista_links),motivo)
+        if callback_prompt:
+            callback_prompt(prompt,lista_links)
+        return lista_links
+
+    async def _drena_coletor(self, pagina) -> list[str]:
+
+        """
+        Método auxiliar assíncrono que retorna os links de pin novos registrados pelo coletor da página (veja 'CrawlerPinterest.drena_coletor').
+        """
+
+        return _separa_coleta(await pagina.evaluate(_script_playwright(SCRIPT_COLETOR),[SELETOR_PINS,self.imagens_grade,TELAS_PODA if self.poda else 0,SELETOR_CARDS]),
+                              self.imagens)
+
+    async def _rola_pagina(self, pagina, prompt:str, viewports:int) -> list[str]:
+
+        """
+        Método auxiliar assíncrono que rola a página e espera, sem bloquear o loop, até os primeiros pins novos aparecerem
+        ou o tempo 'prazo_rolamento' acabar.
+
+        Returns:
+            list[str]: Links dos pins novos revelados pelo rolamento.
+        """
+
+        ### Variáveis ###
+
+        #Momento de início da espera
+        inicio = time.monotonic()
+
+        #Links novos encontrados
+        lista_links = []
+
+        ### Código ###
+
+        await pagina.evaluate(_script_playwright(SCRIPT_ROLAMENTO),[viewports,SELETOR_PINS])
+        lista_links = await self._drena_coletor(pagina)
+        while not lista_links and time.monotonic() - inicio < self.prazo_rolamento:
+            await asyncio.sleep(INTERVALO_VERIFICACAO)
+            lista_links = await self._drena_coletor(pagina)
 
-        #Retornando booleana da comparação entre as duas
-        return scroll_anterior == scroll_atual
+        if self.relatorio is not None:
+            self.relatorio.registra_espera(prompt,time.monotonic() - inicio)
+        return lista_links
+
+
+def _callback_da_thread(callback_link, loop:asyncio.AbstractEventLoop):
+
+    """
+    Função auxiliar que adapta o 'callback_link' de um crawler assíncrono para um crawler síncrono executado em outra 'thread'
+    (ex: o crawler reserva do 'CrawlerAPIPinterest'). Um 'callback_link' que é uma corrotina é executado no 'loop', e a 'thread'
+    espera ele terminar.
+
+    Args:
+        callback_link (Callable[[str,str],None|Awaitable] | None): 'Callback' recebido pelo crawler assíncrono.
+
+        loop (asyncio.AbstractEventLoop): Loop de eventos do crawler assíncrono.
+
+    Returns:
+        Callable[[str,str],None] | None: 'Callback' síncrono.
+    """
+
+    if callback_link is None:
+        return None
+
+    def envia_link(prompt:str, link:str) -> None:
+        resultado = callback_link(prompt,link)
+        if inspect.isawaitable(resultado):
+            asyncio.run_coroutine_threadsafe(resultado,loop).result()
+
+    return envia_link
+
+
+async def _bloqueia_rota(rota) -> None:
+
+    """
+    Função auxiliar assíncrona que bloqueia as requisições de imagens, vídeos e fontes das páginas do 'CrawlerPlaywrightPinterest'.
+    """
+
+    if rota.request.resource_type in ("image", "media", "font"):
+        await rota.abort()
+    else:
+        await rota.continue_()
+
+
+def _script_playwright(script:str) -> str:
+
+    """
+    Função auxiliar que adapta um script escrito para o 'execute_script' do Selenium (que recebe os valores em 'arguments'
+    e usa 'return') para o 'evaluate' do Playwright, que recebe uma função com um único argumento.
+
+    Args:
+        script (str): Corpo do script.
+
+    Returns:
+        str: Função equivalente, que recebe a lista de valores.
+    """
+
+    return "valores => (function() {" + script + "}).apply(null, valores)"
+
+
+class CrawlerMultiProcesso(Crawler):
+
+    """
+    Implementação de um crawler que divide a lista de prompts entre vários processos, cada um com o seu próprio navegador.
+
+    A lista de prompts é dividida em 'n_workers' partes. A primeira parte é pesquisada com o navegador recebido no construtor,
+    em uma 'thread' do processo atual, e cada uma das outras partes é pesquisada por um processo novo, que cria o seu próprio
+    navegador. Os resultados de todos são juntados no mesmo dicionário 'dict[prompt, list[link]]' retornado pelo 'CrawlerPinterest',
+    mantendo a ordem original dos prompts.
+
+    Os 'callbacks' do 'bot_crawler' continuam funcionando: os processos enviam cada link e cada prompt finalizado por uma
+    'multiprocessing.Queue', e o processo principal repassa esses valores aos 'callbacks'.
+
+    Atributos:
+        driver (WebDriver): Navegador utilizado na primeira parte dos prompts.
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+        lista_prompt (list[str]): Lista de termos de busca que vão ser utilizados no Pinterest.
+        encerra_driver (bool): Se o navegador recebido deve ser encerrado ao fim do 'bot_crawler'.
+        n_workers (int): Quantidade de navegadores pesquisando ao mesmo tempo.
+        debug (bool): Se os processos devem mostrar os logs de depuração.
+        monitor (bool): Se os navegadores dos processos devem ficar visíveis.
+        relatorio (RelatorioExecucao | None): Relatório da execução. As métricas de cada processo são juntadas nele.
+        url_base (str): Endereço do site pesquisado por todos os navegadores.
+        rastreador (Rastreador | None): Rastreador da execução. Os 'spans' de cada processo são juntados nele.
+        pins_ignorados (dict[str,set[str]]): Ids de pin de cada prompt que não devem ser coletados.
+        prazo_rolamento (float): Tempo máximo, em segundos, que cada navegador espera por pins novos depois de cada rolamento.
+        coleta_rede (bool): Se os navegadores devem coletar os links de imagem pelas respostas JSON da pesquisa. Os navegadores dos
+                            processos são criados com o log de rede ativo, e o navegador recebido precisa ter sido criado da mesma forma.
+        imagens_grade (bool): Se os navegadores devem guardar o link da imagem de cada card da grade de pesquisa.
+        imagens (dict[str,str]): Links de imagem coletados pela rede ou pela grade por todos os navegadores, tendo o id do pin como chave.
+        prazo_prompt, max_rolamentos, max_estagnacao: Limites do 'crawling' de cada prompt (veja o 'CrawlerPinterest').
+        motivos (dict[str,str]): Motivo de encerramento do 'crawling' de cada prompt, de todos os navegadores.
+        poda (bool): Se os navegadores devem esvaziar os cards ja coletados (veja o 'CrawlerPinterest').
+        vigia (VigiaNavegador | None): Vigia da saúde do navegador recebido. Cada processo cria o seu próprio vigia, com os mesmos limites.
+    """
+
+    def __init__(self,driver:WebDriver,logger:logging.Logger,lista_prompt:list[str],encerra_driver:bool=True,n_workers:int=2,debug:bool=False,monitor:bool=False,relatorio=None,url_base:str=URL_PINTEREST,rastreador=None,
+                 pins_ignorados:dict[str,set[str]]|None=None,prazo_rolamento:float=PRAZO_ROLAMENTO,coleta_rede:bool=False,imagens:dict[str,str]|None=None,
+                 imagens_grade:bool=False,prazo_prompt:float|None=PRAZO_PROMPT,max_rolamentos:int|None=None,max_estagnacao:int|None=ESTAGNACAO_PROMPT,
+                 motivos:dict[str,str]|None=None,poda:bool=False,vigia:VigiaNavegador|None=None):
+
+        self._driver = driver
+        self.logger = logger
+        self.lista_prompt = lista_prompt
+        self.encerra_driver = encerra_driver
+        self.relatorio = relatorio
+        self.url_base = url_base
+        self.rastreador = rastreador
+        self.pins_ignorados = pins_ignorados or {}
+        self.prazo_rolamento = prazo_rolamento
+        self.coleta_rede = coleta_rede
+        self.imagens_grade = imagens_grade
+        self.imagens = imagens if imagens is not None else {}
+        self.prazo_prompt = prazo_prompt
+        self.max_rolamentos = max_rolamentos
+        self.max_estagnacao = max_estagnacao
+        self.motivos = motivos if motivos is not None else {}
+        self.poda = poda
+        self.vigia = vigia
+        self.n_workers = n_workers
+        self.debug = debug
+        self.monitor = monitor
+
+        #Verificando os valores passados
+        if not self.lista_prompt:
+            self.logger.info("\nNão existe nenhum prompt na lista fornecida!")
+            raise ValueError ("\nO valor do argumento 'lista_prompt' não pode ser vazio!")
+
+        if self.n_workers < 1:
+            raise ValueError ("\nO valor do argumento 'n_workers' precisa ser maior que zero!")
+
+    @property
+    def driver(self):
+        return self._driver
+    
+    @driver.setter
+    def driver(self, valor):
+        raise AttributeError("\nO atributo self._driver não pode ter seu valor modificado diretamente!")
+
+    def bot_crawler(self,max_img:int=10,callback_link=None,callback_prompt=None) -> dict[str:list]:
+
+        """
+        Método que executa o 'crawling' pelo site do Pinterest, dividindo os prompts entre vários navegadores.
+
+        Args:
+            max_img(int): Número máximo de imagens que o usuário quer que o crawler colete.
+
+            callback_link(Callable[[str,str],None] | None): Função chamada com '(prompt, link)' para cada link de pin
+                                                            novo coletado. Opcional.
+
+            callback_prompt(Callable[[str,list[str]],None] | None): Função chamada com '(prompt, lista_links)' ao fim do
+                                                                    'crawling' de cada prompt. Opcional.
+
+        Returns:
+            dict(list): Dicionário que armazena listas contendo os links de cada pin coletado de um respectivo prompt.
+
+        Raises:
+            RuntimeError: Exceção levantada quando algum dos processos falha durante o 'crawling'.
+        """
+
+        ### Variáveis ###
+
+        #Partes da lista de prompts, uma para cada navegador
+        lista_partes = []
+
+        #Contexto 'spawn' do multiprocessing, para cada processo iniciar limpo, sem herdar o navegador do processo atual
+        contexto = multiprocessing.get_context("spawn")
+
+        #Pipeline por onde os processos enviam seus resultados
+        fila = None
+
+        #Lista de processos criados
+        lista_processos = []
+
+        #Thread que pesquisa a primeira parte com o navegador recebido
+        thread = None
+
+        #Resultado da primeira parte e lista de erros de cada parte
+        dict_local = {}
+        lista_erros = []
+
+        #Dicionário final juntando os resultados de todas as partes
+        dict_lista_link = {}
+
+        #Quantidade de processos que ainda não terminaram
+        n_ativos = 0
+
+        ### Código ###
+
+        #Dividindo os prompts de forma intercalada, para cada parte ter uma quantidade parecida
+        lista_partes = [self.lista_prompt[n::self.n_workers] for n in range(self.n_workers)]
+        lista_partes = [parte for parte in lista_partes if parte]
+        self.logger.debug(f"[BOT-CRAWLER-MP] Prompts divididos em {len(lista_partes)} partes => {lista_partes}")
+        self.logger.info(f"\nPesquisando os prompts com {len(lista_partes)} navegadores ao mesmo tempo...")
+
+        #Iniciando um processo para cada parte, menos a primeira
+        fila = contexto.Queue()
+        for n,parte in enumerate(lista_partes[1:], start=1):
+            lista_processos.append(contexto.Process(target=_processo_crawler,
+                                                    args=(n,parte,max_img,self.debug,self.monitor,fila,callback_link is not None,self.url_base,self.rastreador is not None,
+                                                          {prompt:self.pins_ignorados[prompt] for prompt in parte if prompt in self.pins_ignorados},self.prazo_rolamento,
+                                                          self.coleta_rede,self.imagens_grade,(self.prazo_prompt,self.max_rolamentos,self.max_estagnacao),self.poda,
+                                                          (self.vigia.limite_rss,self.vigia.intervalo) if self.vigia is not None else None),
+                                                    daemon=True))
+        for processo in lista_processos:
+            processo.start()
+
+        #Pesquisando a primeira parte em uma thread, com o navegador recebido
+        def crawler_local():
+            try:
+                c = CrawlerPinterest(self._driver,self.logger,lista_partes[0],encerra_driver=self.encerra_driver,relatorio=self.relatorio,url_base=self.url_base,rastreador=self.rastreador,
+                                     pins_ignorados=self.pins_ignorados,prazo_rolamento=self.prazo_rolamento,coleta_rede=self.coleta_rede,imagens=self.imagens,
+                                     imagens_grade=self.imagens_grade,prazo_prompt=self.prazo_prompt,max_rolamentos=self.max_rolamentos,
+                                     max_estagnacao=self.max_estagnacao,motivos=self.motivos,poda=self.poda,vigia=self.vigia)
+                dict_local.update(c.bot_crawler(max_img,callback_link,callback_prompt))
+            except Exception as error:
+                lista_erros.append(f"Parte 0 => {error}\n{format_exc()}")
+
+        thread = threading.Thread(target=crawler_local, name="BOT-CRAWLER-MP-0")
+        thread.start()
+
+        #Repassando os valores enviados pelos processos aos 'callbacks' até todos terminarem
+        n_ativos = len(lista_processos)
+        try:
+            while n_ativos:
+                try:
+                    tipo,numero,*valores = fila.get(timeout=1)
+                except queue.Empty:
+                    #Verificando se algum processo morreu sem avisar
+                    if not any(processo.is_alive() for processo in lista_processos):
+                        lista_erros.append("Um ou mais processos do crawler terminaram de forma inesperada!")
+                        break
+                    continue
+
+                if tipo == "imagem":
+                    self.imagens[valores[0]] = valores[1]
+                elif tipo == "motivo":
+                    self.motivos[valores[0]] = valores[1]
+                elif tipo == "link" and callback_link:
+                    callback_link(*valores)
+                elif tipo == "prompt" and callback_prompt:
+                    callback_prompt(*valores)
+                elif tipo == "fim":
+                    dict_lista_link.update(valores[0])
+                    if self.relatorio is not None:
+                        self.relatorio.incorpora(valores[1])
+                    if self.rastreador is not None:
+                        self.rastreador.incorpora(valores[2])
+                    n_ativos -= 1
+                elif tipo == "erro":
+                    lista_erros.append(f"Parte {numero} => {valores[0]}")
+                    n_ativos -= 1
+        
+        finally:
+            thread.join()
+            for processo in lista_processos:
+                processo.join(timeout=5)
+                if processo.is_alive():
+                    processo.terminate()
+
+        if lista_erros:
+            self.logger.error(f"[BOT-CRAWLER-MP] Falha nos processos do crawler => {lista_erros}")
+            raise RuntimeError(f"{len(lista_erros)} parte(s) do crawling falharam! Verifique o log de erro.")
+
+        #Juntando os resultados na ordem original dos prompts
+        dict_lista_link.update(dict_local)
+        return {prompt:dict_lista_link[prompt] for prompt in self.lista_prompt if prompt in dict_lista_link}
+
+
+class _ImagensFila(dict):
+
+    """
+    Dicionário usado pelos processos do 'CrawlerMultiProcesso' (links de imagem e motivos de encerramento), que envia cada
+    valor novo ao processo principal pela pipeline 'fila', como uma mensagem do tipo 'tipo'.
+    """
+
+    def __init__(self, fila, numero:int, tipo:str="imagem"):
+        super().__init__()
+        self._fila = fila
+        self._numero = numero
+        self._tipo = tipo
+
+    def __setitem__(self, chave:str, valor:str):
+        super().__setitem__(chave, valor)
+        self._fila.put((self._tipo,self._numero,chave,valor))
+
+
+def _processo_crawler(numero:int, lista_prompt:list[str], max_img:int, debug:bool, monitor:bool, fila, envia_links:bool, url_base:str=URL_PINTEREST, rastrear:bool=False,
+                      pins_ignorados:dict[str,set[str]]|None=None, prazo_rolamento:float=PRAZO_ROLAMENTO, coleta_rede:bool=False,
+                      imagens_grade:bool=False, limites:tuple=(PRAZO_PROMPT,None,ESTAGNACAO_PROMPT),
+                      poda:bool=False, vigia:tuple|None=None) -> None:
+
+    """
+    Função executada por cada processo do 'CrawlerMultiProcesso'.
+
+    Cria um navegador próprio, realiza o 'crawling' da sua parte dos prompts com o 'CrawlerPinterest' e envia os resultados
+    pela pipeline 'fila' como tuplas '(tipo, numero, *valores)'. A mensagem final também leva o relatório e os 'spans' do processo.
+
+    Args:
+        numero (int): Número de identificação do processo.
+
+        lista_prompt (list[str]): Parte da lista de prompts pesquisada por este processo.
+
+        max_img (int): Número máximo de imagens coletadas de cada prompt.
+
+        debug (bool): Se os logs de depuração devem ser mostrados.
+
+        monitor (bool): Se o navegador deve ficar visível.
+
+        fila (multiprocessing.Queue): Pipeline por onde os resultados são enviados ao processo principal.
+
+        envia_links (bool): Se cada link coletado deve ser enviado assim que for encontrado.
+
+        url_base (str): Endereço do site pesquisado.
+
+        rastrear (bool): Se os 'spans' do processo devem ser registrados.
+
+        pins_ignorados (dict[str,set[str]] | None): Ids de pin de cada prompt que não devem ser coletados.
+
+        prazo_rolamento (float): Tempo máximo, em segundos, de espera por pins novos depois de cada rolamento.
+
+        coleta_rede (bool): Se os links de imagem devem ser coletados pelo log de rede. Cada link é enviado antes dos links de pin
+                            da mesma coleta, para o parser do processo principal ja encontrar ele.
+
+        imagens_grade (bool): Se os links de imagem devem ser coletados da grade de pesquisa, enviados da mesma forma.
+
+        limites (tuple): Limites de cada prompt '(prazo_prompt, max_rolamentos, max_estagnacao)'. O motivo de encerramento de cada
+                         prompt é enviado antes dos links dele.
+
+        poda (bool): Se os cards ja coletados devem ser esvaziados.
+
+        vigia (tuple | None): Limites '(limite_rss, intervalo)' do 'VigiaNavegador' do processo, ou 'None' para não vigiar o navegador.
+    """
+
+    #Importando aqui, ja que estes módulos só são necessários dentro dos processos
+    from navegador import cria_driver, VigiaNavegador
+    from relatorio import RelatorioExecucao
+    from rastreamento import Rastreador
+
+    ### Variáveis ###
+
+    #Logger próprio do processo
+    logger = configurando_logger(debug_mode=debug)
+
+    #Resultado do crawling
+    dict_lista_link = {}
+
+    #Relatório do processo, enviado ao processo principal no fim
+    relatorio = RelatorioExecucao(logger)
+
+    #Rastreador do processo, caso o rastreamento esteja ativado
+    rastreador = Rastreador(logger) if rastrear else None
+
+    #Navegador do processo, e o crawler que usa ele
+    driver = None
+    c = None
+
+    ### Código ###
+
+    try:
+        driver = cria_driver(monitor,log_rede=coleta_rede)
+        c = CrawlerPinterest(driver,logger,lista_prompt,relatorio=relatorio,url_base=url_base,rastreador=rastreador,
+                             pins_ignorados=pins_ignorados,prazo_rolamento=prazo_rolamento,coleta_rede=coleta_rede,imagens_grade=imagens_grade,
+                             imagens=_ImagensFila(fila,numero) if coleta_rede or imagens_grade else None,prazo_prompt=limites[0],
+                             max_rolamentos=limites[1],max_estagnacao=limites[2],motivos=_ImagensFila(fila,numero,"motivo"),poda=poda,
+                             vigia=VigiaNavegador(logger,monitor,log_rede=coleta_rede,limite_rss=vigia[0],intervalo=vigia[1]) if vigia is not None else None)
+        dict_lista_link = c.bot_crawler(max_img,
+                                        (lambda prompt,link: fila.put(("link",numero,prompt,link))) if envia_links else None,
+                                        lambda prompt,lista_links: fila.put(("prompt",numero,prompt,lista_links)))
+        fila.put(("fim",numero,dict_lista_link,relatorio.para_dict(),rastreador.spans() if rastreador is not None else []))
+
+    except BaseException as error:
+        fila.put(("erro",numero,f"{error}\n{format_exc()}"))
+
+    #O navegador é sempre do processo, então ele é encerrado mesmo quando o 'crawling' falha. Com o vigia, o navegador atual
+    #('c.driver') pode ser outro. Um navegador ja encerrado pelo 'bot_crawler' pode falhar de novo no 'quit'
+    finally:
+        for driver_processo in (driver, c.driver if c is not None and c.driver is not driver else None):
+            if driver_processo is not None:
+                with suppress(Exception):
+                    driver_processo.quit()
 
 
 #Função Main para DEBUG
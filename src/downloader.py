@@ -37,12 +37,16 @@ Notas:
 
 import asyncio
 import aiohttp
+import os
+import shutil
 from pathlib import Path
 import logging
 from utils import configurando_logger
 from pathlib import Path
 import time
 from types import MappingProxyType
+from contextlib import asynccontextmanager
+from rastreamento import span
 
 
 # Classes
@@ -66,13 +70,45 @@ class Downloader:
 
         _numero_de_produtores (int): A quantidade de 'tasks' ou 'corroutines' que teram que ser criados para lidar como o numero de requisições. Leva o mesmo 
                                      valor da quantidade de valores do atributo '_dict_lista_links'. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _session (aiohttp.ClientSession | None): Sessão HTTP compartilhada (ex: a do 'RuntimeHTTP'). Quando 'None', o downloader cria uma sessão
+                                                 própria a cada execução. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _journal (JournalExecucao | None): 'Journal' da execução. Quando fornecido, o downloader registra cada imagem salva no SO, e pula
+                                           as imagens que ja foram salvas em uma execução anterior. O atributo é encapsulado e não deve
+                                           ser modificado diretamente.
+
+        _relatorio (RelatorioExecucao | None): Relatório da execução. Quando fornecido, o downloader registra as requisições de cada 'host'
+                                               e a quantidade de imagens e bytes salvos. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _rastreador (Rastreador | None): Rastreador da execução. Quando fornecido, o downloader registra um 'span' para cada requisição de
+                                         imagem e para cada escrita no disco. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _arquivos (dict[str,dict[str,Path]]): Arquivos ja salvos de cada link de imagem, tendo o prompt como chave interna. Uma imagem que
+                                              aparece em vários prompts é requisitada e escrita apenas uma vez, e nos outros diretórios é
+                                              criado um 'hardlink' para o mesmo arquivo. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _requisicoes (dict[str,asyncio.Future]): Requisições de imagem em andamento, tendo o link como chave. As 'tasks' que precisam do mesmo
+                                                 link esperam o resultado da primeira. O atributo é encapsulado e não deve ser modificado diretamente.
     """
 
-    def __init__(self,logger:logging.Logger,dict_lista_links:dict[str,list[str]]):
+    def __init__(self,logger:logging.Logger,dict_lista_links:dict[str,list[str]],session:aiohttp.ClientSession|None=None,journal=None,relatorio=None,rastreador=None):
 
         self._dict_lista_links = dict_lista_links
         self.logger = logger
         self._numero_produtores = len(dict_lista_links)
+        self._session = session
+        self._journal = journal
+        self._relatorio = relatorio
+        self._rastreador = rastreador
+
+        #Diretório e quantidade de imagens ja salvas de cada prompt
+        self._dict_diretorios = {}
+        self._dict_n_img = {}
+
+        #Deduplicação das imagens repetidas entre prompts
+        self._arquivos = {}
+        self._requisicoes = {}
 
         #Verificando se o dicionário passado é uma instancia de 'dict' e não esta vazio
         if not self._dict_lista_links or not isinstance(self._dict_lista_links,dict):
@@ -97,6 +133,22 @@ class Downloader:
         raise AttributeError("Acesso negado! O valor de '_numero_produtores' não pode ser modificado diretamente!")
     
     #Métodos
+    @asynccontextmanager
+    async def _sessao(self):
+
+        """
+        Gerenciador de contexto assíncrono que fornece a sessão HTTP utilizada nas requisições.
+
+        Caso uma sessão compartilhada tenha sido passada no construtor, ela é fornecida e não é fechada ao fim do bloco.
+        Caso contrário, uma sessão nova é criada e fechada ao fim do bloco.
+        """
+
+        if self._session is not None:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     async def downloading(self) -> None:
 
         """
@@ -143,22 +195,23 @@ class Downloader:
         #Inicializando tarefas
         self.logger.debug(f"\n[DOWNLOADING] - Inicializando lista de 'tasks' dos métodos '_bot_requisicao' e '_bot_salva_imagens'")
         self.logger.debug(f"\n[DOWNLOADING] - QUantidade de 'Produtores' criada tendo como referencia a quantidade de elementos do atributo 'self._dict_lista_links'")
-        for prompt,lista_img in self._dict_lista_links.items():
-            n_req += 1
-            lista_task_requisicao.append(asyncio.create_task(self._bot_requisicao(n_req,prompt,lista_img,fila,evento,semaforo,lock)))
-        lista_task_salva_imagens = [asyncio.create_task(self._bot_salva_imagens(n+1,fila,evento)) for n in range(len(self._dict_lista_links))]
+        async with self._sessao() as session:
+            for prompt,lista_img in self._dict_lista_links.items():
+                n_req += 1
+                lista_task_requisicao.append(asyncio.create_task(self._bot_requisicao(n_req,prompt,lista_img,fila,evento,semaforo,lock,session)))
+            lista_task_salva_imagens = [asyncio.create_task(self._bot_salva_imagens(n+1,fila,evento)) for n in range(len(self._dict_lista_links))]
 
-        #Chamando o método 'join' para esperar fim da pipeline antes de seguir com o fluxo
-        self.logger.debug("\n[DOWNLOADING] - Método 'join' chamado para 'travar' o método 'downloading' até o fluxo da pipeline ser finalizado.")
-        await fila.join()
+            #Chamando o método 'join' para esperar fim da pipeline antes de seguir com o fluxo
+            self.logger.debug("\n[DOWNLOADING] - Método 'join' chamado para 'travar' o método 'downloading' até o fluxo da pipeline ser finalizado.")
+            await fila.join()
 
-        #Chamando a função 'gather' para esperar o fim das tarefas
-        self.logger.debug("\n[DOWNLOADING] - Função 'gather' chamada para aguardar as tarefas que ainda estão finalizando")
-        await asyncio.gather(*lista_task_salva_imagens,*lista_task_requisicao)
+            #Chamando a função 'gather' para esperar o fim das tarefas
+            self.logger.debug("\n[DOWNLOADING] - Função 'gather' chamada para aguardar as tarefas que ainda estão finalizando")
+            await asyncio.gather(*lista_task_salva_imagens,*lista_task_requisicao)
 
         self.logger.debug("[DOWNLOADING] - Bots de requisição e salvar imagens finalizados! Encerrando o programa!")
 
-    async def _bot_requisicao(self,numero_id:int,prompt:str,lista_links_img:list[str],fila:asyncio.Queue,evento:asyncio.Event, semaforo:asyncio.Semaphore, lock:asyncio.Lock) -> None:
+    async def _bot_requisicao(self,numero_id:int,prompt:str,lista_links_img:list[str],fila:asyncio.Queue,evento:asyncio.Event, semaforo:asyncio.Semaphore, lock:asyncio.Lock, session:aiohttp.ClientSession) -> None:
 
         """
         Método encapsulado assíncrono  que realiza a requisição de imagens, em formato bytes, ao servidor.
@@ -188,6 +241,8 @@ class Downloader:
 
             lock (asyncio.Lock): Instancia da classe 'Lock' do módulo 'asyncio'. Mesma utilização do 'Semaphore', porem com uma diferença, a limitação de acesso pelas 'tasks'
                                  é muito mais 'rigida', limitando o acesso apenas para 1 'task' por vez.
+
+            session (aiohttp.ClientSession): Sessão HTTP compartilhada por todas as 'tasks', reutilizando as conexões ja abertas.
             
         """
 
@@ -196,53 +251,31 @@ class Downloader:
         #Bytes de imagem armazenados
         img_io = ""
 
-        #Lista de imagens em formato bytes de cada prompt
+        #Lista de tuplas '(link, bytes)' de cada imagem do prompt
         lista_img_bytes = []
 
-        #Número limite de requisições
-        n_req = 0
+        #Links de imagem do prompt que ja foram salvos em uma execução anterior
+        set_baixadas = set()
 
         ### Código ###
 
         self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Bot inicializado!")
         self.logger.info(f"Fazendo o download das imagens do prompt => {prompt}")
 
+        #Consultando o 'journal' para pular as imagens ja salvas
+        if self._journal is not None:
+            set_baixadas = self._journal.imagens_baixadas(prompt)
+
         #Abrimos um bloco 'Semaphore' para limitar o numero de interações por 'task'
         async with semaforo:
-            async with aiohttp.ClientSession() as session:
-                #Iterando em cada link e tentando requisição dos bytes da imagem
-                for link in lista_links_img:
-
-                    #Reiniciando o numero de tentativas de requisição
-                    n_req = 0
-
-                    self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Tentando fazer a requisição do link => {link}")
-                    while True:
-                        async with session.get(link) as resp:
-                            #Verificando status da resposta
-                            if resp.status == 200:
-                                
-                                #Retirando bytes da imagem da requisição
-                                img_io = await resp.read()
-
-                                self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Requisição bem sucedida! Armazenando bytes do link => {link} - na lista 'lista_img_bytes'")
-
-                                #Atribuindo bytes da imagem a lista de bytes e passando para o proximo link
-                                lista_img_bytes.append(img_io)
-                                break
-                            
-                            else:
-                                n_req += 1
-                                self.logger.debug(f"\n[BOT_REQUISICAO - {numero_id}] - {n_req}ª Tentantiva de requisição do link => {link} falhou!")
-                                self.logger.info(f"\n Algo deu errado na requisição do link => {link} - para o prompt '{prompt}'. Vamos tentr mais uma vez....")
-                                if n_req < 3:
-                                    self.logger.debug(f"\n[BOT_REQUISICAO - {numero_id}] - Tentando novamente requisição do link => {link}")
-                                    continue
-                                
-                                else:
-                                    self.logger.debug(f"\n[BOT_REQUISICAO - {numero_id}] - Número limite de tentativas alcançado! Ignorando o link => {link} - e seguindo com o fluxo....")
-                                    self.logger.info(f"Limite de tentativas de requisição para o link => {link} do prompt '{prompt}' excedido! Vamos ignora-lo por enquanto e seguir em frente...")
-                                    break
+            #Iterando em cada link e tentando requisição dos bytes da imagem
+            for link in lista_links_img:
+                if link in set_baixadas:
+                    self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Imagem do link => {link} ja foi salva! Pulando requisição.")
+                    continue
+                img_io = await self._obtem_imagem(session,numero_id,prompt,link)
+                if img_io is not None:
+                    lista_img_bytes.append((link,img_io))
         
         #Colocando tupla de prompt com a lista de bytes na pipeline
         self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Inserindo tupla com o prompt e a lista de bytes 'lista_img_bytes' na pipeline")
@@ -258,13 +291,220 @@ class Downloader:
                 self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Todos os produtores terminaram! Ativando a flag do 'Event'.")
                 evento.set()
 
+    async def _obtem_imagem(self, session:aiohttp.ClientSession, numero_id:int, prompt:str, link:str) -> bytes | None:
+
+        """
+        Método encapsulado assíncrono que obtém os bytes de uma imagem, requisitando cada link apenas uma vez.
+
+        Caso a imagem ja tenha sido salva para outro prompt, nenhuma requisição é feita e o valor 'b""' é retornado,
+        indicando para o método '_salva_imagem' que basta criar um 'hardlink' para o arquivo existente. Caso o mesmo link
+        ja esteja sendo requisitado por outra 'task', o método espera e reutiliza o resultado dela.
+
+        Args:
+            session (aiohttp.ClientSession): Sessão utilizada para realizar a requisição.
+
+            numero_id (int): Número de identificação da 'task' que chamou o método. Utilizado nos logs.
+
+            prompt (str): 'Prompt' de pesquisa associado ao link da imagem. Utilizado nos logs.
+
+            link (str): Link da imagem.
+
+        Returns:
+            bytes | None: Imagem em formato bytes, 'b""' caso ela ja esteja salva no SO, ou 'None' caso a requisição falhe.
+        """
+
+        ### Variáveis ###
+
+        #Resultado da requisição em andamento
+        futuro = None
+
+        ### Código ###
+
+        if any(arq.exists() for arq in self._arquivos.get(link,{}).values()):
+            self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Imagem do link => {link} ja foi salva para outro prompt! Pulando requisição.")
+            return b""
+
+        if link in self._requisicoes:
+            self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Link => {link} ja esta sendo requisitado! Aguardando o resultado.")
+            return await self._requisicoes[link]
+
+        futuro = asyncio.get_running_loop().create_future()
+        self._requisicoes[link] = futuro
+        try:
+            futuro.set_result(await self._requisita_imagem(session,numero_id,prompt,link))
+
+        except Exception as error:
+            #Marcando a exceção como consumida, ja que pode não existir nenhuma 'task' esperando o resultado
+            futuro.set_exception(error)
+            futuro.exception()
+            raise
+
+        except BaseException:
+            futuro.cancel()
+            raise
+
+        finally:
+            del self._requisicoes[link]
+
+        return futuro.result()
+
+    async def _requisita_imagem(self, session:aiohttp.ClientSession, numero_id:int, prompt:str, link:str) -> bytes | None:
+
+        """
+        Método encapsulado assíncrono que realiza a requisição dos bytes de uma única imagem.
+
+        São feitas no máximo 3 tentativas de requisição. Caso nenhuma delas seja bem sucedida, o link é ignorado
+        e o valor 'None' é retornado.
+
+        Args:
+            session (aiohttp.ClientSession): Sessão utilizada para realizar a requisição.
+
+            numero_id (int): Número de identificação da 'task' que chamou o método. Utilizado nos logs.
+
+            prompt (str): 'Prompt' de pesquisa associado ao link da imagem. Utilizado nos logs.
+
+            link (str): Link da imagem.
+
+        Returns:
+            bytes | None: Imagem em formato bytes, ou 'None' caso todas as tentativas falhem.
+        """
+
+        ### Variáveis ###
+
+        #Número limite de requisições
+        n_req = 0
+
+        #Bytes da imagem
+        img_bytes = b""
+
+        ### Código ###
+
+        self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Tentando fazer a requisição do link => {link}")
+        while True:
+            if self._relatorio is not None:
+                self._relatorio.registra_requisicao(link, n_req+1)
+            with span(self._rastreador,"downloader.requisicao",prompt=prompt,url=link,tentativa=n_req+1) as atributos:
+                async with session.get(link) as resp:
+                    #Verificando status da resposta
+                    atributos["http.status_code"] = resp.status
+                    if resp.status == 200:
+                        self.logger.debug(f"[BOT_REQUISICAO - {numero_id}] Requisição bem sucedida! Retornando bytes do link => {link}")
+                        img_bytes = await resp.read()
+                        atributos["bytes"] = len(img_bytes)
+                        return img_bytes
+                
+                    else:
+                        n_req += 1
+                        self.logger.debug(f"\n[BOT_REQUISICAO - {numero_id}] - {n_req}ª Tentantiva de requisição do link => {link} falhou!")
+                        self.logger.info(f"\n Algo deu errado na requisição do link => {link} - para o prompt '{prompt}'. Vamos tentr mais uma vez....")
+                        if n_req < 3:
+                            self.logger.debug(f"\n[BOT_REQUISICAO - {numero_id}] - Tentando novamente requisição do link => {link}")
+                            continue
+                    
+                        else:
+                            self.logger.debug(f"\n[BOT_REQUISICAO - {numero_id}] - Número limite de tentativas alcançado! Ignorando o link => {link} - e seguindo com o fluxo....")
+                            self.logger.info(f"Limite de tentativas de requisição para o link => {link} do prompt '{prompt}' excedido! Vamos ignora-lo por enquanto e seguir em frente...")
+                            if self._journal is not None:
+                                self._journal.registra_falha(prompt, link_img=link)
+                            if self._relatorio is not None:
+                                self._relatorio.registra_falha(link)
+                            return None
+
+    async def downloading_streaming(self, fila_entrada:asyncio.Queue, n_bots:int=3) -> None:
+
+        """
+        Método que realiza o download de imagens conforme os links chegam pela pipeline 'fila_entrada'.
+
+        Diferente do método 'downloading', que espera o dicionário completo de links, este método consome tuplas
+        '(prompt, link_img)' uma a uma, e salva cada imagem no SO assim que seus bytes chegam. Dessa forma nenhuma
+        imagem fica acumulada em memória esperando as outras do mesmo prompt.
+
+        O fim da produção é sinalizado pelo valor 'None' dentro de 'fila_entrada'.
+
+        Args:
+            fila_entrada (asyncio.Queue): Pipeline de onde são retiradas as tuplas '(prompt, link_img)'.
+
+            n_bots (int): Quantidade de 'tasks' que realizam requisições ao mesmo tempo.
+        """
+
+        ### Variáveis ###
+
+        #Lista de tasks dos bots
+        lista_task = []
+
+        ### Código ###
+
+        self.logger.debug(f"[DOWNLOADING_STREAMING] - Método 'downloading_streaming' iniciado com {n_bots} bots!")
+
+        async with self._sessao() as session:
+            lista_task = [asyncio.create_task(self._bot_streaming(n+1,session,fila_entrada)) for n in range(n_bots)]
+            await asyncio.gather(*lista_task)
+
+        self.logger.debug("[DOWNLOADING_STREAMING] - Bots finalizados! Encerrando o método.")
+
+    async def _bot_streaming(self, numero_id:int, session:aiohttp.ClientSession, fila_entrada:asyncio.Queue) -> None:
+
+        """
+        Método encapsulado assíncrono que retira links de imagem da pipeline, realiza a requisição e salva a imagem no SO.
+
+        Args:
+            numero_id (int): Número de identificação da 'task'.
+
+            session (aiohttp.ClientSession): Sessão compartilhada pelos bots.
+
+            fila_entrada (asyncio.Queue): Pipeline de onde são retiradas as tuplas '(prompt, link_img)'.
+        """
+
+        ### Variáveis ###
+
+        #Valor retirado da pipeline
+        item = None
+
+        #Bytes da imagem
+        img_io = None
+
+        ### Código ###
+
+        self.logger.debug(f"[BOT_STREAMING - {numero_id}] Bot iniciado!")
+
+        while True:
+            item = await fila_entrada.get()
+
+            #Sinal de fim da produção. Devolvemos o 'None' para os outros bots também encerrarem
+            if item is None:
+                self.logger.debug(f"[BOT_STREAMING - {numero_id}] Sinal de fim da produção recebido! Encerrando o bot...")
+                await fila_entrada.put(None)
+                break
+
+            prompt,link = item
+
+            #Pulando as imagens que ja foram salvas em uma execução anterior
+            if self._journal is not None and link in self._journal.imagens_baixadas(prompt):
+                self.logger.debug(f"[BOT_STREAMING - {numero_id}] Imagem do link => {link} ja foi salva! Pulando requisição.")
+                continue
+
+            try:
+                img_io = await self._obtem_imagem(session,numero_id,prompt,link)
+            
+            except (aiohttp.ClientError,asyncio.TimeoutError) as error:
+                self.logger.debug(f"[BOT_STREAMING - {numero_id}] Falha na requisição do link => {link} - Exceção => {error}")
+                self.logger.info(f"Problema ao baixar a imagem do link => {link} - do prompt '{prompt}'")
+                if self._journal is not None:
+                    self._journal.registra_falha(prompt, link_img=link)
+                if self._relatorio is not None:
+                    self._relatorio.registra_falha(link)
+                continue
+
+            if img_io is not None:
+                self._salva_imagem(prompt,img_io,link)
+
     async def _bot_salva_imagens(self, numero_id:int, fila:asyncio.Queue, evento:asyncio.Event) -> None:
         
         """
         Método encapsulado assíncrono responsável por registrar as imagens no Sistema Operacional.
 
         O método retira da pipeline ('fila') o valor fornecido por um dos produtores '_bot_requisicao'. Dentro desse valor
-        se encontra uma string que é o 'prompt' que gerou as imagens no site de pesquisa, e uma lista de imagens em formato bytes.
+        se encontra uma string que é o 'prompt' que gerou as imagens no site de pesquisa, e uma lista de tuplas '(link, bytes)' de cada imagem.
 
         Ele então utiliza o método auxiliar '_salva_imagens' para fazer o registro de todas elas no SO.
         
@@ -280,7 +520,7 @@ class Downloader:
 
         ### Variáveis ###
 
-        #Valor do prompt e lista de bytes de imagens do mesmo
+        #Valor do prompt e lista de tuplas '(link, bytes)' das imagens do mesmo
         prompt = ""
         lista_bytes_img = []
 
@@ -315,7 +555,7 @@ class Downloader:
                 self.logger.debug(f"[BOT_SALVA_IMG - {numero_id}] Bot demorou demais para retirar valor da pipeline! Seguindo o fluxo...")
                 continue
     
-    def _salva_imagens(self, prompt:str, lista_bytes_img:list[str]) -> None:
+    def _salva_imagens(self, prompt:str, lista_bytes_img:list[tuple[str,bytes]]) -> None:
 
         """
         Método auxiliar que resgitra todas as imagens no Sistema Operacional
@@ -338,13 +578,119 @@ class Downloader:
         Args:
             prompt (str): 'Prompt' que esta associado a lista de imagens em formato bytes.
 
-            lista_bytes_img (list[str]): Lista de imagens JPEG em formato bytes.
+            lista_bytes_img (list[tuple[str,bytes]]): Lista de tuplas contendo o link e a imagem JPEG em formato bytes.
         
         Raises:
             (ValueError,OSError): Exceções levantandas, quado o 'prompt' utilizado para a criação de diretórios,
                                   possui algum caractére proibído para esta ação dentro do SO.
         """
 
+        ### Código ###
+
+        #Iterando valores da 'lista_bytes_img' para salvar as imagens
+        for link,img_bytes in lista_bytes_img:
+            self._salva_imagem(prompt,img_bytes,link)
+
+    def _salva_imagem(self, prompt:str, img_bytes:bytes, link:str|None=None) -> None:
+
+        """
+        Método auxiliar que registra uma única imagem no diretório do 'prompt' que a gerou.
+
+        A numeração das imagens é mantida por prompt, então chamadas sucessivas com o mesmo 'prompt'
+        geram os arquivos 'img1.jpg', 'img2.jpg', e assim por diante. A numeração continua a partir das
+        imagens que ja existem no diretório, então nenhuma imagem salva anteriormente é sobrescrita.
+
+        Quando o link ja foi salvo para outro prompt, a imagem não é escrita novamente, e sim materializada
+        no diretório do prompt atravez do método '_materializa'. Um link ja salvo para o mesmo prompt é ignorado.
+
+        Args:
+            prompt (str): 'Prompt' que esta associado a imagem.
+
+            img_bytes (bytes): Imagem JPEG em formato bytes.
+
+            link (str | None): Link de onde a imagem foi baixada. Quando fornecido, o download é registrado no 'journal'.
+        """
+
+        ### Variáveis ###
+
+        #Instancia Path do diretório do prompt
+        path = None
+
+        #Número da imagem
+        n_img = 0
+
+        #Arquivos ja salvos do link, tendo o prompt como chave
+        dict_arquivos = {}
+
+        ### Código ###
+
+        dict_arquivos = self._arquivos.setdefault(link,{}) if link is not None else {}
+        if prompt in dict_arquivos:
+            self.logger.debug(f"[SALVA_IMAGEM] Imagem do link => {link} ja foi salva para o prompt => {prompt}! Ignorando.")
+            return
+
+        path = self._diretorio_prompt(prompt)
+        n_img = self._dict_n_img.get(prompt,0) + 1
+        self._dict_n_img[prompt] = n_img
+
+        with span(self._rastreador,"downloader.escrita",prompt=prompt,url=link,arquivo=f"{path}/img{n_img}.jpg",bytes=len(img_bytes)) as atributos:
+            origem = next((arq for arq in dict_arquivos.values() if arq.exists()),None)
+            if origem is not None:
+                atributos["hardlink"] = self._materializa(origem, path / f"img{n_img}.jpg")
+                atributos["bytes"] = 0
+            else:
+                with open(f"{path}/img{n_img}.jpg","wb") as img:
+                    img.write(img_bytes)
+        dict_arquivos[prompt] = path / f"img{n_img}.jpg"
+
+        if self._relatorio is not None and origem is None:
+            self._relatorio.registra_imagem(len(img_bytes))
+
+        if self._journal is not None and link is not None:
+            self._journal.registra_download(prompt,link,str((path / f"img{n_img}.jpg").resolve()))
+
+    def _materializa(self, origem:Path, destino:Path) -> bool:
+
+        """
+        Método auxiliar que coloca no diretório de um prompt uma imagem ja salva para outro prompt.
+
+        É criado um 'hardlink' para o arquivo original, então a imagem não ocupa espaço duas vezes no disco. Caso o
+        SO ou o sistema de arquivos não suporte 'hardlinks', o arquivo é copiado.
+
+        Args:
+            origem (Path): Arquivo ja salvo da imagem.
+
+            destino (Path): Caminho do novo arquivo.
+
+        Returns:
+            bool: 'True' caso um 'hardlink' tenha sido criado, 'False' caso o arquivo tenha sido copiado.
+        """
+
+        try:
+            os.link(origem, destino)
+            return True
+
+        except OSError as error:
+            self.logger.debug(f"[SALVA_IMAGEM] Não foi possível criar o hardlink {destino} => {origem} - Exceção => {error}. Copiando o arquivo.")
+            shutil.copyfile(origem, destino)
+            return False
+
+    def _diretorio_prompt(self, prompt:str) -> Path:
+
+        """
+        Método auxiliar que cria (apenas uma vez) e retorna o diretório onde as imagens de um 'prompt' são salvas.
+
+        Args:
+            prompt (str): 'Prompt' que da nome ao diretório.
+
+        Returns:
+            Path: Caminho do diretório do prompt.
+
+        Raises:
+            (ValueError,OSError): Exceções levantandas, quado o 'prompt' utilizado para a criação de diretórios,
+                                  possui algum caractére proibído para esta ação dentro do SO.
+        """
+
         ### Variáveis ###
 
         #Instancia Path
@@ -354,11 +700,12 @@ class Downloader:
         data = ""
         hora = ""
 
-        #Número da imagem
-        n_img = 0
-
         ### Código ###
 
+        #Verificando se o diretório ja foi criado
+        if prompt in self._dict_diretorios:
+            return self._dict_diretorios[prompt]
+
         #Capturando tempo atual
         data = time.strftime(fr"%d %m %Y",time.localtime())
         hora = time.strftime(fr"%H %M %S",time.localtime())
@@ -375,12 +722,14 @@ class Downloader:
             path = Path(f"Imagens_Pinterest - {data}")
             path = path / f"Captura de Imagens {hora}"
             path.mkdir(exist_ok=True, parents=True)
-        
-        #Iterando valores da 'lista_bytes_img' para salvar as imagens
-        for img_bytes in lista_bytes_img:
-            n_img += 1
-            with open(f"{path}/img{n_img}.jpg","wb") as img:
-                img.write(img_bytes)
+
+        #Continuando a numeração a partir das imagens que ja existem no diretório
+        for arq in path.glob("img*.jpg"):
+            if arq.stem[3:].isdigit():
+                self._dict_n_img[prompt] = max(self._dict_n_img.get(prompt,0), int(arq.stem[3:]))
+
+        self._dict_diretorios[prompt] = path
+        return path
 
 
 #Função Main para Depuração
@@ -0,0 +1,343 @@
+"""
+Módulo responsável por disponibilizar o 'journal' persistente das execuções do PinScrapper.
+
+Este módulo fornece a classe `JournalExecucao`, que registra em um banco SQLite (no modo WAL) o estado
+de cada prompt e de cada pin conforme o trabalho vai sendo concluído:
+
+    - crawled: O link do pin foi coletado pelo crawler.
+    - parsed: O link da imagem do pin foi retirado da página HTML.
+    - downloaded: A imagem foi baixada e salva no SO.
+    - failed: Alguma etapa falhou para o pin, e ele sera tentado novamente na próxima execução.
+
+Caso a execução seja interrompida (queda, 'Ctrl-C'), uma nova execução com a opção '--resume' consulta
+o 'journal' e pula todo o trabalho que ja foi finalizado.
+
+Além do progresso da execução atual, o 'journal' mantém um histórico permanente de todos os pins ja baixados
+de cada prompt, com o arquivo onde a imagem foi salva. Esse histórico não é descartado entre execuções, e é
+utilizado pelo modo '--incremental' para buscar apenas pins que ainda não existem no disco.
+
+Dependências:
+    - sqlite3 (biblioteca padrão)
+
+Exemplo:
+    from journal import JournalExecucao
+
+    journal = JournalExecucao(logger, "pinscrapper_journal.db", retomar=True)
+    links = journal.links_crawled("Gato", max_img=20)
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+import sqlite3
+import threading
+import logging
+import time
+from pathlib import Path
+from utils import id_pin
+
+
+#Estados possíveis de um pin dentro do 'journal'
+ESTADO_CRAWLED = "crawled"
+ESTADO_PARSED = "parsed"
+ESTADO_DOWNLOADED = "downloaded"
+ESTADO_FAILED = "failed"
+
+
+# Classes
+
+class JournalExecucao:
+
+    """
+    Classe que implementa o 'journal' persistente de uma execução do PinScrapper.
+
+    Todas as escritas são protegidas por um 'threading.Lock', ja que o crawler pode ser executado em uma
+    'thread' separada (modo 'streaming') enquanto o parser e o downloader escrevem a partir do loop de eventos.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        caminho (str): Caminho do arquivo SQLite do 'journal'.
+
+        _conexao (sqlite3.Connection): Conexão com o banco. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _lock (threading.Lock): Lock que serializa o acesso a conexão. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        incremental (bool): Se 'True', as imagens do histórico que ainda existem no disco também contam como baixadas.
+    """
+
+    def __init__(self, logger:logging.Logger, caminho:str="pinscrapper_journal.db", retomar:bool=False, incremental:bool=False):
+
+        self.logger = logger
+        self.caminho = caminho
+        self.incremental = incremental
+        self._lock = threading.Lock()
+
+        self.logger.debug(f"[JOURNAL] Abrindo journal => {caminho} - Modo retomar => {retomar}")
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._cria_tabelas()
+
+        #Caso não seja uma retomada, o progresso de execuções anteriores é descartado
+        if not retomar:
+            self.logger.debug("[JOURNAL] Descartando o progresso das execuções anteriores.")
+            with self._lock, self._conexao:
+                self._conexao.execute("DELETE FROM pins")
+                self._conexao.execute("DELETE FROM prompts")
+
+    def _cria_tabelas(self) -> None:
+
+        """
+        Método auxiliar que cria as tabelas do 'journal' caso elas ainda não existam.
+        """
+
+        with self._lock, self._conexao:
+            self._conexao.execute("""CREATE TABLE IF NOT EXISTS prompts (
+                                        prompt TEXT PRIMARY KEY,
+                                        max_img INTEGER NOT NULL,
+                                        estado TEXT NOT NULL,
+                                        atualizado REAL NOT NULL)""")
+            self._conexao.execute("""CREATE TABLE IF NOT EXISTS pins (
+                                        prompt TEXT NOT NULL,
+                                        link_pin TEXT NOT NULL,
+                                        posicao INTEGER NOT NULL,
+                                        link_img TEXT,
+                                        estado TEXT NOT NULL,
+                                        atualizado REAL NOT NULL,
+                                        PRIMARY KEY (prompt, link_pin))""")
+            self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_pins_img ON pins (prompt, link_img)")
+            self._conexao.execute("""CREATE TABLE IF NOT EXISTS historico (
+                                        prompt TEXT NOT NULL,
+                                        pin_id TEXT NOT NULL,
+                                        link_pin TEXT NOT NULL,
+                                        link_img TEXT NOT NULL,
+                                        arquivo TEXT NOT NULL,
+                                        atualizado REAL NOT NULL,
+                                        PRIMARY KEY (prompt, pin_id))""")
+
+    def registra_pin(self, prompt:str, link_pin:str) -> None:
+
+        """
+        Método que registra um link de pin coletado pelo crawler.
+
+        Caso o pin ja exista no 'journal' (ex: em uma retomada), seu estado não é alterado.
+
+        Args:
+            prompt (str): Prompt que gerou o pin.
+
+            link_pin (str): Link do pin.
+        """
+
+        with self._lock, self._conexao:
+            self._conexao.execute("""INSERT OR IGNORE INTO pins (prompt, link_pin, posicao, estado, atualizado)
+                                     VALUES (?, ?, (SELECT COUNT(*) FROM pins WHERE prompt = ?), ?, ?)""",
+                                  (prompt, link_pin, prompt, ESTADO_CRAWLED, time.time()))
+
+    def registra_crawl(self, prompt:str, lista_links:list[str], max_img:int) -> None:
+
+        """
+        Método que registra o fim do 'crawling' de um prompt, junto com todos os links de pin coletados.
+
+        Args:
+            prompt (str): Prompt que foi pesquisado.
+
+            lista_links (list[str]): Links de pin coletados, na ordem em que foram encontrados.
+
+            max_img (int): Quantidade de imagens que foi pedida ao crawler para este prompt.
+        """
+
+        ### Variáveis ###
+
+        #Tempo atual
+        agora = time.time()
+
+        ### Código ###
+
+        with self._lock, self._conexao:
+            self._conexao.execute("DELETE FROM pins WHERE prompt = ? AND estado = ?", (prompt, ESTADO_CRAWLED))
+            self._conexao.executemany("""INSERT OR IGNORE INTO pins (prompt, link_pin, posicao, estado, atualizado)
+                                         VALUES (?, ?, ?, ?, ?)""",
+                                      [(prompt, link, posicao, ESTADO_CRAWLED, agora) for posicao,link in enumerate(lista_links)])
+            self._conexao.execute("""INSERT OR REPLACE INTO prompts (prompt, max_img, estado, atualizado)
+                                     VALUES (?, ?, ?, ?)""", (prompt, max_img, ESTADO_CRAWLED, agora))
+
+    def registra_parse(self, prompt:str, link_pin:str, link_img:str) -> None:
+
+        """
+        Método que registra o link da imagem retirado da página de um pin.
+
+        Args:
+            prompt (str): Prompt que gerou o pin.
+
+            link_pin (str): Link do pin.
+
+            link_img (str): Link da imagem retirado da página do pin.
+        """
+
+        with self._lock, self._conexao:
+            self._conexao.execute("""UPDATE pins SET link_img = ?, estado = ?, atualizado = ?
+                                     WHERE prompt = ? AND link_pin = ? AND estado != ?""",
+                                  (link_img, ESTADO_PARSED, time.time(), prompt, link_pin, ESTADO_DOWNLOADED))
+
+    def registra_download(self, prompt:str, link_img:str, arquivo:str|None=None) -> None:
+
+        """
+        Método que registra que a imagem de um link foi baixada e salva no SO.
+
+        Quando o arquivo é fornecido, os pins da imagem também entram no histórico permanente do prompt.
+
+        Args:
+            prompt (str): Prompt que gerou a imagem.
+
+            link_img (str): Link da imagem.
+
+            arquivo (str | None): Caminho do arquivo onde a imagem foi salva.
+        """
+
+        ### Variáveis ###
+
+        #Tempo atual
+        agora = time.time()
+
+        ### Código ###
+
+        with self._lock, self._conexao:
+            self._conexao.execute("UPDATE pins SET estado = ?, atualizado = ? WHERE prompt = ? AND link_img = ?",
+                                  (ESTADO_DOWNLOADED, agora, prompt, link_img))
+            if arquivo is not None:
+                self._conexao.executemany("""INSERT OR REPLACE INTO historico (prompt, pin_id, link_pin, link_img, arquivo, atualizado)
+                                             VALUES (?, ?, ?, ?, ?, ?)""",
+                                          [(prompt, id_pin(link_pin), link_pin, link_img, arquivo, agora) for (link_pin,) in
+                                           self._conexao.execute("SELECT link_pin FROM pins WHERE prompt = ? AND link_img = ?", (prompt, link_img))])
+
+    def registra_falha(self, prompt:str, link_pin:str|None=None, link_img:str|None=None) -> None:
+
+        """
+        Método que registra a falha de uma etapa para um pin, identificado pelo link do pin ou pelo link da imagem.
+
+        Pins com falha são processados novamente em uma retomada.
+
+        Args:
+            prompt (str): Prompt que gerou o pin.
+
+            link_pin (str | None): Link do pin que falhou.
+
+            link_img (str | None): Link da imagem que falhou.
+        """
+
+        with self._lock, self._conexao:
+            if link_pin is not None:
+                self._conexao.execute("UPDATE pins SET estado = ?, atualizado = ? WHERE prompt = ? AND link_pin = ?",
+                                      (ESTADO_FAILED, time.time(), prompt, link_pin))
+            if link_img is not None:
+                self._conexao.execute("UPDATE pins SET estado = ?, atualizado = ? WHERE prompt = ? AND link_img = ?",
+                                      (ESTADO_FAILED, time.time(), prompt, link_img))
+
+    def links_crawled(self, prompt:str, max_img:int) -> list[str] | None:
+
+        """
+        Método que retorna os links de pin de um prompt que ja teve seu 'crawling' finalizado.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            max_img (int): Quantidade de imagens pedida na execução atual.
+
+        Returns:
+            list[str] | None: Lista de links de pin, ou 'None' caso o prompt precise ser pesquisado novamente
+                              (nunca foi finalizado, ou foi finalizado com um 'max_img' menor).
+        """
+
+        ### Variáveis ###
+
+        #Linha da tabela 'prompts'
+        linha = None
+
+        ### Código ###
+
+        with self._lock:
+            linha = self._conexao.execute("SELECT max_img FROM prompts WHERE prompt = ? AND estado = ?",
+                                          (prompt, ESTADO_CRAWLED)).fetchone()
+            if linha is None or linha[0] < max_img:
+                return None
+
+            return [link for (link,) in self._conexao.execute("SELECT link_pin FROM pins WHERE prompt = ? ORDER BY posicao LIMIT ?",
+                                                              (prompt, max_img))]
+
+    def imagens_parseadas(self) -> dict[str,str]:
+
+        """
+        Método que retorna os links de imagem ja retirados de cada pin.
+
+        Returns:
+            dict[str,str]: Dicionário que leva o link do pin como chave e o link da imagem como valor.
+        """
+
+        with self._lock:
+            return dict(self._conexao.execute("SELECT link_pin, link_img FROM pins WHERE estado IN (?, ?)",
+                                              (ESTADO_PARSED, ESTADO_DOWNLOADED)))
+
+    def imagens_baixadas(self, prompt:str) -> set[str]:
+
+        """
+        Método que retorna os links de imagem de um prompt que ja foram baixados e salvos no SO.
+
+        Args:
+            prompt (str): Prompt que gerou as imagens.
+
+        Returns:
+            set[str]: Conjunto com os links das imagens baixadas.
+        """
+
+        ### Variáveis ###
+
+        #Links das imagens baixadas
+        set_baixadas = set()
+
+        ### Código ###
+
+        with self._lock:
+            set_baixadas = {link for (link,) in self._conexao.execute("SELECT link_img FROM pins WHERE prompt = ? AND estado = ?",
+                                                                       (prompt, ESTADO_DOWNLOADED))}
+
+        #No modo incremental, as imagens de execuções anteriores que continuam no disco também são puladas
+        if self.incremental:
+            set_baixadas.update(link_img for link_img,arquivo in self._historico(prompt) if Path(arquivo).exists())
+
+        return set_baixadas
+
+    def pins_historico(self, prompt:str) -> set[str]:
+
+        """
+        Método que retorna os ids dos pins de um prompt que ja foram baixados em alguma execução, e cuja imagem
+        ainda existe no disco.
+
+        Args:
+            prompt (str): Prompt que gerou os pins.
+
+        Returns:
+            set[str]: Conjunto com os ids dos pins.
+        """
+
+        with self._lock:
+            return {pin for pin,arquivo in self._conexao.execute("SELECT pin_id, arquivo FROM historico WHERE prompt = ?", (prompt,))
+                    if Path(arquivo).exists()}
+
+    def _historico(self, prompt:str) -> list[tuple[str,str]]:
+
+        """
+        Método auxiliar que retorna os links de imagem e os arquivos do histórico de um prompt.
+        """
+
+        with self._lock:
+            return self._conexao.execute("SELECT link_img, arquivo FROM historico WHERE prompt = ?", (prompt,)).fetchall()
+
+    def fecha(self) -> None:
+
+        """
+        Método que fecha a conexão com o banco do 'journal'.
+        """
+
+        with self._lock:
+            self._conexao.close()
@@ -0,0 +1,527 @@
+"""
+Módulo responsável por disponibilizar a criação e a verificação dos navegadores (WebDriver) utilizados pelos crawlers.
+
+Por padrão, os navegadores 'headless' usam um perfil enxuto, que bloqueia imagens, vídeos, fontes e rastreadores de
+anúncios, ja que o crawler só precisa dos links dos cards de pin.
+
+O módulo também fornece a classe 'PoolDrivers', um pool de navegadores reutilizáveis que podem ser emprestados a
+várias 'threads' ao mesmo tempo. Navegadores que param de responder são substituídos automaticamente.
+
+O navegador também pode ser um Chrome ja aberto e com o 'cache' aquecido, conectado pelo endereço de depuração
+remota dele, e que continua aberto depois da execução.
+
+A classe 'VigiaNavegador' acompanha a saúde de um navegador durante pesquisas longas (se ele ainda responde e quanta
+memória ele usa), e cria um navegador novo, com as mesmas opções, no lugar de um navegador degradado.
+
+Dependências:
+    - selenium
+
+Exemplo:
+    from navegador import cria_driver, PoolDrivers
+
+    driver = cria_driver(monitor=False)
+
+    pool = PoolDrivers(logger, tamanho=3, drivers=[driver])
+    with pool.empresta() as driver:
+        driver.get("https://br.pinterest.com")
+    pool.encerra()
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+import urllib3
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+
+
+#Padrões de URL bloqueados no perfil enxuto: imagens, vídeos, fontes e rastreadores de anúncios
+URLS_BLOQUEADAS = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+                   "*.mp4", "*.webm", "*.m3u8", "*.m4s", "*v1.pinimg.com/videos*",
+                   "*.woff", "*.woff2", "*.ttf", "*.otf",
+                   "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*", "*google-analytics.com*",
+                   "*connect.facebook.net*", "*ct.pinterest.com*"]
+
+#Navegadores com o bloqueio de recursos ativo. Usado para aplicar o bloqueio também nas abas novas
+_drivers_enxutos = weakref.WeakSet()
+
+#Diretório com as informações dos processos do SO (Linux). Sem ele, a memória do navegador não é medida
+CAMINHO_PROC = "/proc"
+
+#Limite padrão de memória (RSS), em MB, do navegador, e intervalo padrão, em segundos, entre as verificações do 'VigiaNavegador'
+LIMITE_RSS = 2048.0
+INTERVALO_VIGIA = 30.0
+
+#Motivos para um navegador ser considerado degradado pelo 'VigiaNavegador'
+DEGRADADO_SEM_RESPOSTA = "sem_resposta"
+DEGRADADO_MEMORIA = "memoria"
+
+
+class NavegadorDegradado(WebDriverException):
+
+    """
+    Exceção levantada quando o 'VigiaNavegador' encontra um navegador degradado. O motivo ('DEGRADADO_*') fica em 'msg'.
+
+    Por ser uma 'WebDriverException', é tratada da mesma forma que uma falha do navegador.
+    """
+
+
+def cria_driver(monitor:bool=False, enxuto:bool|None=None, log_rede:bool=False, endereco_depuracao:str|None=None) -> WebDriver:
+
+    """
+    Função que cria e configura o navegador (Chrome) utilizado pelo crawler.
+
+    Args:
+        monitor (bool): Caso 'True', o navegador fica visível durante o 'crawling'. Caso 'False', ele é
+                        executado no modo 'headless'.
+
+        enxuto (bool | None): Se o navegador deve bloquear imagens, vídeos, fontes e rastreadores de anúncios. Por
+                              padrão ('None') o bloqueio fica ativo no modo 'headless' e desativado no modo 'monitor',
+                              para a página continuar visível normalmente.
+
+        log_rede (bool): Se o navegador deve registrar os eventos de rede no log 'performance', usado pelo crawler para ler
+                         as respostas JSON da pesquisa.
+
+        endereco_depuracao (str | None): Endereço 'host:porta' da depuração remota de um Chrome ja aberto (iniciado com
+                                         '--remote-debugging-port'). O 'chromedriver' se conecta a esse navegador no lugar
+                                         de iniciar um novo, aproveitando o 'cache' HTTP e os 'cookies' dele, e o 'quit'
+                                         apenas desconecta o 'chromedriver', deixando o navegador aberto. As opções de linha
+                                         de comando (ex: 'headless') não valem para um navegador ja aberto, então o perfil
+                                         enxuto fica apenas com o bloqueio do DevTools.
+
+    Returns:
+        WebDriver: Instancia do navegador configurada.
+    """
+
+    ### Variáveis ###
+
+    #Instancia da classe Options do módulo selenium.webdriver.chrome
+    options = None
+
+    #Instancia do navegador
+    driver = None
+
+    ### Código ###
+
+    if enxuto is None:
+        enxuto = not monitor
+
+    options = ChromeOptions()
+
+    #Navegador ja aberto. Apenas o bloqueio do DevTools e o log de rede são aplicados a ele
+    if endereco_depuracao:
+        options.debugger_address = endereco_depuracao
+        if log_rede:
+            options.set_capability("goog:loggingPrefs", {"performance":"ALL"})
+        driver = webdriver.Chrome(options=options)
+        if enxuto:
+            bloqueia_recursos(driver)
+        return driver
+
+    #Evitando que o navegador congele as abas em segundo plano, ja que o crawler pode pesquisar um prompt em cada aba
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+
+    if not monitor:
+        options.add_argument("--headless")
+
+    #Perfil enxuto. As imagens são bloqueadas pelas preferências do Chrome, e o resto pelo DevTools depois da criação
+    if enxuto:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-remote-fonts")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        options.add_argument("--mute-audio")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images":2})
+
+    #Log de rede. Apenas os eventos de rede são registrados, para o log não crescer com os eventos de página
+    if log_rede:
+        options.set_capability("goog:loggingPrefs", {"performance":"ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork":True, "enablePage":False})
+
+    driver = webdriver.Chrome(options=options)
+    if enxuto:
+        bloqueia_recursos(driver)
+    return driver
+
+
+def bloqueia_recursos(driver:WebDriver) -> None:
+
+    """
+    Função que bloqueia, pelo DevTools (CDP), as requisições da aba atual que seguem os padrões de 'URLS_BLOQUEADAS'.
+
+    O bloqueio do DevTools vale apenas para a aba onde ele foi aplicado, então a função deve ser chamada de novo
+    em cada aba nova de um navegador enxuto (veja a função 'bloqueio_ativo').
+
+    Args:
+        driver (WebDriver): Instancia do navegador, na aba que deve ser bloqueada.
+    """
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls":URLS_BLOQUEADAS})
+        _drivers_enxutos.add(driver)
+
+    except (AttributeError, WebDriverException):
+        #Navegadores sem suporte ao DevTools continuam apenas com o bloqueio das preferências
+        pass
+
+
+def bloqueio_ativo(driver:WebDriver) -> bool:
+
+    """
+    Função que verifica se o bloqueio de recursos foi aplicado ao navegador.
+
+    Args:
+        driver (WebDriver): Instancia do navegador.
+
+    Returns:
+        bool: 'True' caso o navegador tenha sido criado com o perfil enxuto.
+    """
+
+    return driver in _drivers_enxutos
+
+
+def driver_ativo(driver:WebDriver) -> bool:
+
+    """
+    Função que verifica se o navegador ainda esta respondendo.
+
+    Args:
+        driver (WebDriver): Instancia do navegador.
+
+    Returns:
+        bool: 'True' caso o navegador responda a um comando simples, 'False' caso contrário.
+    """
+
+    try:
+        driver.execute_script("return 1;")
+        return True
+
+    #Com o processo do 'chromedriver' morto, a falha chega como um erro de conexão do 'urllib3'
+    except (WebDriverException, urllib3.exceptions.HTTPError):
+        return False
+
+
+def rss_navegador(driver:WebDriver) -> float | None:
+
+    """
+    Função que mede a memória (RSS), em MB, usada pelo navegador: o processo do 'chromedriver' e todos os processos
+    criados por ele (o Chrome e os processos de cada aba).
+
+    O valor é aproximado, ja que as páginas de memória compartilhadas entre os processos são somadas mais de uma vez,
+    mas é suficiente para perceber um navegador que não para de crescer.
+
+    Args:
+        driver (WebDriver): Instancia do navegador.
+
+    Returns:
+        float | None: Memória usada, em MB, ou 'None' caso ela não possa ser medida (ex: SO sem o '/proc', ou um navegador
+                      remoto, sem processo local).
+    """
+
+    ### Variáveis ###
+
+    #Processo do 'chromedriver'
+    pid = getattr(getattr(getattr(driver,"service",None),"process",None),"pid",None)
+
+    #Processos filhos de cada processo do SO
+    dict_filhos = {}
+
+    #Processos que ainda precisam ser somados, e o total de bytes
+    lista_pendentes = []
+    total = 0
+
+    ### Código ###
+
+    if pid is None or not os.path.isdir(CAMINHO_PROC):
+        return None
+
+    for nome in os.listdir(CAMINHO_PROC):
+        if not nome.isdigit():
+            continue
+        try:
+            with open(os.path.join(CAMINHO_PROC,nome,"stat"), encoding="utf-8") as arquivo:
+                #O nome do processo fica entre parenteses e pode ter espaços. O PID do pai é o segundo campo depois dele
+                ppid = int(arquivo.read().rsplit(")",1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        dict_filhos.setdefault(ppid,[]).append(int(nome))
+
+    lista_pendentes = [pid]
+    while lista_pendentes:
+        atual = lista_pendentes.pop()
+        try:
+            with open(os.path.join(CAMINHO_PROC,str(atual),"statm"), encoding="utf-8") as arquivo:
+                total += int(arquivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            pass
+        lista_pendentes.extend(dict_filhos.get(atual,[]))
+
+    return total / 2**20
+
+
+# Classes
+
+class VigiaNavegador:
+
+    """
+    Classe que acompanha a saúde do navegador durante o 'crawling', e cria um navegador novo no lugar de um degradado.
+
+    A cada 'intervalo' segundos o método 'verifica' confere se o navegador ainda responde ('driver_ativo') e se a memória
+    dele ('rss_navegador') passou de 'limite_rss'. O crawler chama o 'verifica' entre os passos de cada prompt, e ao
+    encontrar um navegador degradado (ou ao receber uma falha do navegador), troca ele pelo navegador do método 'recicla'
+    e continua o prompt atual.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        monitor (bool): Se os navegadores novos devem ficar visíveis.
+
+        log_rede (bool): Se os navegadores novos devem registrar os eventos de rede (veja 'cria_driver').
+
+        limite_rss (float | None): Memória máxima, em MB, do navegador. 'None' desativa a verificação de memória, o que sempre
+                                   acontece com 'endereco_depuracao', ja que o Chrome conectado não é um processo do 'chromedriver'.
+
+        endereco_depuracao (str | None): Endereço de depuração remota do Chrome ja aberto usado pelo crawler (veja 'cria_driver').
+                                         O navegador é reconectado a esse endereço, no lugar de um navegador novo ser iniciado.
+
+        intervalo (float): Tempo mínimo, em segundos, entre duas verificações.
+
+        reinicios (int): Quantidade de navegadores trocados.
+
+        _ultima (float): Momento da última verificação. O atributo é encapsulado e não deve ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger, monitor:bool=False, log_rede:bool=False, limite_rss:float|None=LIMITE_RSS, intervalo:float=INTERVALO_VIGIA,
+                 endereco_depuracao:str|None=None):
+
+        self.logger = logger
+        self.monitor = monitor
+        self.log_rede = log_rede
+        self.limite_rss = limite_rss if not endereco_depuracao else None
+        self.endereco_depuracao = endereco_depuracao
+        self.intervalo = intervalo
+        self.reinicios = 0
+        self._ultima = time.monotonic()
+
+    def verifica(self, driver:WebDriver) -> str | None:
+
+        """
+        Método que verifica a saúde do navegador, caso a última verificação tenha sido a mais de 'intervalo' segundos.
+
+        Args:
+            driver (WebDriver): Instancia do navegador.
+
+        Returns:
+            str | None: Motivo do navegador estar degradado ('DEGRADADO_SEM_RESPOSTA' ou 'DEGRADADO_MEMORIA'), ou 'None'.
+        """
+
+        ### Variáveis ###
+
+        #Memória usada pelo navegador
+        rss = None
+
+        ### Código ###
+
+        if time.monotonic() - self._ultima < self.intervalo:
+            return None
+        self._ultima = time.monotonic()
+
+        if not driver_ativo(driver):
+            return DEGRADADO_SEM_RESPOSTA
+
+        if self.limite_rss is not None:
+            rss = rss_navegador(driver)
+            self.logger.debug(f"[VIGIA] Memória do navegador => {rss if rss is None else round(rss)} MB - Limite => {self.limite_rss} MB")
+            if rss is not None and rss > self.limite_rss:
+                return DEGRADADO_MEMORIA
+
+        return None
+
+    def recicla(self, driver:WebDriver) -> WebDriver:
+
+        """
+        Método que encerra o navegador degradado e cria um novo, com as mesmas opções.
+
+        Args:
+            driver (WebDriver): Navegador degradado.
+
+        Returns:
+            WebDriver: Navegador novo.
+        """
+
+        self.logger.debug(f"[VIGIA] Trocando o navegador degradado por um novo ({self.reinicios+1}ª troca).")
+        try:
+            driver.quit()
+        except Exception:
+            #Um navegador que travou ou caiu pode falhar de várias formas ao ser encerrado
+            pass
+
+        self.reinicios += 1
+        self._ultima = time.monotonic()
+        return cria_driver(self.monitor, log_rede=self.log_rede, endereco_depuracao=self.endereco_depuracao)
+
+
+class PoolDrivers:
+
+    """
+    Classe que mantém um pool de navegadores reutilizáveis, emprestados para uma 'thread' de cada vez.
+
+    Os navegadores são criados apenas quando necessário, até o limite 'tamanho'. Cada navegador é verificado com a
+    função 'driver_ativo' antes de ser emprestado, e caso tenha parado de responder, é encerrado e substituído por um novo.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        tamanho (int): Quantidade máxima de navegadores do pool.
+
+        monitor (bool): Se os navegadores criados pelo pool devem ficar visíveis.
+
+        log_rede (bool): Se os navegadores criados pelo pool devem registrar os eventos de rede (veja 'cria_driver').
+
+        endereco_depuracao (str | None): Endereço de depuração remota de um Chrome ja aberto, ao qual os navegadores do pool são
+                                         conectados (veja 'cria_driver'). Todos eles compartilham o mesmo navegador.
+
+        _livres (queue.Queue): Navegadores que não estão emprestados. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _drivers (list[WebDriver]): Todos os navegadores do pool. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _lock (threading.Lock): Lock que protege a criação e a substituição dos navegadores. O atributo é encapsulado e não deve
+                                ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger, tamanho:int=2, monitor:bool=False, drivers:list[WebDriver]|None=None, log_rede:bool=False,
+                 endereco_depuracao:str|None=None):
+
+        self.logger = logger
+        self.tamanho = tamanho
+        self.monitor = monitor
+        self.log_rede = log_rede
+        self.endereco_depuracao = endereco_depuracao
+
+        self._livres = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+        if tamanho < 1:
+            raise ValueError("O valor do argumento 'tamanho' deve ser maior que zero!")
+
+        #Navegadores ja criados (ex: o navegador do 'main') entram no pool como livres
+        for driver in (drivers or [])[:tamanho]:
+            self._drivers.append(driver)
+            self._livres.put(driver)
+
+    @contextmanager
+    def empresta(self):
+
+        """
+        Gerenciador de contexto que empresta um navegador do pool, devolvendo ele no fim do bloco.
+
+        Caso todos os navegadores estejam emprestados e o pool ja esteja cheio, espera até algum ser devolvido.
+
+        Yields:
+            WebDriver: Navegador emprestado, ja verificado.
+        """
+
+        ### Variáveis ###
+
+        #Navegador emprestado
+        driver = None
+
+        ### Código ###
+
+        driver = self._pega()
+        try:
+            yield driver
+        finally:
+            self._livres.put(driver)
+
+    def _pega(self) -> WebDriver:
+
+        """
+        Método auxiliar que retira um navegador livre do pool, criando um novo caso ainda exista espaço.
+
+        Returns:
+            WebDriver: Navegador que esta respondendo.
+        """
+
+        ### Variáveis ###
+
+        #Navegador retirado
+        driver = None
+
+        ### Código ###
+
+        try:
+            driver = self._livres.get_nowait()
+
+        except queue.Empty:
+            with self._lock:
+                if len(self._drivers) < self.tamanho:
+                    self.logger.debug(f"[POOL] Criando o navegador {len(self._drivers)+1} de {self.tamanho}.")
+                    driver = cria_driver(self.monitor, log_rede=self.log_rede, endereco_depuracao=self.endereco_depuracao)
+                    self._drivers.append(driver)
+                    return driver
+            driver = self._livres.get()
+
+        if not driver_ativo(driver):
+            driver = self._substitui(driver)
+        return driver
+
+    def _substitui(self, driver:WebDriver) -> WebDriver:
+
+        """
+        Método auxiliar que encerra um navegador que parou de responder e coloca um novo no lugar dele.
+
+        Args:
+            driver (WebDriver): Navegador que parou de responder.
+
+        Returns:
+            WebDriver: Navegador novo.
+        """
+
+        ### Variáveis ###
+
+        #Navegador novo
+        novo = None
+
+        ### Código ###
+
+        self.logger.debug("[POOL] Um navegador parou de responder! Substituindo por um novo.")
+        try:
+            driver.quit()
+        except (WebDriverException, urllib3.exceptions.HTTPError):
+            pass
+
+        novo = cria_driver(self.monitor, log_rede=self.log_rede, endereco_depuracao=self.endereco_depuracao)
+        with self._lock:
+            self._drivers[self._drivers.index(driver)] = novo
+        return novo
+
+    def encerra(self) -> None:
+
+        """
+        Método que encerra todos os navegadores do pool.
+        """
+
+        with self._lock:
+            self.logger.debug(f"[POOL] Encerrando {len(self._drivers)} navegadores.")
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except (WebDriverException, urllib3.exceptions.HTTPError):
+                    pass
+            self._drivers = []
+            self._livres = queue.Queue()
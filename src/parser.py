@@ -35,6 +35,9 @@ import logging
 from utils import configurando_logger, salva_pagina_html
 from traceback import format_exc
 from types import MappingProxyType
+from contextlib import asynccontextmanager
+from rastreamento import span
+from utils import id_pin
 
 
 #Classe Abstrata
@@ -88,14 +91,43 @@ class ParserHTMLPinterest(ParserHTML):
         _numero_de_produtores (int): A quantidade de 'tasks' ou 'corroutines' que teram que ser criados para lidar como o numero de requisições.
                                     leva o mesmo valor da quantidade de valores do atributo '_dict_links_html'. O atributo é encapsulado e não deve ser modificado 
                                     diretamente.
+
+        _session (aiohttp.ClientSession | None): Sessão HTTP compartilhada (ex: a do 'RuntimeHTTP'). Quando 'None', o parser cria uma sessão
+                                                 própria a cada execução. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _journal (JournalExecucao | None): 'Journal' da execução. Quando fornecido, o parser registra cada link de imagem retirado, e
+                                           pula os pins que ja tiveram sua imagem retirada em uma execução anterior. O atributo é encapsulado
+                                           e não deve ser modificado diretamente.
+
+        _imgs_conhecidas (dict[str,str]): Links de imagem ja conhecidos, tendo o id do pin como chave. Pins presentes nele não são requisitados,
+                                          então um pin que aparece em vários prompts tem sua página requisitada e analisada apenas uma vez.
+                                          Pode ser fornecido pelo argumento 'imgs_conhecidas' e compartilhado com o crawler, que guarda nele
+                                          os links de imagem coletados pela rede. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _pendentes (dict[str,asyncio.Future]): Pins sendo requisitados no momento pelo modo 'streaming', tendo o id do pin como chave. Os bots
+                                               que recebem o mesmo pin esperam o resultado do primeiro. O atributo é encapsulado e não deve
+                                               ser modificado diretamente.
+
+        _relatorio (RelatorioExecucao | None): Relatório da execução. Quando fornecido, o parser registra as requisições, novas tentativas
+                                               e falhas de cada 'host'. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _rastreador (Rastreador | None): Rastreador da execução. Quando fornecido, o parser registra um 'span' para cada requisição de página
+                                         e para cada 'parsing' de HTML. O atributo é encapsulado e não deve ser modificado diretamente.
         
     """
 
-    def __init__(self, dict_links_html:dict[str,str], logger:logging.Logger):
+    def __init__(self, dict_links_html:dict[str,str], logger:logging.Logger, session:aiohttp.ClientSession|None=None, journal=None, relatorio=None, rastreador=None,
+                 imgs_conhecidas:dict[str,str]|None=None):
 
         self._dict_links_html = dict_links_html
         self._dict_links_result = []
         self.logger = logger
+        self._session = session
+        self._journal = journal
+        self._relatorio = relatorio
+        self._rastreador = rastreador
+        self._imgs_conhecidas = imgs_conhecidas if imgs_conhecidas is not None else {}
+        self._pendentes = {}
 
         #A quantidade de produtores que tera que ser criada para lidar com a requisição
         self._numero_produtores = len(dict_links_html)
@@ -133,6 +165,22 @@ class ParserHTMLPinterest(ParserHTML):
     def numero_produtores(self,valor):
         raise AttributeError("Acesso Negado! O atributo '_numero_produtores' não pode ser modificado diretamente!")
     
+    @asynccontextmanager
+    async def _sessao(self):
+
+        """
+        Gerenciador de contexto assíncrono que fornece a sessão HTTP utilizada nas requisições.
+
+        Caso uma sessão compartilhada tenha sido passada no construtor, ela é fornecida e não é fechada ao fim do bloco.
+        Caso contrário, uma sessão nova é criada e fechada ao fim do bloco.
+        """
+
+        if self._session is not None:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     async def parsing(self) -> dict[str,list[str]]:
 
         """
@@ -178,10 +226,28 @@ class ParserHTMLPinterest(ParserHTML):
         #Instancia 'Semaphore' para limitar o numero de conexões
         semaforo = None
 
+        #Ids dos pins que ja tem uma requisição agendada, em qualquer prompt
+        set_agendados = set()
+
+        #Links de pin que cada prompt vai requisitar
+        dict_requisitados = {}
+
         ### Código ###
 
         self.logger.debug(f"\n[PARSING] Método 'parsing' da classe 'ParserHTMLPinterest' iniciado!")
 
+        #Separando os pins que precisam de requisição. Pins com a imagem ja conhecida, ou que ja foram agendados
+        #por outro prompt, não são requisitados novamente
+        self._carrega_imgs_conhecidas()
+        for prompt,lista in self._dict_links_html.items():
+            dict_requisitados[prompt] = []
+            for link in lista:
+                if id_pin(link) in self._imgs_conhecidas or id_pin(link) in set_agendados:
+                    continue
+                set_agendados.add(id_pin(link))
+                dict_requisitados[prompt].append(link)
+        self.logger.debug(f"[PARSING] {sum(len(lista) for lista in self._dict_links_html.values()) - len(set_agendados)} pins repetidos ou ja conhecidos não serão requisitados.")
+
         #Iniciando instancias que seram utilizadas
         fila = asyncio.Queue()
         evento = asyncio.Event()
@@ -190,29 +256,50 @@ class ParserHTMLPinterest(ParserHTML):
         #Iniciando tarefas de requisição e parsing
         self.logger.debug("\n[PARSING] Iniciando tarefas de requisição e parsing das paginas html coletadas!")
         self.logger.debug(f"\n[PARSING] Valor da quantidade de produtores no atributo 'self._numero_produtores' => {self._numero_produtores}")
-        for prompt,lista in self._dict_links_html.items():
-            n_req += 1
-            lista_task_req.append(asyncio.create_task(self._bot_requisicao(n_req,prompt,lista,fila,evento,semaforo)))
-        
-        lista_task_parse = [asyncio.create_task(self._bot_parser(n+1, fila, evento)) for n in range(len(self._dict_links_html))]
+        async with self._sessao() as session:
+            for prompt,lista in dict_requisitados.items():
+                n_req += 1
+                lista_task_req.append(asyncio.create_task(self._bot_requisicao(n_req,prompt,lista,fila,evento,semaforo,session)))
+            
+            lista_task_parse = [asyncio.create_task(self._bot_parser(n+1, fila, evento)) for n in range(len(self._dict_links_html))]
+
+            #Iniciando método 'join' da 'Queue' para interromper a execução do método até o fluxo da pipeline terminar
+            await fila.join()
 
-        #Iniciando método 'join' da 'Queue' para interromper a execução do método até o fluxo da pipeline terminar
-        await fila.join()
+            #Método 'asyncio.gather' para esperar todas as tarefas terminarem
+            await asyncio.gather(*lista_task_req,*lista_task_parse)
 
-        #Método 'asyncio.gather' para esperar todas as tarefas terminarem
-        await asyncio.gather(*lista_task_req,*lista_task_parse)
+        #Montando o resultado de cada prompt na ordem original dos pins, incluindo os pins que foram requisitados por outro prompt
+        self._dict_links_result = []
+        for prompt,lista in self._dict_links_html.items():
+            self._dict_links_result.append((prompt,[self._imgs_conhecidas[id_pin(link)] for link in lista if id_pin(link) in self._imgs_conhecidas]))
+            if self._journal is not None:
+                set_requisitados = set(dict_requisitados[prompt])
+                for link in lista:
+                    if link not in set_requisitados and id_pin(link) in self._imgs_conhecidas:
+                        self._journal.registra_parse(prompt, link, self._imgs_conhecidas[id_pin(link)])
 
         self.logger.debug("[PARSING] Bots de requisição e parsing finalizados! Encerrando o programa e retornando dicionario contendo as listas com todos os links de imagens")
         return dict(self._dict_links_result)
 
-    async def _bot_requisicao(self,numero:int, prompt:str, lista_links_pin:list[str], fila:asyncio.Queue, evento:asyncio.Event, semaforo:asyncio.Semaphore) -> None:
+    def _carrega_imgs_conhecidas(self) -> None:
+
+        """
+        Método auxiliar que carrega, do 'journal', os links de imagem ja retirados em execuções anteriores.
+        """
+
+        if self._journal is not None:
+            self._imgs_conhecidas.update((id_pin(link),link_img) for link,link_img in self._journal.imagens_parseadas().items())
+            self.logger.debug(f"[PARSING] {len(self._imgs_conhecidas)} links de imagem ja conhecidos carregados do journal.")
+
+    async def _bot_requisicao(self,numero:int, prompt:str, lista_links_pin:list[str], fila:asyncio.Queue, evento:asyncio.Event, semaforo:asyncio.Semaphore, session:aiohttp.ClientSession) -> None:
 
         """
         Método assíncrono que executa a requisição de paǵinas HTML.
 
         O método realiza a requisição das paginas HTML dos links da lista que esta atribuida ao argumento 'lista_links_pin'.
-        Esssas paginas sera colocadas novamente em uma lista, e esta lista ira ser inserida em uma tupla, junto ao valor do argumento
-        prompt. Essa tupla entao é inserida na pipeline do argumento 'fila'.
+        Esssas paginas sera colocadas novamente em uma lista, como tuplas '(link_pin, pagina_html)', e esta lista ira ser inserida em uma
+        tupla, junto ao valor do argumento prompt. Essa tupla entao é inserida na pipeline do argumento 'fila'.
 
         O processo descrito acima é todo o fluxo de trabalho desse método assíncrono. 
         
@@ -238,17 +325,16 @@ class ParserHTMLPinterest(ParserHTML):
                                           dentro da lógica interna do método por diferentes 'tasks'. No caso o bloco limitado é o de requisição da página HTML
                                           ao servidor do Pinterest.
 
+            session (aiohttp.ClientSession): Sessão HTTP compartilhada por todas as 'tasks', reutilizando as conexões ja abertas.
+
         """
 
         ### Variáveis ###
 
-        #Numero de tentativas de requisição
-        n_req = 0
-
         #Instancia 'Lock' para verificaçao filtrada do valor de 'self.numero_produtores'
         lock = asyncio.Lock()
 
-        #Lista de páginas html contendo o link de cada imagem
+        #Lista de tuplas '(link_pin, pagina_html)' contendo o link de cada imagem
         lista_html_img = []
 
         #Variável que armazena Página html capturada em formato de string
@@ -262,35 +348,12 @@ class ParserHTMLPinterest(ParserHTML):
         #Iniciando a iteração dos links de cada pin para realizar a requisição da pagina HTML
         for link in lista_links_pin:
             
-            #Reiniciando contador 'r_req' para uma nova tentativa de requisição
-            n_req = 0
-
             #Iniciando bloco de requisição com limite de 3 'tasks' por vez
             self.logger.debug(f"[BOT_REQ - {numero}] Iniciando requisição do link => {link}")
             async with semaforo:
-                async with aiohttp.ClientSession() as session:
-                    #Iniciando as tentativas de requisição
-                    while True:
-
-                        #Incrementando valor do contador, indicando mais uma tentativa de requisição
-                        n_req +=1 
-
-                        #Começando requisição
-                        self.logger.debug(f"[BOT_REQ - {numero}] {n_req}ª tentativa de requisição...")
-                        async with session.get(link, max_field_size=16384) as resp:
-                            if resp.status == 200:
-                                self.logger.debug(f"[BOT_REQ - {numero}] Requisição do link => {link} - bem sucedida! Capturando página HTML do link => {link}")
-                                html = await resp.text()
-                                lista_html_img.append(html)
-                                self.logger.debug(f"[BOT_REQ - {numero}] - Página HTML do link => {link} capturada! encerrando loop de requisição.")
-                                break
-                        
-                            else:
-                                if n_req == 3:
-                                    self.logger.debug(f"[BOT_REQ - {numero}] {n_req}ª tentativa de requisição!")
-                                    self.logger.debug(f"[BOT_REQ - {numero}] Limite excedido! Ignorando link => {link} e seguindo o fluxo...")
-                                    self.logger.info(f"Problema ao fazer a requisição do link => {link} - do prompt => {prompt}")
-                                    break
+                html = await self._requisita_pagina(session, numero, prompt, link)
+                if html:
+                    lista_html_img.append((link,html))
 
         #Depois de capturar todas as paginas HTML de cada link dos pins colocamos a tupla dentro da Queue
         self.logger.debug(f"[BOT_REQ - {numero}] Captura de páginas HTML para o prompt {prompt} terminada!")
@@ -305,6 +368,212 @@ class ParserHTMLPinterest(ParserHTML):
                 self.logger.debug(f"[BOT_REQ - {numero}] Todos os produtores terminaram! Ativando a flag 'set' da instância 'Event'! Fim de produção na pipeline!")
                 evento.set()
     
+    async def _requisita_pagina(self, session:aiohttp.ClientSession, numero:int, prompt:str, link:str) -> str | None:
+
+        """
+        Método auxiliar assíncrono que realiza a requisição da página HTML de um único link de 'pin'.
+
+        São feitas no máximo 3 tentativas de requisição. Caso nenhuma delas seja bem sucedida, o link
+        é ignorado e o valor 'None' é retornado.
+
+        AVISO: O método é encapsulado, ou seja, faz parte da lógica interna da classe portanto não deve ser chamado diretamente.
+
+        Args:
+            session (aiohttp.ClientSession): Sessão utilizada para realizar a requisição.
+
+            numero (int): Número de identificação da 'task' que chamou o método. Utilizado nos logs.
+
+            prompt (str): Prompt que gerou o link de 'pin'. Utilizado nos logs.
+
+            link (str): Link da página do 'pin'.
+
+        Returns:
+            str | None: Página HTML em formato de string, ou 'None' caso todas as tentativas falhem.
+        """
+
+        ### Variáveis ###
+
+        #Numero de tentativas de requisição
+        n_req = 0
+
+        #Página HTML do pin
+        html = ""
+
+        ### Código ###
+
+        #Iniciando as tentativas de requisição
+        while True:
+
+            #Incrementando valor do contador, indicando mais uma tentativa de requisição
+            n_req +=1 
+
+            #Começando requisição
+            self.logger.debug(f"[BOT_REQ - {numero}] {n_req}ª tentativa de requisição...")
+            if self._relatorio is not None:
+                self._relatorio.registra_requisicao(link, n_req)
+            with span(self._rastreador,"parser.requisicao",prompt=prompt,url=link,tentativa=n_req) as atributos:
+                async with session.get(link, max_field_size=16384) as resp:
+                    atributos["http.status_code"] = resp.status
+                    if resp.status == 200:
+                        self.logger.debug(f"[BOT_REQ - {numero}] Requisição do link => {link} - bem sucedida! Capturando página HTML do link => {link}")
+                        html = await resp.text()
+                        atributos["bytes"] = len(html)
+                        return html
+                
+                    else:
+                        if n_req == 3:
+                            self.logger.debug(f"[BOT_REQ - {numero}] {n_req}ª tentativa de requisição!")
+                            self.logger.debug(f"[BOT_REQ - {numero}] Limite excedido! Ignorando link => {link} e seguindo o fluxo...")
+                            self.logger.info(f"Problema ao fazer a requisição do link => {link} - do prompt => {prompt}")
+                            if self._journal is not None:
+                                self._journal.registra_falha(prompt, link_pin=link)
+                            if self._relatorio is not None:
+                                self._relatorio.registra_falha(link)
+                            return None
+
+    async def parsing_streaming(self, fila_entrada:asyncio.Queue, fila_saida:asyncio.Queue, n_bots:int=3) -> dict[str,list[str]]:
+
+        """
+        Método que realiza a requisição/parsing de links de 'pin' conforme eles chegam pela pipeline 'fila_entrada'.
+
+        Diferente do método 'parsing', que espera o dicionário completo de links, este método consome tuplas
+        '(prompt, link_pin)' uma a uma, e insere cada link de imagem encontrado na pipeline 'fila_saida' como uma
+        tupla '(prompt, link_img)'. Assim o 'Downloader' pode começar a baixar as imagens enquanto o 'Crawler'
+        ainda esta coletando pins.
+
+        O fim da produção é sinalizado pelo valor 'None' dentro de 'fila_entrada'. Quando todos os bots terminam,
+        o método insere um 'None' em 'fila_saida', repassando o sinal para a próxima etapa.
+
+        Args:
+            fila_entrada (asyncio.Queue): Pipeline de onde são retiradas as tuplas '(prompt, link_pin)'.
+
+            fila_saida (asyncio.Queue): Pipeline onde são inseridas as tuplas '(prompt, link_img)'.
+
+            n_bots (int): Quantidade de 'tasks' que realizam requisições ao mesmo tempo.
+
+        Returns:
+            dict[str,list[str]]: Dicionário onde cada chave é um prompt e o valor é uma lista de links de imagens coletados.
+        """
+
+        ### Variáveis ###
+
+        #Dicionário que acumula os links de imagem de cada prompt
+        dict_resultado = {prompt:[] for prompt in self._dict_links_html}
+
+        #Lista de tasks dos bots
+        lista_task = []
+
+        ### Código ###
+
+        self.logger.debug(f"\n[PARSING_STREAMING] Método 'parsing_streaming' iniciado com {n_bots} bots!")
+        self._carrega_imgs_conhecidas()
+
+        try:
+            async with self._sessao() as session:
+                lista_task = [asyncio.create_task(self._bot_streaming(n+1, session, fila_entrada, fila_saida, dict_resultado)) for n in range(n_bots)]
+                await asyncio.gather(*lista_task)
+        
+        finally:
+            #Repassando o sinal de fim da produção para a próxima etapa da pipeline
+            self.logger.debug("[PARSING_STREAMING] Bots finalizados! Sinalizando o fim da produção para a próxima etapa.")
+            await fila_saida.put(None)
+
+        self._dict_links_result = list(dict_resultado.items())
+        return dict_resultado
+
+    async def _bot_streaming(self, numero:int, session:aiohttp.ClientSession, fila_entrada:asyncio.Queue, fila_saida:asyncio.Queue, dict_resultado:dict[str,list[str]]) -> None:
+
+        """
+        Método assíncrono que retira links de 'pin' da pipeline, realiza a requisição/parsing de cada um, e insere
+        o link da imagem na próxima pipeline.
+
+        AVISO: O método é encapsulado, ou seja, faz parte da lógica interna da classe portanto não deve ser chamado diretamente.
+
+        Args:
+            numero (int): Número de identificação da 'task'.
+
+            session (aiohttp.ClientSession): Sessão compartilhada pelos bots.
+
+            fila_entrada (asyncio.Queue): Pipeline de onde são retiradas as tuplas '(prompt, link_pin)'.
+
+            fila_saida (asyncio.Queue): Pipeline onde são inseridas as tuplas '(prompt, link_img)'.
+
+            dict_resultado (dict[str,list[str]]): Dicionário onde os links de imagem são acumulados por prompt.
+        """
+
+        ### Variáveis ###
+
+        #Valor retirado da pipeline
+        item = None
+
+        #Página HTML do pin
+        html = ""
+
+        #Link da imagem retirado da página
+        link_img = ""
+
+        ### Código ###
+
+        self.logger.debug(f"[BOT_STREAMING - {numero}] Bot iniciado!")
+
+        while True:
+            item = await fila_entrada.get()
+
+            #Sinal de fim da produção. Devolvemos o 'None' para os outros bots também encerrarem
+            if item is None:
+                self.logger.debug(f"[BOT_STREAMING - {numero}] Sinal de fim da produção recebido! Encerrando o bot...")
+                await fila_entrada.put(None)
+                break
+
+            prompt,link = item
+
+            #Pins com a imagem ja conhecida, inclusive os ja analisados para outro prompt, seguem direto para a próxima etapa
+            if id_pin(link) in self._imgs_conhecidas:
+                self.logger.debug(f"[BOT_STREAMING - {numero}] Imagem do link => {link} ja conhecida! Pulando requisição.")
+                link_img = self._imgs_conhecidas[id_pin(link)]
+                if self._journal is not None:
+                    self._journal.registra_parse(prompt, link, link_img)
+                dict_resultado.setdefault(prompt,[]).append(link_img)
+                await fila_saida.put((prompt,link_img))
+                continue
+
+            #Pin sendo requisitado por outro bot. Esperamos o resultado dele em vez de requisitar novamente
+            if id_pin(link) in self._pendentes:
+                self.logger.debug(f"[BOT_STREAMING - {numero}] Link => {link} ja esta sendo requisitado! Aguardando o resultado.")
+                link_img = await self._pendentes[id_pin(link)]
+                if not link_img:
+                    continue
+
+            else:
+                self._pendentes[id_pin(link)] = asyncio.get_running_loop().create_future()
+                link_img = ""
+                try:
+                    html = await self._requisita_pagina(session, numero, prompt, link)
+                    if not html:
+                        continue
+                    with span(self._rastreador,"parser.html",prompt=prompt,url=link,bytes=len(html)):
+                        link_img = self._parsing_link(html)
+
+                except (aiohttp.ClientError,asyncio.TimeoutError,AttributeError,KeyError,TypeError) as error:
+                    self.logger.debug(f"[BOT_STREAMING - {numero}] Falha ao processar o link => {link} - Exceção => {error}")
+                    self.logger.info(f"Problema ao coletar a imagem do link => {link} - do prompt => {prompt}")
+                    if self._journal is not None:
+                        self._journal.registra_falha(prompt, link_pin=link)
+                    if self._relatorio is not None:
+                        self._relatorio.registra_falha(link)
+                    continue
+
+                finally:
+                    if link_img:
+                        self._imgs_conhecidas[id_pin(link)] = link_img
+                    self._pendentes.pop(id_pin(link)).set_result(link_img)
+
+            if self._journal is not None:
+                self._journal.registra_parse(prompt, link, link_img)
+
+            dict_resultado.setdefault(prompt,[]).append(link_img)
+            await fila_saida.put((prompt,link_img))
+
     async def _bot_parser(self, numero:int, fila:asyncio.Queue, evento:asyncio.Event) -> None:
 
         """
@@ -336,7 +605,7 @@ class ParserHTMLPinterest(ParserHTML):
         #Lista de links de imagem coletados das paginas HTML fornecidas na PIPELINE pelos tasks '_bot_requisicao'
         lista_links_img = []
 
-        #Variável que armazena valores retirados da Queue, contendo o prompt e uma lista de páginas HTML
+        #Variável que armazena valores retirados da Queue, contendo o prompt e uma lista de tuplas '(link_pin, pagina_html)'
         prompt = ""
         lista_paginas_html = []
 
@@ -369,11 +638,15 @@ class ParserHTMLPinterest(ParserHTML):
                 
                 #Iniciando a iteração para a retirada do link de cada página HTML
                 self.logger.debug(f"[BOT_PARSER - {numero}] Iniciando Parsing das paginas do prompt => {prompt}")
-                for pagina_html in lista_paginas_html:
+                for link_pin,pagina_html in lista_paginas_html:
                     n_parser += 1
                     self.logger.debug(f"[BOT_PARSER - {numero}] Realizando o parsing da {n_parser}ª pagina....")
-                    link = self._parsing_link(pagina_html)
+                    with span(self._rastreador,"parser.html",prompt=prompt,url=link_pin,bytes=len(pagina_html)):
+                        link = self._parsing_link(pagina_html)
                     lista_links_img.append(link)
+                    self._imgs_conhecidas[id_pin(link_pin)] = link
+                    if self._journal is not None:
+                        self._journal.registra_parse(prompt, link_pin, link)
             
             except asyncio.TimeoutError as error:
                 self.logger.debug(f"\n[BOT_PARSER - {numero}] Bot demorou demais para retirar valor da pipeline! Seguindo o fluxo...")
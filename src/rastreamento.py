@@ -0,0 +1,211 @@
+"""
+Módulo responsável por disponibilizar o rastreamento ('tracing') das operações do PinScrapper.
+
+Este módulo fornece a classe `Rastreador`, que registra um 'span' para cada operação importante da
+execução (navegação do driver, rolamento da página, requisição das páginas de pin, 'parsing' do HTML,
+requisição das imagens e escrita no disco), com o momento de início e fim, o prompt, o link, o status e
+a quantidade de bytes. Os 'spans' são exportados para um arquivo JSON no formato do OpenTelemetry (OTLP),
+que pode ser aberto em ferramentas como o Jaeger ou o Grafana Tempo.
+
+O 'span' pai de cada operação é guardado em uma 'contextvars.ContextVar', então os 'spans' criados dentro
+de uma etapa (ou de uma 'task' / 'thread' iniciada por ela) ficam aninhados nela automaticamente.
+
+Dependências:
+    - json (biblioteca padrão)
+
+Exemplo:
+    from rastreamento import Rastreador, span
+
+    rastreador = Rastreador(logger)
+    with span(rastreador, "parser.requisicao", prompt="Gato", url=link) as atributos:
+        atributos["http.status_code"] = 200
+    rastreador.exporta("pinscrapper_trace.json")
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+#Códigos de status dos 'spans' no formato OTLP
+STATUS_OK = 1
+STATUS_ERRO = 2
+
+#'Span' atual da 'task' / 'thread', utilizado como pai dos próximos 'spans'
+_span_atual = contextvars.ContextVar("span_atual", default=None)
+
+
+# Classes
+
+class Rastreador:
+
+    """
+    Classe que registra os 'spans' de uma execução do PinScrapper.
+
+    Todos os 'spans' de uma instancia pertencem ao mesmo 'trace'. Os registros são protegidos por um
+    'threading.Lock', ja que o crawler pode ser executado em uma 'thread' separada.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        servico (str): Nome do serviço registrado no arquivo exportado.
+
+        trace_id (str): Identificador do 'trace' da execução.
+
+        _spans (list[dict]): 'Spans' ja finalizados. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _lock (threading.Lock): Lock que serializa os registros. O atributo é encapsulado e não deve ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger, servico:str="pinscrapper"):
+
+        self.logger = logger
+        self.servico = servico
+        self.trace_id = os.urandom(16).hex()
+
+        self._spans = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, nome:str, **atributos):
+
+        """
+        Gerenciador de contexto que registra um 'span'.
+
+        O dicionário de atributos é devolvido pelo 'with', para que o código rastreado possa adicionar valores
+        que só são conhecidos no fim da operação (ex: status da resposta e quantidade de bytes). Um 'span' termina
+        com erro caso uma exceção seja levantada dentro dele, ou caso o atributo 'http.status_code' seja maior ou
+        igual a 400.
+
+        Args:
+            nome (str): Nome da operação.
+
+            **atributos: Atributos iniciais do 'span' (ex: prompt, url).
+        """
+
+        ### Variáveis ###
+
+        #Identificadores do 'span' e do seu pai
+        span_id = os.urandom(8).hex()
+        pai = _span_atual.get()
+
+        #Token para restaurar o 'span' atual no fim
+        token = _span_atual.set(span_id)
+
+        #Momento de início e status do 'span'
+        inicio = time.time_ns()
+        status = STATUS_OK
+
+        ### Código ###
+
+        try:
+            yield atributos
+
+        except BaseException as error:
+            status = STATUS_ERRO
+            atributos.setdefault("erro", repr(error))
+            raise
+
+        finally:
+            _span_atual.reset(token)
+            if atributos.get("http.status_code",0) >= 400:
+                status = STATUS_ERRO
+
+            with self._lock:
+                self._spans.append({"traceId":self.trace_id,
+                                    "spanId":span_id,
+                                    "parentSpanId":pai or "",
+                                    "name":nome,
+                                    "kind":1,
+                                    "startTimeUnixNano":str(inicio),
+                                    "endTimeUnixNano":str(time.time_ns()),
+                                    "attributes":[_atributo(chave,valor) for chave,valor in atributos.items() if valor is not None],
+                                    "status":{"code":status}})
+
+    def spans(self) -> list[dict]:
+
+        """
+        Método que retorna uma cópia dos 'spans' ja finalizados.
+
+        Returns:
+            list[dict]: 'Spans' no formato OTLP.
+        """
+
+        with self._lock:
+            return list(self._spans)
+
+    def incorpora(self, lista_spans:list[dict]) -> None:
+
+        """
+        Método que adiciona ao 'trace' os 'spans' de outro rastreador (ex: dos processos do 'CrawlerMultiProcesso').
+
+        Args:
+            lista_spans (list[dict]): 'Spans' no formato retornado pelo método 'spans'.
+        """
+
+        with self._lock:
+            self._spans.extend(dict(span, traceId=self.trace_id) for span in lista_spans)
+
+    def exporta(self, caminho:str) -> None:
+
+        """
+        Método que salva os 'spans' em um arquivo JSON no formato OTLP ('ExportTraceServiceRequest').
+
+        Args:
+            caminho (str): Caminho do arquivo JSON.
+        """
+
+        self.logger.debug(f"[RASTREADOR] Exportando {len(self._spans)} spans => {caminho}")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump({"resourceSpans":[{"resource":{"attributes":[_atributo("service.name",self.servico)]},
+                                         "scopeSpans":[{"scope":{"name":self.servico},
+                                                        "spans":self.spans()}]}]},
+                      arquivo, ensure_ascii=False)
+
+
+# Funções
+
+def span(rastreador:Rastreador|None, nome:str, **atributos):
+
+    """
+    Função que abre um 'span' no rastreador, ou não faz nada caso o rastreamento esteja desativado.
+
+    Em ambos os casos o 'with' devolve o dicionário de atributos, então o código rastreado não precisa
+    verificar se existe um rastreador.
+
+    Args:
+        rastreador (Rastreador | None): Rastreador da execução.
+
+        nome (str): Nome da operação.
+
+        **atributos: Atributos iniciais do 'span'.
+
+    Returns:
+        ContextManager[dict]: Gerenciador de contexto do 'span'.
+    """
+
+    if rastreador is None:
+        return nullcontext(atributos)
+    return rastreador.span(nome, **atributos)
+
+
+def _atributo(chave:str, valor) -> dict:
+
+    """
+    Função auxiliar que converte um atributo para o formato 'KeyValue' do OTLP.
+    """
+
+    if isinstance(valor, bool):
+        return {"key":chave, "value":{"boolValue":valor}}
+    if isinstance(valor, int):
+        return {"key":chave, "value":{"intValue":str(valor)}}
+    if isinstance(valor, float):
+        return {"key":chave, "value":{"doubleValue":valor}}
+    return {"key":chave, "value":{"stringValue":str(valor)}}
@@ -0,0 +1,298 @@
+"""
+Módulo responsável por disponibilizar o relatório de execução do PinScrapper em formato JSON.
+
+Este módulo fornece a classe `RelatorioExecucao`, que acumula as métricas de uma execução conforme as
+etapas vão trabalhando:
+
+    - Tempo total ('wall time') de cada etapa: crawl, parse e download.
+    - Quantidade de pins, rolamentos de página e tempo de espera ('sleep') de cada prompt, junto com o motivo
+      do fim do 'crawling' dele (ex: 'completo', 'fim_pagina' ou um limite como 'prazo'), e as trocas de navegador
+      feitas pelo 'VigiaNavegador' ('reinicios'), quando houver.
+    - Quantidade de requisições, novas tentativas e falhas de cada 'host'.
+    - Quantidade de imagens e bytes baixados, junto com as taxas de imagens/s e MB/s.
+
+Ao fim da execução o relatório é salvo em um arquivo JSON, permitindo comparar execuções e encontrar
+regressões de desempenho.
+
+Dependências:
+    - json (biblioteca padrão)
+
+Exemplo:
+    from relatorio import RelatorioExecucao
+
+    relatorio = RelatorioExecucao(logger)
+    with relatorio.etapa("crawl"):
+        dict_links = crawler.bot_crawler()
+    relatorio.salva("pinscrapper_relatorio.json")
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+import json
+import threading
+import logging
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+#Etapas medidas pelo relatório
+ETAPA_CRAWL = "crawl"
+ETAPA_PARSE = "parse"
+ETAPA_DOWNLOAD = "download"
+
+
+# Classes
+
+class RelatorioExecucao:
+
+    """
+    Classe que acumula as métricas de uma execução do PinScrapper.
+
+    Todos os registros são protegidos por um 'threading.Lock', ja que o crawler pode ser executado em uma
+    'thread' separada (modo 'streaming') enquanto o parser e o downloader registram a partir do loop de eventos.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        _inicio (float): Momento em que o relatório foi criado. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _etapas (dict[str,float]): Tempo acumulado de cada etapa. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _prompts (dict[str,dict]): Métricas do crawler para cada prompt. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _hosts (dict[str,dict]): Métricas de requisição de cada 'host'. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _imagens (int): Quantidade de imagens salvas. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _bytes (int): Quantidade de bytes de imagem salvos. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _lock (threading.Lock): Lock que serializa os registros. O atributo é encapsulado e não deve ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger):
+
+        self.logger = logger
+
+        self._inicio = time.time()
+        self._etapas = {}
+        self._prompts = {}
+        self._hosts = {}
+        self._imagens = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def etapa(self, nome:str):
+
+        """
+        Gerenciador de contexto que mede o tempo de uma etapa da execução.
+
+        Caso a mesma etapa seja medida mais de uma vez (ex: vários 'jobs' do modo serviço), os tempos são somados.
+
+        Args:
+            nome (str): Nome da etapa ('crawl', 'parse' ou 'download').
+        """
+
+        ### Variáveis ###
+
+        #Momento em que a etapa começou
+        inicio = time.perf_counter()
+
+        ### Código ###
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._etapas[nome] = self._etapas.get(nome,0.0) + time.perf_counter() - inicio
+
+    def _prompt(self, prompt:str) -> dict:
+
+        """
+        Método auxiliar que retorna as métricas de um prompt, criando elas caso ainda não existam.
+
+        AVISO: Deve ser chamado com o 'self._lock' adquirido.
+        """
+
+        return self._prompts.setdefault(prompt, {"pins":0, "rolamentos":0, "tempo_espera":0.0})
+
+    def _host(self, link:str) -> dict:
+
+        """
+        Método auxiliar que retorna as métricas do 'host' de um link, criando elas caso ainda não existam.
+
+        AVISO: Deve ser chamado com o 'self._lock' adquirido.
+        """
+
+        return self._hosts.setdefault(urlsplit(link).netloc, {"requisicoes":0, "retentativas":0, "falhas":0})
+
+    def registra_pins(self, prompt:str, n_pins:int, motivo:str|None=None) -> None:
+
+        """
+        Método que registra a quantidade de pins coletados pelo crawler para um prompt.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            n_pins (int): Quantidade de links de pin coletados.
+
+            motivo (str | None): Motivo do fim do 'crawling' do prompt (veja os 'MOTIVO_*' do módulo 'crawler'). Opcional.
+        """
+
+        with self._lock:
+            self._prompt(prompt)["pins"] = n_pins
+            if motivo is not None:
+                self._prompt(prompt)["motivo"] = motivo
+
+    def registra_reinicio(self, prompt:str) -> None:
+
+        """
+        Método que registra uma troca do navegador, pelo 'VigiaNavegador', durante o 'crawling' de um prompt.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+        """
+
+        with self._lock:
+            metricas = self._prompt(prompt)
+            metricas["reinicios"] = metricas.get("reinicios",0) + 1
+
+    def registra_rolamento(self, prompt:str) -> None:
+
+        """
+        Método que registra um rolamento da página de pesquisa de um prompt.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+        """
+
+        with self._lock:
+            self._prompt(prompt)["rolamentos"] += 1
+
+    def registra_espera(self, prompt:str, segundos:float) -> None:
+
+        """
+        Método que registra o tempo que o crawler ficou parado esperando a página de um prompt.
+
+        Args:
+            prompt (str): Prompt pesquisado.
+
+            segundos (float): Tempo de espera.
+        """
+
+        with self._lock:
+            self._prompt(prompt)["tempo_espera"] += segundos
+
+    def registra_requisicao(self, link:str, tentativa:int=1) -> None:
+
+        """
+        Método que registra uma tentativa de requisição. Tentativas a partir da segunda contam como novas tentativas.
+
+        Args:
+            link (str): Link requisitado.
+
+            tentativa (int): Número da tentativa para este link, começando em 1.
+        """
+
+        with self._lock:
+            metricas = self._host(link)
+            metricas["requisicoes"] += 1
+            if tentativa > 1:
+                metricas["retentativas"] += 1
+
+    def registra_falha(self, link:str) -> None:
+
+        """
+        Método que registra um link que foi ignorado depois de todas as tentativas falharem.
+
+        Args:
+            link (str): Link requisitado.
+        """
+
+        with self._lock:
+            self._host(link)["falhas"] += 1
+
+    def registra_imagem(self, n_bytes:int) -> None:
+
+        """
+        Método que registra uma imagem salva no SO.
+
+        Args:
+            n_bytes (int): Tamanho da imagem em bytes.
+        """
+
+        with self._lock:
+            self._imagens += 1
+            self._bytes += n_bytes
+
+    def incorpora(self, dados:dict) -> None:
+
+        """
+        Método que soma ao relatório as métricas de prompts e 'hosts' de outro relatório, no formato retornado por 'para_dict'.
+
+        Utilizado para juntar os relatórios dos processos do 'CrawlerMultiProcesso'.
+
+        Args:
+            dados (dict): Relatório no formato retornado pelo método 'para_dict'.
+        """
+
+        with self._lock:
+            for prompt,metricas in dados.get("prompts",{}).items():
+                atual = self._prompt(prompt)
+                for chave,valor in metricas.items():
+                    atual[chave] = atual.get(chave,0) + valor if chave not in ("pins", "motivo") else valor
+            for host,metricas in dados.get("hosts",{}).items():
+                atual = self._hosts.setdefault(host, {"requisicoes":0, "retentativas":0, "falhas":0})
+                for chave,valor in metricas.items():
+                    atual[chave] += valor
+
+    def para_dict(self) -> dict:
+
+        """
+        Método que retorna o relatório em formato de dicionário.
+
+        As taxas de imagens/s e MB/s são calculadas sobre o tempo da etapa de download, ou sobre o tempo total
+        da execução caso a etapa não tenha sido medida.
+
+        Returns:
+            dict: Relatório da execução.
+        """
+
+        ### Variáveis ###
+
+        #Tempo total da execução
+        duracao = 0.0
+
+        #Tempo utilizado no cálculo das taxas de download
+        tempo_download = 0.0
+
+        ### Código ###
+
+        with self._lock:
+            duracao = time.time() - self._inicio
+            tempo_download = self._etapas.get(ETAPA_DOWNLOAD) or duracao
+
+            return {"inicio":self._inicio,
+                    "duracao":round(duracao,3),
+                    "etapas":{nome:round(tempo,3) for nome,tempo in self._etapas.items()},
+                    "prompts":{prompt:dict(metricas, tempo_espera=round(metricas["tempo_espera"],3)) for prompt,metricas in self._prompts.items()},
+                    "hosts":{host:dict(metricas) for host,metricas in self._hosts.items()},
+                    "download":{"imagens":self._imagens,
+                                "bytes":self._bytes,
+                                "imagens_por_segundo":round(self._imagens/tempo_download,3) if tempo_download else 0.0,
+                                "mb_por_segundo":round(self._bytes/1_000_000/tempo_download,3) if tempo_download else 0.0}}
+
+    def salva(self, caminho:str) -> None:
+
+        """
+        Método que salva o relatório em um arquivo JSON.
+
+        Args:
+            caminho (str): Caminho do arquivo JSON.
+        """
+
+        self.logger.debug(f"[RELATORIO] Salvando relatório da execução => {caminho}")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.para_dict(), arquivo, ensure_ascii=False, indent=4)
@@ -0,0 +1,159 @@
+"""
+Módulo responsável por disponibilizar o 'runtime' assíncrono compartilhado pelas etapas da aplicação.
+
+Este módulo fornece a classe `RuntimeHTTP`, que é dona de um único loop de eventos e de uma única
+sessão HTTP ('aiohttp.ClientSession') com um 'pool' de conexões 'keep-alive' e cache de DNS. Essa
+sessão é compartilhada pelo 'ParserHTMLPinterest' e pelo 'Downloader', fazendo com que milhares de
+requisições para 'br.pinterest.com' e 'i.pinimg.com' reutilizem conexões ja abertas, ao invés de
+pagar por um novo 'handshake' TCP+TLS e uma nova consulta DNS a cada link.
+
+Dependências:
+    - aiohttp
+
+Exemplo:
+    from runtime import RuntimeHTTP
+    from parser import ParserHTMLPinterest
+
+    with RuntimeHTTP(logger, limite_por_host=10) as runtime:
+        p = ParserHTMLPinterest(dict_links, logger, session=runtime.session)
+        dict_links_img = runtime.executa(p.parsing())
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+import asyncio
+import aiohttp
+import contextvars
+import logging
+from collections.abc import Coroutine
+
+
+# Classes
+
+class RuntimeHTTP:
+
+    """
+    Classe que implementa o 'runtime' assíncrono compartilhado pela aplicação.
+
+    A instancia mantém um 'asyncio.Runner', ou seja, um loop de eventos que permanece vivo entre as
+    chamadas do método 'executa', e uma 'aiohttp.ClientSession' criada dentro desse loop. Todas as
+    corrotinas executadas pelo 'runtime' podem então utilizar a mesma sessão.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        limite_conexoes (int): Quantidade máxima de conexões abertas ao mesmo tempo no 'pool'.
+
+        limite_por_host (int): Quantidade máxima de conexões abertas ao mesmo tempo para um mesmo 'host'.
+
+        ttl_dns (int): Tempo, em segundos, que uma resolução DNS fica armazenada no cache.
+
+        _runner (asyncio.Runner): Loop de eventos do 'runtime'. O atributo é encapsulado e não deve ser modificado diretamente.
+
+        _session (aiohttp.ClientSession): Sessão HTTP compartilhada. O atributo é encapsulado e não deve ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger, limite_conexoes:int=100, limite_por_host:int=10, ttl_dns:int=300):
+
+        self.logger = logger
+        self.limite_conexoes = limite_conexoes
+        self.limite_por_host = limite_por_host
+        self.ttl_dns = ttl_dns
+
+        self._runner = None
+        self._session = None
+
+        #Verificando se os limites de conexão são validos
+        if limite_conexoes < 0 or limite_por_host < 0:
+            raise ValueError("Os valores de 'limite_conexoes' e 'limite_por_host' não podem ser negativos!")
+
+    #Encapsulamento do atributo '_session'
+    @property
+    def session(self) -> aiohttp.ClientSession:
+
+        #Iniciando o 'runtime' caso ele ainda não tenha sido iniciado
+        if self._session is None:
+            self.inicia()
+        return self._session
+
+    @session.setter
+    def session(self, valor):
+        raise AttributeError("Acesso Negado! O atributo '_session' não pode ser modificado diretamente!")
+
+    def __enter__(self):
+        self.inicia()
+        return self
+
+    def __exit__(self, *exc):
+        self.encerra()
+
+    def inicia(self) -> None:
+
+        """
+        Método que inicia o loop de eventos e cria a sessão HTTP compartilhada.
+
+        Chamadas repetidas não tem efeito caso o 'runtime' ja esteja iniciado.
+        """
+
+        if self._runner is not None:
+            return
+
+        self.logger.debug(f"[RUNTIME] Iniciando loop de eventos e sessão HTTP com limite de {self.limite_conexoes} conexões e {self.limite_por_host} por host.")
+        self._runner = asyncio.Runner()
+        self._session = self._runner.run(self._cria_sessao())
+
+    def executa(self, corrotina:Coroutine):
+
+        """
+        Método que executa uma corrotina no loop de eventos do 'runtime' e retorna o seu resultado.
+
+        A corrotina é executada com uma cópia do contexto ('contextvars') de quem chamou o método, então valores
+        como o 'span' atual do rastreamento continuam visíveis dentro dela.
+
+        Args:
+            corrotina (Coroutine): Corrotina que sera executada.
+
+        Returns:
+            Any: Valor retornado pela corrotina.
+        """
+
+        self.inicia()
+        return self._runner.run(corrotina, context=contextvars.copy_context())
+
+    def encerra(self) -> None:
+
+        """
+        Método que fecha a sessão HTTP e o loop de eventos do 'runtime'.
+        """
+
+        if self._runner is None:
+            return
+
+        self.logger.debug("[RUNTIME] Fechando sessão HTTP e encerrando loop de eventos.")
+        try:
+            self._runner.run(self._session.close())
+        finally:
+            self._runner.close()
+            self._runner = None
+            self._session = None
+
+    async def _cria_sessao(self) -> aiohttp.ClientSession:
+
+        """
+        Método auxiliar assíncrono que cria a sessão HTTP dentro do loop de eventos do 'runtime'.
+
+        Returns:
+            aiohttp.ClientSession: Sessão configurada com 'pool' de conexões 'keep-alive' e cache DNS.
+        """
+
+        ### Variáveis ###
+
+        #Conector responsável pelo 'pool' de conexões
+        conector = None
+
+        ### Código ###
+
+        conector = aiohttp.TCPConnector(limit=self.limite_conexoes, limit_per_host=self.limite_por_host,
+                                        ttl_dns_cache=self.ttl_dns, use_dns_cache=True, keepalive_timeout=30)
+        return aiohttp.ClientSession(connector=conector)
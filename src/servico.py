@@ -0,0 +1,395 @@
+"""
+Módulo responsável por disponibilizar o modo 'serviço' do PinScrapper.
+
+Este módulo fornece a classe `ServicoPinScrapper`, um processo de longa duração que mantém o navegador
+(WebDriver) e o 'pool' de conexões HTTP aquecidos, e recebe 'jobs' de scrapping (lista de prompts e
+quantidade de imagens) atravez de uma API HTTP local, ou de um 'Unix socket'.
+
+Assim, 'jobs' pequenos não pagam o custo de abrir o Chrome e carregar o Pinterest do zero a cada execução.
+
+Endpoints:
+    POST /jobs                    => Cria um 'job'. Corpo JSON: {"prompts": ["Gato", "Cachorro"], "img_q": 10}
+    GET  /jobs                    => Lista o estado de todos os 'jobs'.
+    GET  /jobs/{id}               => Estado de um 'job'.
+    GET  /jobs/{id}/resultado     => Links das imagens baixadas de um 'job' finalizado.
+
+Dependências:
+    - aiohttp
+    - selenium
+    - navegador.py, runtime.py (módulos internos desta aplicação)
+
+Exemplo:
+    servico = ServicoPinScrapper(logger, PinScrapper, CrawlerPinterest, ParserHTMLPinterest, Downloader)
+    servico.executa(host="127.0.0.1", porta=8080)
+
+    curl -X POST localhost:8080/jobs -d '{"prompts": ["Gato"], "img_q": 5}'
+
+Notas:
+    Este módulo não deve ser executado diretamente, utilize ele apenas via 'import'.
+"""
+
+from aiohttp import web
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+import asyncio
+import logging
+import time
+import uuid
+
+from crawler import Crawler
+from parser import ParserHTML
+from downloader import Downloader
+from navegador import cria_driver, driver_ativo
+from runtime import RuntimeHTTP
+
+
+#Estados possíveis de um 'job'
+ESTADO_PENDENTE = "pendente"
+ESTADO_EXECUTANDO = "executando"
+ESTADO_CONCLUIDO = "concluido"
+ESTADO_FALHOU = "falhou"
+
+
+# Classes
+
+class JobScrapper:
+
+    """
+    Classe que representa um 'job' de scrapping recebido pelo serviço.
+
+    Attributes:
+        id (str): Identificador do 'job'.
+
+        lista_prompt (list[str]): Prompts que serão pesquisados.
+
+        max_img (int): Quantidade de imagens coletadas de cada prompt.
+
+        estado (str): Estado atual do 'job' ('pendente', 'executando', 'concluido' ou 'falhou').
+
+        resultado (dict[str,list[str]] | None): Links das imagens baixadas, tendo o prompt como chave.
+
+        erro (str | None): Mensagem da exceção, caso o 'job' tenha falhado.
+
+        relatorio (dict | None): Relatório da execução do 'job', com tempos, requisições e taxas de download.
+    """
+
+    def __init__(self, lista_prompt:list[str], max_img:int):
+
+        self.id = uuid.uuid4().hex
+        self.lista_prompt = lista_prompt
+        self.max_img = max_img
+        self.estado = ESTADO_PENDENTE
+        self.resultado = None
+        self.erro = None
+        self.relatorio = None
+
+        self.criado = time.time()
+        self.iniciado = None
+        self.finalizado = None
+
+    def para_dict(self) -> dict:
+
+        """
+        Método que retorna o estado do 'job' em um dicionário que pode ser convertido em JSON.
+
+        Returns:
+            dict: Estado do 'job'.
+        """
+
+        return {"id": self.id, "prompts": self.lista_prompt, "img_q": self.max_img, "estado": self.estado,
+                "erro": self.erro, "criado": self.criado, "iniciado": self.iniciado, "finalizado": self.finalizado,
+                "relatorio": self.relatorio}
+
+
+class ServicoPinScrapper:
+
+    """
+    Classe que implementa o modo 'serviço' do PinScrapper.
+
+    Os 'jobs' são executados um de cada vez, sempre na mesma 'thread' ('_executor'), que é a dona do navegador
+    e do 'RuntimeHTTP'. Dessa forma ambos permanecem abertos e aquecidos entre um 'job' e outro. Caso o navegador
+    pare de responder, um novo é criado antes do próximo 'job'.
+
+    Attributes:
+        logger (Logger): Logger usado para registrar mensagens e exceções.
+
+        pinscrapper (type): Classe 'PinScrapper' utilizada para executar cada 'job'.
+
+        crawler (Crawler), parser (ParserHTML), downloader (Downloader): Classes de cada etapa, repassadas ao 'PinScrapper'.
+
+        monitor (bool): Se o navegador deve ficar visível.
+
+        log_rede (bool): Se o navegador deve registrar os eventos de rede, usados pelo crawler no modo '--rede'.
+
+        endereco_depuracao (str | None): Endereço de depuração remota de um Chrome ja aberto, usado no lugar de um navegador
+                                         novo (veja 'cria_driver'). Opcional.
+
+        usa_driver (bool): Se o crawler precisa do navegador do Selenium. Com 'False' (ex: crawlers da API e do Playwright, que
+                           iniciam o próprio navegador ou nenhum) o serviço não cria o navegador.
+
+        cache (CacheCrawl | None): Cache dos resultados do crawler, compartilhado por todos os 'jobs'. Opcional.
+
+        streaming (bool): Se os 'jobs' devem ser executados no modo 'streaming'.
+
+        limite_conexoes (int): Quantidade máxima de conexões HTTP abertas ao mesmo tempo.
+
+        limite_por_host (int): Quantidade máxima de conexões HTTP abertas ao mesmo tempo para um mesmo 'host'.
+
+        _jobs (dict[str,JobScrapper]): 'Jobs' recebidos pelo serviço. O atributo é encapsulado e não deve ser modificado diretamente.
+    """
+
+    def __init__(self, logger:logging.Logger, pinscrapper:type, crawler:Crawler, parser:ParserHTML, downloader:Downloader,
+                 monitor:bool=False, streaming:bool=False, limite_conexoes:int=100, limite_por_host:int=10, log_rede:bool=False,
+                 cache=None, endereco_depuracao:str|None=None, usa_driver:bool=True):
+
+        self.logger = logger
+        self.pinscrapper = pinscrapper
+        self.crawler = crawler
+        self.parser = parser
+        self.downloader = downloader
+        self.monitor = monitor
+        self.log_rede = log_rede
+        self.endereco_depuracao = endereco_depuracao
+        self.usa_driver = usa_driver
+        self.cache = cache
+        self.streaming = streaming
+        self.limite_conexoes = limite_conexoes
+        self.limite_por_host = limite_por_host
+
+        self._jobs = {}
+        self._driver = None
+        self._runtime = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PinScrapper-Job")
+
+    def cria_app(self) -> web.Application:
+
+        """
+        Método que cria a aplicação 'aiohttp' com as rotas da API.
+
+        Returns:
+            web.Application: Aplicação configurada.
+        """
+
+        ### Variáveis ###
+
+        #Aplicação aiohttp
+        app = None
+
+        ### Código ###
+
+        app = web.Application()
+        app.router.add_post("/jobs", self._post_job)
+        app.router.add_get("/jobs", self._get_jobs)
+        app.router.add_get("/jobs/{id}", self._get_job)
+        app.router.add_get("/jobs/{id}/resultado", self._get_resultado)
+        app.on_shutdown.append(self._ao_encerrar)
+        return app
+
+    def executa(self, host:str="127.0.0.1", porta:int=8080, socket:str|None=None) -> None:
+
+        """
+        Método que inicia o serviço e fica aguardando 'jobs' até ser interrompido.
+
+        Args:
+            host (str): Endereço onde a API fica disponível.
+
+            porta (int): Porta onde a API fica disponível.
+
+            socket (str | None): Caminho de um 'Unix socket'. Quando fornecido, é utilizado no lugar de 'host' e 'porta'.
+        """
+
+        self.logger.info(f"\nServiço do PinScrapper iniciado em => {socket if socket else f'http://{host}:{porta}'}")
+        if socket:
+            web.run_app(self.cria_app(), path=socket, print=None)
+        else:
+            web.run_app(self.cria_app(), host=host, port=porta, print=None)
+
+    async def _post_job(self, request:web.Request) -> web.Response:
+
+        """
+        Rota que recebe um novo 'job', valida o corpo da requisição e agenda a sua execução.
+        """
+
+        ### Variáveis ###
+
+        #Corpo JSON da requisição
+        corpo = None
+
+        #Novo 'job'
+        job = None
+
+        ### Código ###
+
+        try:
+            corpo = await request.json()
+        except ValueError:
+            return web.json_response({"erro": "O corpo da requisição precisa ser um JSON valido."}, status=400)
+
+        if not isinstance(corpo, dict):
+            return web.json_response({"erro": "O corpo da requisição precisa ser um objeto JSON."}, status=400)
+
+        lista_prompt = corpo.get("prompts")
+        max_img = corpo.get("img_q", 10)
+
+        if not lista_prompt or not isinstance(lista_prompt, list) or not all(isinstance(prompt, str) and prompt.strip() for prompt in lista_prompt):
+            return web.json_response({"erro": "O campo 'prompts' precisa ser uma lista de strings não vazia."}, status=400)
+
+        if not isinstance(max_img, int) or isinstance(max_img, bool) or max_img <= 0:
+            return web.json_response({"erro": "O campo 'img_q' precisa ser um número inteiro positivo."}, status=400)
+
+        job = JobScrapper([prompt.strip() for prompt in lista_prompt], max_img)
+        self._jobs[job.id] = job
+
+        self.logger.info(f"\nNovo job recebido => {job.id} - Prompts => {job.lista_prompt}")
+        asyncio.get_running_loop().run_in_executor(self._executor, self._executa_job, job)
+
+        return web.json_response(job.para_dict(), status=202)
+
+    async def _get_jobs(self, request:web.Request) -> web.Response:
+
+        """
+        Rota que lista o estado de todos os 'jobs'.
+        """
+
+        return web.json_response([job.para_dict() for job in self._jobs.values()])
+
+    async def _get_job(self, request:web.Request) -> web.Response:
+
+        """
+        Rota que retorna o estado de um 'job'.
+        """
+
+        ### Variáveis ###
+
+        #'Job' requisitado
+        job = self._jobs.get(request.match_info["id"])
+
+        ### Código ###
+
+        if job is None:
+            return web.json_response({"erro": "Job não encontrado."}, status=404)
+
+        return web.json_response(job.para_dict())
+
+    async def _get_resultado(self, request:web.Request) -> web.Response:
+
+        """
+        Rota que retorna os links das imagens baixadas por um 'job' finalizado.
+        """
+
+        ### Variáveis ###
+
+        #'Job' requisitado
+        job = self._jobs.get(request.match_info["id"])
+
+        ### Código ###
+
+        if job is None:
+            return web.json_response({"erro": "Job não encontrado."}, status=404)
+
+        if job.estado == ESTADO_FALHOU:
+            return web.json_response({"erro": job.erro}, status=500)
+
+        if job.estado != ESTADO_CONCLUIDO:
+            return web.json_response({"erro": f"O job ainda não foi finalizado. Estado atual => {job.estado}"}, status=409)
+
+        return web.json_response(job.resultado)
+
+    def _executa_job(self, job:JobScrapper) -> None:
+
+        """
+        Método que executa um 'job'. É sempre chamado na 'thread' do '_executor'.
+
+        Args:
+            job (JobScrapper): 'Job' que sera executado.
+        """
+
+        ### Variáveis ###
+
+        #Instancia do PinScrapper
+        pinscrapper = None
+
+        ### Código ###
+
+        job.estado = ESTADO_EXECUTANDO
+        job.iniciado = time.time()
+        self.logger.debug(f"[SERVICO] Executando job => {job.id}")
+
+        try:
+            self._garante_recursos()
+            pinscrapper = self.pinscrapper(self.logger, job.lista_prompt, self._driver, job.max_img,
+                                           runtime=self._runtime, encerra_driver=False, cache=self.cache)
+
+            if self.streaming:
+                job.resultado = pinscrapper.principal_streaming(self.crawler, self.parser, self.downloader)
+            else:
+                job.resultado = pinscrapper.principal(self.crawler, self.parser, self.downloader)
+
+            job.estado = ESTADO_CONCLUIDO
+
+        except Exception as error:
+            job.estado = ESTADO_FALHOU
+            job.erro = str(error)
+            self.logger.info(f"O job => {job.id} falhou! Verifique o log dele no arquivo 'Error.log'")
+            self.logger.error(f"[SERVICO] Job => {job.id}\nExceção => {error}\nTraceback => {format_exc()}")
+
+        finally:
+            job.finalizado = time.time()
+            if pinscrapper is not None:
+                job.relatorio = pinscrapper.relatorio.para_dict()
+
+    def _garante_recursos(self) -> None:
+
+        """
+        Método auxiliar que cria o 'RuntimeHTTP' e o navegador, caso ainda não existam, e substitui o navegador
+        caso ele tenha parado de responder. O navegador só é criado se o crawler precisar dele ('usa_driver').
+        """
+
+        if self._runtime is None:
+            self._runtime = RuntimeHTTP(self.logger, limite_conexoes=self.limite_conexoes, limite_por_host=self.limite_por_host)
+
+        if not self.usa_driver:
+            return
+
+        if self._driver is not None and not driver_ativo(self._driver):
+            self.logger.debug("[SERVICO] O navegador parou de responder! Criando um novo.")
+            self._encerra_driver()
+
+        if self._driver is None:
+            self.logger.debug("[SERVICO] Iniciando navegador.")
+            self._driver = cria_driver(self.monitor,log_rede=self.log_rede,endereco_depuracao=self.endereco_depuracao)
+
+    def _encerra_driver(self) -> None:
+
+        """
+        Método auxiliar que encerra o navegador, ignorando erros caso ele ja tenha sido encerrado.
+        """
+
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+
+    def _limpeza(self) -> None:
+
+        """
+        Método que encerra o navegador e o 'RuntimeHTTP'. É chamado na 'thread' do '_executor'.
+        """
+
+        if self._driver is not None:
+            self._encerra_driver()
+
+        if self._runtime is not None:
+            self._runtime.encerra()
+            self._runtime = None
+
+    async def _ao_encerrar(self, app:web.Application) -> None:
+
+        """
+        Método chamado pelo 'aiohttp' ao encerrar o serviço, fazendo a limpeza dos recursos.
+        """
+
+        self.logger.info("\nEncerrando o serviço do PinScrapper...")
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._limpeza)
+        self._executor.shutdown(wait=False)
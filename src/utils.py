@@ -26,6 +26,10 @@ Função: salva_pagina_html()
 
 => Função que recebe uma página html em formato 'string', e salva ela em um arquivo texto.
 
+Função: id_pin()
+
+=> Função que retira o id de um pin do seu link.
+
 Classe: MaxFilter(logging.Filter)
 
 => Classe que cria um filtro para uma instancia "StreamHandler".
@@ -41,6 +45,7 @@ import time
 import asyncio
 from pathlib import Path
 import argparse
+import re
 
 
 def configurando_argparse() -> argparse.ArgumentParser:
@@ -78,6 +83,21 @@ def configurando_argparse() -> argparse.ArgumentParser:
     - A quantidade de imagens que você quer coletar de cada prompt.
     - Se você quer ver o que acontece no navegador durante o 'crawling' do site.
       (Basicamente observar o script entrando no Pinterest, pesquisando e coletando as imagens).
+    - Se as etapas de pesquisa, coleta e download devem acontecer ao mesmo tempo (modo 'streaming').
+    - Quantos navegadores devem pesquisar os prompts ao mesmo tempo, cada um em um processo separado.
+    - Quantos navegadores, no mesmo processo, devem pesquisar os prompts ao mesmo tempo.
+    - Quantas abas do mesmo navegador devem pesquisar os prompts ao mesmo tempo.
+    - Se os links das imagens devem ser coletados das respostas de rede da pesquisa, pulando a página de cada pin (modo 'rede').
+    - Se os prompts devem ser pesquisados pela API JSON do Pinterest, sem o navegador (modo 'api').
+    - Se os prompts devem ser pesquisados pelo crawler assíncrono do Playwright, no mesmo loop do parser e do downloader (modo 'playwright').
+    - Se os links das imagens devem ser tirados dos próprios cards da grade de pesquisa, pulando a página de cada pin (modo 'grade').
+    - Se apenas os pins novos, ainda não baixados em execuções anteriores, devem ser coletados (modo 'incremental').
+    - Se os cards ja coletados devem ser esvaziados na página de pesquisa, para pesquisas muito longas não deixarem o navegador lento (modo 'podar').
+    - Os limites de cada prompt (tempo total, rolamentos e rolamentos seguidos sem pins novos), para um prompt travado não segurar a execução.
+    - Se o crawler deve se conectar a um Chrome ja aberto e aquecido, pelo endereço de depuração remota dele, no lugar de abrir um navegador novo.
+    - Se a saúde do navegador deve ser vigiada, trocando um navegador travado ou pesado demais por um novo no meio do prompt (modo 'vigia').
+    - Por quanto tempo os resultados de cada prompt ficam guardados no cache, e se o cache deve ser ignorado ('refresh').
+    - Se o PinScrapper deve ficar aberto como um serviço, recebendo 'jobs' por uma API HTTP local (modo 'serviço').
     
     """
 
@@ -85,10 +105,42 @@ def configurando_argparse() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(formatter_class=argparse.RawDescriptionHelpFormatter,description=descricao)
 
     #Adicionando argumentos
-    parser.add_argument("prompts",type=str,help="Lista de 'prompts' que serão utilizados na pesquisa de imagens.")
+    parser.add_argument("prompts",type=str,nargs="?",help="Lista de 'prompts' que serão utilizados na pesquisa de imagens. Obrigatório fora do modo '--servico'.")
     parser.add_argument("--debug",action='store_true',help="Ativa o modo depuração do script.")
     parser.add_argument("--img_q",type=int,default=10,help="Quantidade de imagens que devem ser coletadas de cada 'prompt'. Se o número zero for fornecido, o valor padrão do argumento fica sendo '10'.")
     parser.add_argument("--monitor", action="store_true", help="Ativa o modo 'monitor', fazendo o navegador ficar visível durante a pesquisa dentro do site.")
+    parser.add_argument("--stream", action="store_true", help="Ativa o modo 'streaming', onde pesquisa, coleta e download das imagens acontecem ao mesmo tempo.")
+    parser.add_argument("--fila", type=int, default=50, help="Capacidade máxima das pipelines entre as etapas no modo 'streaming'.")
+    parser.add_argument("--conexoes", type=int, default=100, help="Quantidade máxima de conexões HTTP abertas ao mesmo tempo (0 = sem limite).")
+    parser.add_argument("--resume", action="store_true", help="Retoma a execução anterior, pulando os prompts, pins e imagens que ja foram finalizados.")
+    parser.add_argument("--journal", type=str, default="pinscrapper_journal.db", help="Arquivo onde o progresso da execução é registrado.")
+    parser.add_argument("--cache", type=str, default="pinscrapper_cache.db", help="Arquivo onde os resultados do crawler de cada prompt ficam guardados.")
+    parser.add_argument("--cache_ttl", type=float, default=3600, help="Tempo, em segundos, que os resultados do crawler ficam válidos no cache. Use 0 para desativar o cache.")
+    parser.add_argument("--cache_max", type=int, default=1000, help="Quantidade máxima de prompts guardados no cache.")
+    parser.add_argument("--refresh", action="store_true", help="Pesquisa todos os prompts de novo, ignorando e atualizando o cache.")
+    parser.add_argument("--servico", action="store_true", help="Inicia o PinScrapper como um serviço, que mantém o navegador aberto e recebe 'jobs' por uma API HTTP local.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Endereço da API do modo '--servico'.")
+    parser.add_argument("--porta", type=int, default=8080, help="Porta da API do modo '--servico'.")
+    parser.add_argument("--socket", type=str, default=None, help="Caminho de um 'Unix socket' para a API do modo '--servico', no lugar de '--host' e '--porta'.")
+    parser.add_argument("--workers", type=int, default=1, help="Quantidade de navegadores, cada um em um processo separado, que dividem a pesquisa dos prompts. Não pode ser usado com '--drivers', '--api' ou '--playwright'.")
+    parser.add_argument("--drivers", type=int, default=1, help="Quantidade de navegadores, no mesmo processo, que pesquisam prompts ao mesmo tempo. Não pode ser usado com '--workers', '--api' ou '--playwright'.")
+    parser.add_argument("--abas", type=int, default=1, help="Quantidade de abas do mesmo navegador que pesquisam prompts ao mesmo tempo. Com '--playwright', é a quantidade de páginas. Não pode ser usado com '--workers', '--drivers' ou '--api'.")
+    parser.add_argument("--api", action="store_true", help="Pesquisa os prompts pela API JSON do Pinterest, sem o navegador, vários ao mesmo tempo. O navegador é usado apenas nos prompts em que a API falhar.")
+    parser.add_argument("--playwright", action="store_true", help="Pesquisa os prompts com o crawler assíncrono do Playwright (dependência opcional), vários ao mesmo tempo (veja '--abas') no mesmo loop do parser e do downloader.")
+    parser.add_argument("--grade", action="store_true", help="Tira o link da imagem de cada pin da própria grade de pesquisa, sem requisitar a página do pin. Pins sem uma imagem grande na grade continuam passando pela página do pin.")
+    parser.add_argument("--podar", action="store_true", help="Esvazia os cards ja coletados que ficaram bem acima da tela, liberando as imagens e deixando de desenhar o conteúdo deles. Mantém a memória do navegador estável em pesquisas com muitas imagens.")
+    parser.add_argument("--rede", action="store_true", help="Coleta os links das imagens das respostas JSON da pesquisa, lidas do log de rede do navegador, sem requisitar a página de cada pin.")
+    parser.add_argument("--relatorio", type=str, default="pinscrapper_relatorio.json", help="Arquivo JSON onde o relatório da execução (tempos, requisições e taxas de download) é salvo.")
+    parser.add_argument("--trace", type=str, default=None, help="Arquivo JSON (formato OpenTelemetry) onde os 'spans' de cada operação da execução são salvos. Desativado por padrão.")
+    parser.add_argument("--incremental", action="store_true", help="Baixa apenas pins novos, ignorando os pins de cada prompt que ja foram baixados em execuções anteriores e continuam no disco.")
+    parser.add_argument("--prazo_rolamento", type=float, default=4.0, help="Tempo máximo, em segundos, que o crawler espera por pins novos depois de cada rolamento da página.")
+    parser.add_argument("--prazo_prompt", type=float, default=300.0, help="Tempo máximo, em segundos, do 'crawling' de cada prompt. Ao chegar no limite, o crawler fica com os pins ja coletados e segue para o próximo prompt (0 = sem limite).")
+    parser.add_argument("--max_rolamentos", type=int, default=0, help="Quantidade máxima de rolamentos da página de cada prompt (0 = sem limite).")
+    parser.add_argument("--estagnacao", type=int, default=8, help="Quantidade máxima de rolamentos seguidos sem nenhum pin novo em cada prompt (0 = sem limite).")
+    parser.add_argument("--chrome_remoto", type=str, default=None, help="Endereço 'host:porta' da depuração remota de um Chrome ja aberto (ex: 127.0.0.1:9222). O crawler usa esse navegador, com o cache e os cookies dele, no lugar de abrir um novo, e ele continua aberto no fim. Não pode ser usado com '--workers', '--drivers' ou '--playwright'.")
+    parser.add_argument("--vigia", action="store_true", help="Vigia a saúde do navegador durante a pesquisa. Um navegador que trava, cai ou passa de '--limite_rss' MB é trocado por um novo, e o prompt continua de onde parou.")
+    parser.add_argument("--limite_rss", type=float, default=2048.0, help="Memória máxima, em MB, do navegador no modo '--vigia' (0 = sem limite).")
+    parser.add_argument("--conexoes_host", type=int, default=10, help="Quantidade máxima de conexões HTTP abertas ao mesmo tempo para um mesmo site (0 = sem limite).")
 
     #Retornando instância 'ArgumentParser' configurada
     return parser
@@ -386,6 +438,31 @@ def salva_links(dict_links:dict[str,list[str]]) -> None:
                 arq.write("\n")
     
 
+def id_pin(link:str) -> str:
+
+    """
+    Função que retira o id de um pin do seu link (ex: 'https://br.pinterest.com/pin/123456/' => '123456').
+
+    O id identifica o mesmo pin independente do domínio ou dos parâmetros do link.
+
+    Args:
+        link (str): Link do pin.
+
+    Returns:
+        str: Id do pin, ou o próprio link caso ele não tenha o formato '/pin/{id}'.
+    """
+
+    ### Variáveis ###
+
+    #Resultado da busca pelo id no link
+    busca = None
+
+    ### Código ###
+
+    busca = re.search(r"/pin/([^/?#]+)", link)
+    return busca.group(1) if busca else link
+    
+
 #Classes
 
 class DebugFilter(logging.Filter):
@@ -6,6 +6,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 import pytest
 import time
 import requests
+import sys
+from pathlib import Path
+
+#Adicionando o diretório 'src' ao 'sys.path', ja que os módulos da aplicação se importam diretamente (ex: 'from utils import ...')
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
 # Fixtures do módulo 'test_crawler.py'
@@ -55,5 +60,12 @@ def pagina_html():
         yield r.text
 
 
+#Fixtures do módulo 'test_journal.py'
+
+@pytest.fixture
+def logger():
 
+    #Importando aqui para o 'sys.path' ja estar configurado
+    from utils import configurando_logger
+    yield configurando_logger()
 
@@ -0,0 +1,145 @@
+"""
+Testes para o módulo 'cache.py'.
+
+Este script verifica:
+
+- Consulta dos links guardados de um prompt, com o prompt normalizado e quantidades menores de imagens.
+
+- Prazo de validade e o modo 'atualizar' (--refresh).
+
+- Descarte das entradas menos usadas quando o cache fica cheio.
+
+- Criação do navegador pelo PinScrapper apenas quando algum prompt não é encontrado no cache.
+
+"""
+
+
+from cache import CacheCrawl
+from PinScrapper import PinScrapper
+from runtime import RuntimeHTTP
+
+
+#Classes de teste
+
+class CrawlerFalso:
+
+    """
+    Crawler falso, que apenas guarda o navegador recebido.
+    """
+
+    def __init__(self, driver, logger, lista_prompt, **kwargs):
+        self.driver = driver
+        self.lista_prompt = lista_prompt
+
+
+#Testes
+
+def test_consultando_prompt_guardado(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do cache
+    caminho = str(tmp_path / "cache.db")
+
+    #Links de pin de teste
+    lista_links = ["https://br.pinterest.com/pin/1/", "https://br.pinterest.com/pin/2/", "https://br.pinterest.com/pin/3/"]
+
+    ### Código ###
+
+    cache = CacheCrawl(logger, caminho)
+    cache.registra("Gato", lista_links, max_img=3, dict_imagens={"1":"img1.jpg"})
+    cache.fecha()
+
+    cache = CacheCrawl(logger, caminho)
+    assert cache.consulta("  gato ", max_img=3) == (lista_links, {"1":"img1.jpg"})
+    assert cache.consulta("GATO", max_img=2) == (lista_links[0:2], {"1":"img1.jpg"})
+
+    #Pedindo mais imagens do que foi pesquisado, o prompt precisa ser pesquisado novamente
+    assert cache.consulta("Gato", max_img=10) is None
+    assert cache.consulta("Cachorro", max_img=3) is None
+
+    #Uma pesquisa que chegou ao fim da página atende qualquer quantidade de imagens
+    cache.registra("Cachorro", lista_links, max_img=50)
+    assert cache.consulta("Cachorro", max_img=100) == (lista_links, {})
+    cache.fecha()
+
+
+def test_validade_e_atualizacao(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do cache
+    caminho = str(tmp_path / "cache.db")
+
+    ### Código ###
+
+    cache = CacheCrawl(logger, caminho)
+    cache.registra("Gato", ["pin1"], max_img=1)
+    cache.fecha()
+
+    cache = CacheCrawl(logger, caminho, atualizar=True)
+    assert cache.consulta("Gato", max_img=1) is None
+    cache.registra("Gato", ["pin2"], max_img=1)
+    cache.fecha()
+
+    cache = CacheCrawl(logger, caminho)
+    assert cache.consulta("Gato", max_img=1) == (["pin2"], {})
+    cache.fecha()
+
+    cache = CacheCrawl(logger, caminho, ttl=0)
+    assert cache.consulta("Gato", max_img=1) is None
+    cache.fecha()
+
+
+def test_descartando_menos_usados(tmp_path, logger) -> None:
+
+    ### Código ###
+
+    cache = CacheCrawl(logger, str(tmp_path / "cache.db"), max_entradas=2)
+    cache.registra("Gato", ["pin1"], max_img=1)
+    cache.registra("Cachorro", ["pin2"], max_img=1)
+    assert cache.consulta("Gato", max_img=1) is not None
+
+    cache.registra("Bolo", ["pin3"], max_img=1)
+    assert cache.consulta("Cachorro", max_img=1) is None
+    assert cache.consulta("Gato", max_img=1) is not None
+    assert cache.consulta("Bolo", max_img=1) is not None
+    cache.fecha()
+
+
+def test_navegador_criado_apenas_sem_cache(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Runtime do PinScrapper
+    runtime = RuntimeHTTP(logger)
+
+    #Navegadores criados pela função 'cria_navegador'
+    lista_navegadores = []
+
+    ### Código ###
+
+    def cria_navegador():
+        lista_navegadores.append(object())
+        return lista_navegadores[-1]
+
+    cache = CacheCrawl(logger, str(tmp_path / "cache.db"))
+    cache.registra("Gato", ["pin1"], max_img=1)
+
+    #Todos os prompts estão no cache, então nenhum navegador é criado
+    pinscrapper = PinScrapper(logger, ["Gato"], None, 1, runtime=runtime, cache=cache, cria_navegador=cria_navegador)
+    dict_links,lista_pendentes = pinscrapper._separa_prompts()
+    assert dict_links == {"Gato":["pin1"]}
+    assert lista_pendentes == []
+    assert lista_navegadores == []
+
+    #Com um prompt fora do cache, o navegador é criado uma única vez, junto com o crawler
+    pinscrapper = PinScrapper(logger, ["Gato", "Bolo"], None, 1, runtime=runtime, cache=cache, cria_navegador=cria_navegador)
+    dict_links,lista_pendentes = pinscrapper._separa_prompts()
+    assert lista_pendentes == ["Bolo"]
+    c = pinscrapper._cria_crawler(CrawlerFalso, lista_pendentes)
+    assert c.driver is pinscrapper.driver
+    assert lista_navegadores == [c.driver]
+
+    cache.fecha()
+    runtime.encerra()
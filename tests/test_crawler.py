@@ -9,6 +9,19 @@ Este script verifica:
 
 - Captura de tags '<a>' de cards da pagina retornada de pesquisa.
 
+- Retirada dos pins das respostas JSON da pesquisa.
+
+- Escolha do link de imagem dos cards da grade de pesquisa.
+
+- Paginação da API de pesquisa pelo 'CrawlerAPIPinterest', também pela sessão do 'RuntimeHTTP', e o uso do crawler reserva
+  quando a API falha.
+
+- Entrega dos links pelo iterador assíncrono do 'CrawlerPlaywrightPinterest', com várias páginas ao mesmo tempo.
+
+- Limites de cada prompt (tempo, rolamentos e estagnação) e o motivo de encerramento registrado.
+
+- Troca do navegador degradado pelo 'VigiaNavegador' no meio do prompt, sem repetir os pins ja coletados.
+
 """
 
 
@@ -21,8 +34,19 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
 
+import asyncio
+import json
 import time
 
+import crawler
+import navegador
+import pytest
+from selenium.common.exceptions import WebDriverException, NoSuchElementException, TimeoutException
+from crawler import pins_da_resposta, link_imagem_grade, motivo_limite, CrawlerAPIPinterest, CrawlerPlaywrightPinterest
+from relatorio import RelatorioExecucao
+from runtime import RuntimeHTTP
+from bench import PinterestFalso
+
 
 
 #Testes
@@ -136,3 +160,274 @@ def test_verifica_captura_pins(driver:WebDriver) -> None:
     assert len(lista_pins[0:max_img]) == max_img
 
 
+def test_pins_da_resposta() -> None:
+
+    ### Variáveis ###
+
+    #Resposta JSON da pesquisa, com um pin completo, um anúncio e um pin sem imagens
+    corpo = json.dumps({"resource_response":{"data":{"results":[
+        {"id":"111","type":"pin","images":{"236x":{"url":"https://i.pinimg.com/236x/a.jpg"},"736x":{"url":"https://i.pinimg.com/736x/a.jpg"}}},
+        {"id":"222","type":"story"},
+        {"id":"333","type":"pin","images":{}}]}}})
+
+    ### Código ###
+
+    assert pins_da_resposta(corpo) == {"111":["https://i.pinimg.com/736x/a.jpg","https://i.pinimg.com/236x/a.jpg"]}
+    assert pins_da_resposta("<html></html>") == {}
+    assert pins_da_resposta(json.dumps({"resource_response":{"data":[]}})) == {}
+
+
+def test_link_imagem_grade() -> None:
+
+    ### Variáveis ###
+
+    #Atributos da imagem de um card, com a miniatura no 'src' e os outros tamanhos no 'srcset'
+    src = "https://i.pinimg.com/236x/a.jpg"
+    srcset = "https://i.pinimg.com/236x/a.jpg 1x, https://i.pinimg.com/474x/a.jpg 2x, https://i.pinimg.com/736x/a.jpg 3x, https://i.pinimg.com/originals/a.jpg 4x"
+
+    ### Código ###
+
+    assert link_imagem_grade(src,srcset) == "https://i.pinimg.com/736x/a.jpg"
+    assert link_imagem_grade("https://i.pinimg.com/originals/a.jpg","") == "https://i.pinimg.com/originals/a.jpg"
+    assert link_imagem_grade(src,"https://i.pinimg.com/474x/a.jpg 2x") is None
+
+
+def test_crawler_api(logger) -> None:
+
+    ### Variáveis ###
+
+    #Servidor local imitando o Pinterest
+    servidor = PinterestFalso(logger, pins_por_prompt=60, lote=25)
+
+    #Links entregues ao 'callback_link'
+    lista_enviados = []
+
+    ### Código ###
+
+    servidor.inicia()
+    try:
+        c = CrawlerAPIPinterest(None, logger, ["Gato","Cachorro"], url_base=servidor.url, fallback=None)
+        dict_links = c.bot_crawler(40, callback_link=lambda prompt,link: lista_enviados.append(link))
+    finally:
+        servidor.encerra()
+
+    assert [len(dict_links[prompt]) for prompt in ("Gato","Cachorro")] == [40,40]
+    assert len(set(lista_enviados)) == 80
+    assert all(link.split("/")[-2] in c.imagens for link in lista_enviados)
+    assert servidor.contadores["api"] == 4 and servidor.contadores["paginas"] == 0
+    assert c.motivos == {"Gato":"completo", "Cachorro":"completo"}
+
+
+
+def test_crawler_api_runtime(logger) -> None:
+
+    ### Variáveis ###
+
+    #Servidor local imitando o Pinterest
+    servidor = PinterestFalso(logger, pins_por_prompt=60, lote=25)
+
+    #Runtime compartilhado, como o do PinScrapper
+    runtime = RuntimeHTTP(logger, limite_por_host=2)
+
+    ### Código ###
+
+    async def pipeline():
+        #Como no modo 'streaming': o crawler roda no loop do 'runtime', e entrega os links em uma pipeline pequena e cheia
+        fila = asyncio.Queue(maxsize=1)
+        lista_recebidos = []
+
+        async def consome():
+            while (item := await fila.get()) is not None:
+                lista_recebidos.append(item)
+
+        async def envia_link(prompt, link):
+            await fila.put((prompt,link))
+
+        c = CrawlerAPIPinterest(None, logger, ["Gato","Cachorro"], url_base=servidor.url, fallback=None, runtime=runtime)
+        tarefa = asyncio.create_task(consome())
+        dict_links = await asyncio.wait_for(c.bot_crawler_async(30, envia_link), timeout=10)
+        await fila.put(None)
+        await tarefa
+        assert len(lista_recebidos) == 60
+        return dict_links
+
+    servidor.inicia()
+    try:
+        c = CrawlerAPIPinterest(None, logger, ["Gato"], url_base=servidor.url, fallback=None, runtime=runtime)
+        assert len(c.bot_crawler(30)["Gato"]) == 30
+        assert [len(lista) for lista in runtime.executa(pipeline()).values()] == [30,30]
+    finally:
+        runtime.encerra()
+        servidor.encerra()
+
+    assert servidor.contadores["api"] == 6
+
+def test_motivo_limite() -> None:
+
+    ### Código ###
+
+    assert motivo_limite(10, 5, 2, prazo_prompt=300, max_rolamentos=None, max_estagnacao=8) is None
+    assert motivo_limite(301, 5, 2, prazo_prompt=300) == "prazo"
+    assert motivo_limite(10, 20, 2, prazo_prompt=300, max_rolamentos=20) == "rolamentos"
+    assert motivo_limite(10, 20, 8, prazo_prompt=300, max_estagnacao=8) == "estagnado"
+    assert motivo_limite(10_000, 10_000, 10_000, prazo_prompt=None, max_rolamentos=None, max_estagnacao=None) is None
+
+
+def test_crawler_api_limite_rolamentos(logger) -> None:
+
+    ### Variáveis ###
+
+    #Servidor local imitando o Pinterest, com mais pins do que o limite permite coletar
+    servidor = PinterestFalso(logger, pins_por_prompt=200, lote=25)
+
+    #Relatório da execução
+    relatorio = RelatorioExecucao(logger)
+
+    ### Código ###
+
+    servidor.inicia()
+    try:
+        c = CrawlerAPIPinterest(None, logger, ["Gato"], relatorio=relatorio, url_base=servidor.url, fallback=None, max_rolamentos=1)
+        dict_links = c.bot_crawler(100)
+    finally:
+        servidor.encerra()
+
+    #Primeira página e mais um rolamento. O prompt fica com os pins coletados até o limite
+    assert len(dict_links["Gato"]) == 50
+    assert c.motivos == {"Gato":"rolamentos"}
+    assert relatorio.para_dict()["prompts"]["Gato"]["motivo"] == "rolamentos"
+
+
+def test_crawler_api_fallback(logger, monkeypatch) -> None:
+
+    ### Variáveis ###
+
+    #Prompts recebidos pelo crawler reserva
+    lista_reserva = []
+
+    ### Código ###
+
+    class CrawlerReserva:
+        def __init__(self, driver, logger, lista_prompt, **kwargs):
+            lista_reserva.extend(lista_prompt)
+        def bot_crawler(self, max_img, callback_link=None, callback_prompt=None):
+            return {prompt:["reserva"] for prompt in lista_reserva}
+
+    monkeypatch.setattr(crawler, "ESPERA_API", 0)
+    c = CrawlerAPIPinterest(object(), logger, ["Gato"], encerra_driver=False, url_base="http://127.0.0.1:9", fallback=CrawlerReserva)
+    assert c.bot_crawler(10) == {"Gato":["reserva"]}
+    assert lista_reserva == ["Gato"]
+
+
+def test_crawler_playwright_links_pin(logger) -> None:
+
+    ### Variáveis ###
+
+    #Páginas abertas ao mesmo tempo, e o máximo observado
+    abertas = [0, 0]
+
+    ### Código ###
+
+    #Navegador falso, com a mesma interface assíncrona do Playwright. Cada página revela 5 pins por rolamento, até 12
+    class Pagina:
+        def __init__(self):
+            self.lotes = None
+        async def goto(self, url, wait_until=None):
+            self.lotes = [[f"{url}#{n}/pin/{i}/" for i in range(n, min(n+5,12))] for n in range(0,12,5)]
+        async def wait_for_selector(self, seletor, timeout=None):
+            pass
+        async def evaluate(self, script, valores):
+            await asyncio.sleep(0.01)
+            return None if "scrollBy" in script else (self.lotes.pop(0) if self.lotes else [])
+        async def close(self):
+            abertas[0] -= 1
+
+    class Contexto:
+        async def route(self, padrao, funcao):
+            pass
+        async def new_page(self):
+            abertas[0] += 1
+            abertas[1] = max(abertas)
+            return Pagina()
+        async def close(self):
+            pass
+
+    class Navegador:
+        async def new_context(self):
+            return Contexto()
+        async def close(self):
+            pass
+
+    async def coleta(max_img):
+        c = CrawlerPlaywrightPinterest(Navegador(), logger, ["Gato","Cachorro","Bolo"], paginas=2, prazo_rolamento=0.05, observacoes_fim=2)
+        return [item async for item in c.links_pin(max_img)]
+
+    lista_itens = asyncio.run(coleta(50))
+    assert {prompt:sum(1 for p,_ in lista_itens if p == prompt) for prompt in ("Gato","Cachorro","Bolo")} == {"Gato":12,"Cachorro":12,"Bolo":12}
+    assert abertas == [0, 2]
+    assert len(asyncio.run(coleta(3))) == 9
+
+
+def test_crawler_vigia_reinicio(logger, monkeypatch) -> None:
+
+    ### Código ###
+
+    #Navegador falso com uma grade infinita, revelando 5 pins por rolamento. Depois de 'falha' pins, o navegador
+    #cai ('WebDriverException' em qualquer comando) ou, com 'erro_pagina', a página para de carregar e não tem nenhuma das
+    #interrupções conhecidas, então o 'verifica_interrupcao' levanta 'NoSuchElementException' com o navegador respondendo.
+    #Um navegador encerrado para de responder
+    class DriverGrade:
+        def __init__(self, falha=None, erro_pagina=False):
+            self.n = 0
+            self.novos = []
+            self.falha = falha
+            self.erro_pagina = erro_pagina
+            self.encerrado = False
+        def get(self, url):
+            pass
+        def find_element(self, *args):
+            if self.erro_pagina and self.n >= self.falha:
+                raise NoSuchElementException("Bloco de login não encontrado")
+            return object()
+        def find_elements(self, *args):
+            return [] if self.erro_pagina and self.n >= self.falha else [1]
+        def execute_script(self, script, *args):
+            if self.encerrado:
+                raise WebDriverException("O navegador foi encerrado")
+            if script == "return 1;" and self.erro_pagina:
+                return 1
+            if self.falha is not None and self.n >= self.falha:
+                raise TimeoutException("A página parou de carregar") if self.erro_pagina else WebDriverException("O navegador caiu")
+            if script == crawler.SCRIPT_ROLAMENTO:
+                self.novos += [f"https://br.pinterest.com/pin/{i}/" for i in range(self.n, self.n+5)]
+                self.n += 5
+                return None
+            if self.n == 0:
+                self.novos, self.n = [f"https://br.pinterest.com/pin/{i}/" for i in range(5)], 5
+            lista, self.novos = self.novos, []
+            return lista
+        def quit(self):
+            self.encerrado = True
+
+    monkeypatch.setattr(crawler, "INTERVALO_VERIFICACAO", 0)
+    monkeypatch.setattr(navegador, "cria_driver", lambda monitor=False, **opcoes: DriverGrade())
+
+    lista_links = []
+    relatorio = RelatorioExecucao(logger)
+    vigia = navegador.VigiaNavegador(logger, limite_rss=None, intervalo=0)
+    caido = DriverGrade(falha=12)
+    c = crawler.CrawlerPinterest(caido, logger, ["Gato"], encerra_driver=False, relatorio=relatorio, prazo_rolamento=0.05, vigia=vigia)
+    dict_links = c.bot_crawler(30, lambda prompt,link: lista_links.append(link))
+    assert len(dict_links["Gato"]) == 30 and lista_links == dict_links["Gato"]
+    assert vigia.reinicios == 1 and caido.encerrado and c.driver.encerrado
+    assert relatorio.para_dict()["prompts"]["Gato"]["reinicios"] == 1
+
+    #Uma página desconhecida não é culpa do navegador, e chega ao chamador sem nenhuma troca, mesmo com o navegador
+    #sendo encerrado pelo crawler no fim ('encerra_driver')
+    for encerra_driver in (False, True):
+        vigia = navegador.VigiaNavegador(logger, limite_rss=None, intervalo=0)
+        driver = DriverGrade(falha=12, erro_pagina=True)
+        c = crawler.CrawlerPinterest(driver, logger, ["Gato"], encerra_driver=encerra_driver, prazo_rolamento=0.05, vigia=vigia)
+        with pytest.raises(NoSuchElementException):
+            c.bot_crawler(30)
+        assert vigia.reinicios == 0 and driver.encerrado == encerra_driver
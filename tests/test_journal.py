@@ -0,0 +1,153 @@
+"""
+Testes para o módulo 'journal.py'.
+
+Este script verifica:
+
+- Registro e retomada de prompts ja pesquisados.
+
+- Registro dos links de imagem retirados e das imagens baixadas.
+
+- Descarte do progresso anterior quando a execução não é uma retomada.
+
+- Histórico permanente de pins baixados, utilizado pelo modo incremental.
+
+- Retomada de um prompt que foi encerrado por um limite do crawler, com um resultado parcial.
+
+"""
+
+
+from journal import JournalExecucao
+from crawler import MOTIVO_PRAZO, MOTIVO_FIM_PAGINA
+from PinScrapper import PinScrapper
+from runtime import RuntimeHTTP
+
+
+#Testes
+
+def test_retomando_prompt_pesquisado(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do journal
+    caminho = str(tmp_path / "journal.db")
+
+    #Links de pin de teste
+    lista_links = ["https://br.pinterest.com/pin/1/", "https://br.pinterest.com/pin/2/", "https://br.pinterest.com/pin/3/"]
+
+    ### Código ###
+
+    journal = JournalExecucao(logger, caminho)
+    journal.registra_crawl("Gato", lista_links, max_img=3)
+    journal.fecha()
+
+    journal = JournalExecucao(logger, caminho, retomar=True)
+    assert journal.links_crawled("Gato", max_img=3) == lista_links
+    assert journal.links_crawled("Gato", max_img=2) == lista_links[0:2]
+
+    #Pedindo mais imagens do que foi pesquisado, o prompt precisa ser pesquisado novamente
+    assert journal.links_crawled("Gato", max_img=10) is None
+    assert journal.links_crawled("Cachorro", max_img=3) is None
+    journal.fecha()
+
+
+def test_registrando_parse_e_download(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do journal
+    caminho = str(tmp_path / "journal.db")
+
+    ### Código ###
+
+    journal = JournalExecucao(logger, caminho)
+    journal.registra_crawl("Gato", ["pin1", "pin2"], max_img=2)
+    journal.registra_parse("Gato", "pin1", "img1.jpg")
+    journal.registra_parse("Gato", "pin2", "img2.jpg")
+    journal.registra_download("Gato", "img1.jpg")
+    journal.registra_falha("Gato", link_img="img2.jpg")
+
+    assert journal.imagens_parseadas() == {"pin1": "img1.jpg"}
+    assert journal.imagens_baixadas("Gato") == {"img1.jpg"}
+    journal.fecha()
+
+
+def test_descartando_progresso_sem_retomar(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do journal
+    caminho = str(tmp_path / "journal.db")
+
+    ### Código ###
+
+    journal = JournalExecucao(logger, caminho)
+    journal.registra_crawl("Gato", ["pin1"], max_img=1)
+    journal.fecha()
+
+    journal = JournalExecucao(logger, caminho)
+    assert journal.links_crawled("Gato", max_img=1) is None
+    journal.fecha()
+
+
+def test_historico_incremental(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do journal
+    caminho = str(tmp_path / "journal.db")
+
+    #Imagem salva no disco
+    arquivo = tmp_path / "img1.jpg"
+
+    ### Código ###
+
+    arquivo.write_bytes(b"imagem")
+
+    journal = JournalExecucao(logger, caminho)
+    journal.registra_crawl("Gato", ["https://br.pinterest.com/pin/111/", "https://br.pinterest.com/pin/222/"], max_img=2)
+    journal.registra_parse("Gato", "https://br.pinterest.com/pin/111/", "img1.jpg")
+    journal.registra_download("Gato", "img1.jpg", str(arquivo))
+    journal.fecha()
+
+    #O histórico sobrevive a uma nova execução sem '--resume'
+    journal = JournalExecucao(logger, caminho, incremental=True)
+    assert journal.pins_historico("Gato") == {"111"}
+    assert journal.pins_historico("Cachorro") == set()
+    assert journal.imagens_baixadas("Gato") == {"img1.jpg"}
+
+    #Imagens apagadas do disco voltam a ser baixadas
+    arquivo.unlink()
+    assert journal.pins_historico("Gato") == set()
+    assert journal.imagens_baixadas("Gato") == set()
+    journal.fecha()
+
+
+def test_retomando_prompt_encerrado_por_limite(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do journal
+    caminho = str(tmp_path / "journal.db")
+
+    #Runtime do PinScrapper
+    runtime = RuntimeHTTP(logger)
+
+    #Links de pin de teste
+    lista_links = ["https://br.pinterest.com/pin/1/", "https://br.pinterest.com/pin/2/"]
+
+    ### Código ###
+
+    journal = JournalExecucao(logger, caminho)
+    pinscrapper = PinScrapper(logger, ["Gato", "Cachorro"], None, 10, runtime=runtime, journal=journal)
+    pinscrapper.motivos_crawl.update({"Gato":MOTIVO_PRAZO, "Cachorro":MOTIVO_FIM_PAGINA})
+    pinscrapper._registra_crawl("Gato", lista_links)
+    pinscrapper._registra_crawl("Cachorro", lista_links)
+    journal.fecha()
+    runtime.encerra()
+
+    #O prompt encerrado pelo prazo ficou incompleto e precisa ser pesquisado de novo. O que chegou ao fim da página não
+    journal = JournalExecucao(logger, caminho, retomar=True)
+    assert journal.links_crawled("Gato", max_img=10) is None
+    assert journal.links_crawled("Gato", max_img=2) == lista_links
+    assert journal.links_crawled("Cachorro", max_img=10) == lista_links
+    journal.fecha()
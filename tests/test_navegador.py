@@ -0,0 +1,148 @@
+"""
+Testes para o módulo 'navegador.py'.
+
+Este script verifica:
+
+- Empréstimo e devolução dos navegadores do 'PoolDrivers'.
+
+- Substituição dos navegadores que pararam de responder, incluindo os que perderam o processo do 'chromedriver'.
+
+- Verificação da saúde do navegador pelo 'VigiaNavegador', e troca do navegador degradado.
+
+"""
+
+
+import navegador
+from navegador import PoolDrivers, VigiaNavegador, DEGRADADO_SEM_RESPOSTA, DEGRADADO_MEMORIA
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import MaxRetryError
+
+
+#Classes auxiliares
+
+class DriverFalso:
+
+    """
+    Navegador falso, que responde aos comandos enquanto 'ativo' for 'True'.
+    """
+
+    def __init__(self, nome:str):
+
+        self.nome = nome
+        self.ativo = True
+        self.encerrado = False
+
+    def execute_script(self, script:str):
+        if not self.ativo:
+            raise WebDriverException("Navegador parou de responder")
+        return 1
+
+    def quit(self):
+        self.encerrado = True
+
+
+class DriverSemChromedriver(DriverFalso):
+
+    """
+    Navegador falso cujo processo do 'chromedriver' morreu. Todos os comandos falham com um erro de conexão do 'urllib3'.
+    """
+
+    def execute_script(self, script:str):
+        raise MaxRetryError(None, "http://localhost:9515/session", "Connection refused")
+
+    def quit(self):
+        raise MaxRetryError(None, "http://localhost:9515/session", "Connection refused")
+
+
+#Testes
+
+def test_empresta_e_devolve(logger) -> None:
+
+    ### Variáveis ###
+
+    #Navegadores iniciais do pool
+    lista_drivers = [DriverFalso("a"), DriverFalso("b")]
+
+    ### Código ###
+
+    pool = PoolDrivers(logger, tamanho=2, drivers=lista_drivers)
+    with pool.empresta() as primeiro:
+        with pool.empresta() as segundo:
+            assert {primeiro.nome, segundo.nome} == {"a", "b"}
+
+    with pool.empresta() as driver:
+        assert driver in lista_drivers
+
+    pool.encerra()
+    assert all(driver.encerrado for driver in lista_drivers)
+
+
+def test_substitui_driver_inativo(logger, monkeypatch) -> None:
+
+    ### Variáveis ###
+
+    #Navegador que vai parar de responder
+    morto = DriverFalso("morto")
+
+    ### Código ###
+
+    monkeypatch.setattr(navegador, "cria_driver", lambda monitor=False, **opcoes: DriverFalso("novo"))
+
+    pool = PoolDrivers(logger, tamanho=1, drivers=[morto])
+    morto.ativo = False
+    with pool.empresta() as driver:
+        assert driver.nome == "novo"
+    assert morto.encerrado
+
+    with pool.empresta() as driver:
+        assert driver.nome == "novo"
+
+
+
+def test_substitui_driver_sem_chromedriver(logger, monkeypatch) -> None:
+
+    ### Variáveis ###
+
+    #Navegador que perdeu o 'chromedriver'
+    morto = DriverSemChromedriver("morto")
+
+    ### Código ###
+
+    monkeypatch.setattr(navegador, "cria_driver", lambda monitor=False, **opcoes: DriverFalso("novo"))
+
+    assert not navegador.driver_ativo(morto)
+
+    pool = PoolDrivers(logger, tamanho=1, drivers=[morto])
+    with pool.empresta() as driver:
+        assert driver.nome == "novo"
+
+    pool = PoolDrivers(logger, tamanho=1, drivers=[DriverSemChromedriver("outro")])
+    pool.encerra()
+
+def test_vigia_navegador(logger, monkeypatch) -> None:
+
+    ### Variáveis ###
+
+    #Navegador vigiado
+    driver = DriverFalso("vigiado")
+
+    ### Código ###
+
+    monkeypatch.setattr(navegador, "cria_driver", lambda monitor=False, **opcoes: DriverFalso("novo"))
+    monkeypatch.setattr(navegador, "rss_navegador", lambda driver: 4096.0)
+
+    #Dentro do intervalo, o navegador não é verificado
+    vigia = VigiaNavegador(logger, limite_rss=None, intervalo=3600)
+    driver.ativo = False
+    assert vigia.verifica(driver) is None
+
+    vigia = VigiaNavegador(logger, limite_rss=None, intervalo=0)
+    assert vigia.verifica(driver) == DEGRADADO_SEM_RESPOSTA
+
+    driver.ativo = True
+    assert vigia.verifica(driver) is None
+    vigia.limite_rss = 2048.0
+    assert vigia.verifica(driver) == DEGRADADO_MEMORIA
+
+    assert vigia.recicla(driver).nome == "novo"
+    assert driver.encerrado and vigia.reinicios == 1
@@ -0,0 +1,69 @@
+"""
+Testes para o módulo 'rastreamento.py'.
+
+Este script verifica:
+
+- Aninhamento dos 'spans' e status de erro.
+
+- Arquivo JSON exportado no formato OTLP.
+
+"""
+
+
+import json
+import pytest
+from rastreamento import Rastreador, span, STATUS_OK, STATUS_ERRO
+
+
+#Testes
+
+def test_spans_aninhados_e_erro(logger) -> None:
+
+    ### Variáveis ###
+
+    #'Spans' registrados, pelo nome
+    dict_spans = {}
+
+    ### Código ###
+
+    rastreador = Rastreador(logger)
+    with span(rastreador, "pinscrapper.parse"):
+        with span(rastreador, "parser.requisicao", url="https://br.pinterest.com/pin/1/") as atributos:
+            atributos["http.status_code"] = 404
+        with pytest.raises(ValueError):
+            with span(rastreador, "parser.html"):
+                raise ValueError("HTML inválido")
+
+    dict_spans = {s["name"]:s for s in rastreador.spans()}
+    assert dict_spans["parser.requisicao"]["parentSpanId"] == dict_spans["pinscrapper.parse"]["spanId"]
+    assert dict_spans["parser.html"]["parentSpanId"] == dict_spans["pinscrapper.parse"]["spanId"]
+    assert dict_spans["pinscrapper.parse"]["parentSpanId"] == ""
+    assert dict_spans["parser.requisicao"]["status"]["code"] == STATUS_ERRO
+    assert dict_spans["parser.html"]["status"]["code"] == STATUS_ERRO
+    assert dict_spans["pinscrapper.parse"]["status"]["code"] == STATUS_OK
+
+
+def test_exporta_otlp(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo exportado
+    caminho = tmp_path / "trace.json"
+
+    ### Código ###
+
+    #Sem rastreador, o 'span' não registra nada mas ainda devolve os atributos
+    with span(None, "downloader.escrita", bytes=10) as atributos:
+        assert atributos == {"bytes":10}
+
+    rastreador = Rastreador(logger)
+    with span(rastreador, "downloader.escrita", prompt="Gato", bytes=10):
+        pass
+    rastreador.exporta(str(caminho))
+
+    dados = json.loads(caminho.read_text(encoding="utf-8"))
+    lista_spans = dados["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(lista_spans) == 1
+    assert lista_spans[0]["traceId"] == rastreador.trace_id
+    assert {"key":"bytes", "value":{"intValue":"10"}} in lista_spans[0]["attributes"]
+    assert int(lista_spans[0]["endTimeUnixNano"]) >= int(lista_spans[0]["startTimeUnixNano"])
@@ -0,0 +1,81 @@
+"""
+Testes para o módulo 'relatorio.py'.
+
+Este script verifica:
+
+- Contagem de requisições, novas tentativas e falhas por 'host'.
+
+- Métricas do crawler por prompt e junção de relatórios de outros processos.
+
+- Arquivo JSON gerado pelo relatório.
+
+"""
+
+
+import json
+from relatorio import RelatorioExecucao
+
+
+#Testes
+
+def test_requisicoes_por_host(logger) -> None:
+
+    ### Código ###
+
+    relatorio = RelatorioExecucao(logger)
+    relatorio.registra_requisicao("https://br.pinterest.com/pin/1/", 1)
+    relatorio.registra_requisicao("https://br.pinterest.com/pin/1/", 2)
+    relatorio.registra_falha("https://br.pinterest.com/pin/1/")
+    relatorio.registra_requisicao("https://i.pinimg.com/originals/a.jpg", 1)
+
+    hosts = relatorio.para_dict()["hosts"]
+    assert hosts["br.pinterest.com"] == {"requisicoes":2, "retentativas":1, "falhas":1}
+    assert hosts["i.pinimg.com"] == {"requisicoes":1, "retentativas":0, "falhas":0}
+
+
+def test_prompts_e_incorpora(logger) -> None:
+
+    ### Variáveis ###
+
+    #Relatório de um outro processo
+    outro = None
+
+    ### Código ###
+
+    relatorio = RelatorioExecucao(logger)
+    relatorio.registra_rolamento("Gato")
+    relatorio.registra_espera("Gato", 4)
+    relatorio.registra_pins("Gato", 10)
+
+    outro = RelatorioExecucao(logger)
+    outro.registra_rolamento("Cachorro")
+    outro.registra_pins("Cachorro", 3)
+    outro.registra_requisicao("https://br.pinterest.com/search/pins/?q=Cachorro", 1)
+    relatorio.incorpora(outro.para_dict())
+
+    dados = relatorio.para_dict()
+    assert dados["prompts"]["Gato"] == {"pins":10, "rolamentos":1, "tempo_espera":4.0}
+    assert dados["prompts"]["Cachorro"] == {"pins":3, "rolamentos":1, "tempo_espera":0.0}
+    assert dados["hosts"]["br.pinterest.com"]["requisicoes"] == 1
+
+
+def test_salva_json(tmp_path, logger) -> None:
+
+    ### Variáveis ###
+
+    #Caminho do arquivo do relatório
+    caminho = tmp_path / "relatorio.json"
+
+    ### Código ###
+
+    relatorio = RelatorioExecucao(logger)
+    with relatorio.etapa("download"):
+        relatorio.registra_imagem(2_000_000)
+        relatorio.registra_imagem(1_000_000)
+    relatorio.salva(str(caminho))
+
+    dados = json.loads(caminho.read_text(encoding="utf-8"))
+    assert dados["download"]["imagens"] == 2
+    assert dados["download"]["bytes"] == 3_000_000
+    assert "download" in dados["etapas"]
+    assert dados["download"]["mb_por_segundo"] > 0